@@ -0,0 +1,109 @@
+# Filename: availability_index.py
+# Description: Faculty availability as bitmasks over the materialized time slots
+
+from scheduler.scheduler import get_faculty_availability
+
+
+class AvailabilityIndex:
+    """
+    Which faculty can teach in which time slot, as one int bitmask each.
+
+    Bit i of a faculty member's mask is set when slot i of a SlotTable lies
+    entirely within their available times, exactly as the solver decides
+    it (TimeSlot.in_time_ranges). Slots share a small set of distinct
+    meetings, so each member is checked per meeting rather than per slot.
+
+    Attributes:
+        table (SlotTable): Slots the masks are over
+    """
+
+    def __init__(self, table, faculty: list):
+        """
+        Parameters:
+            table (SlotTable): Materialized time slots
+            faculty (list[FacultyConfig]): Faculty to index
+        """
+        self.table = table
+        self._faculty: dict[str, int] = {}
+        for member in faculty:
+            self.update(member)
+
+    def update(self, member) -> None:
+        """
+        Index (or re-index) one faculty member's availability.
+
+        Parameters:
+            member (FacultyConfig): Faculty member
+        """
+        ranges: dict[int, list[tuple[int, int]]] = {}
+        for time in get_faculty_availability(member):
+            start = time.start.timepoint
+            ranges.setdefault(time.day.value, []).append(
+                (start, start + time.duration.duration)
+            )
+        blocked = 0
+        for (day, start, stop), mask in self.table.by_meeting.items():
+            if not any(
+                low <= start and stop <= high for low, high in ranges.get(day, ())
+            ):
+                blocked |= mask
+        self._faculty[member.name] = self.table.all_slots & ~blocked
+
+    def remove(self, name: str) -> None:
+        """
+        Drop a faculty member from the index.
+        """
+        self._faculty.pop(name, None)
+
+    def available(self, name: str) -> int:
+        """
+        Return the mask of slots a faculty member can teach (0 if unknown).
+        """
+        return self._faculty.get(name, 0)
+
+    def can_teach(self, name: str, slot: int) -> bool:
+        """
+        Return True if a faculty member is free for the whole of slot number slot.
+        """
+        return bool(self.available(name) >> slot & 1)
+
+    def free_at(self, slot: int) -> list[str]:
+        """
+        Return the faculty free for the whole of a slot, in index order.
+
+        Parameters:
+            slot (int): Slot number (position in slots)
+
+        Returns:
+            list[str]: Faculty names
+        """
+        return [name for name, mask in self._faculty.items() if mask >> slot & 1]
+
+    def slots_for(self, name: str, credits: int | None = None) -> list:
+        """
+        Return the slots a faculty member can teach.
+
+        Parameters:
+            name (str): Faculty name
+            credits (int | None): Only slots of this credit level
+
+        Returns:
+            list[TimeSlot]: Fitting slots, in slot order
+        """
+        mask = self.available(name)
+        if credits is not None:
+            mask &= self.table.credit_masks.get(credits, 0)
+        return self.table.slots_of(mask)
+
+    def fit_counts(self, name: str) -> dict[int, tuple[int, int]]:
+        """
+        Count the slots of each credit level a faculty member can teach.
+
+        Returns:
+            dict[int, tuple[int, int]]: Credits -> (fitting, total)
+        """
+        mask = self.available(name)
+        return {
+            value: ((mask & level).bit_count(), level.bit_count())
+            for value, level in self.table.credit_masks.items()
+        }
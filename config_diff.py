@@ -0,0 +1,255 @@
+# Filename: config_diff.py
+# Description: Entity-level diff between two configurations
+
+from collections import Counter
+
+# Field identifying an entity within each keyed section
+ENTITY_KEYS = {"courses": "course_id", "faculty": "name"}
+
+
+def group_entities(entities, key_field: str) -> dict[str, list]:
+    """
+    Group entities by key, keeping their order (courses can have several
+    sections with the same course_id).
+    """
+    groups: dict[str, list] = {}
+    for entity in entities:
+        groups.setdefault(getattr(entity, key_field), []).append(entity)
+    return groups
+
+
+def _dump(value):
+    return value.model_dump(mode="json") if hasattr(value, "model_dump") else value
+
+
+def _field_changes(old, new, prefix: str = "") -> dict[str, tuple]:
+    old_data = _dump(old)
+    new_data = _dump(new)
+    return {
+        prefix + field: (old_data.get(field), new_data.get(field))
+        for field in old_data.keys() | new_data.keys()
+        if old_data.get(field) != new_data.get(field)
+    }
+
+
+def _diff_values(old: list, new: list) -> dict:
+    if old == new:
+        return {}
+    old_counts = Counter(_freeze(v) for v in old)
+    new_counts = Counter(_freeze(v) for v in new)
+    added = new_counts - old_counts
+    removed = old_counts - new_counts
+    result = {}
+    if added:
+        result["added"] = [_thaw(v) for v in added.elements()]
+    if removed:
+        result["removed"] = [_thaw(v) for v in removed.elements()]
+    if not result:
+        result["reordered"] = True
+    return result
+
+
+def _freeze(value):
+    value = _dump(value)
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ("__list__",) + tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, tuple) and value and value[0] == "__dict__":
+        return {k: _thaw(v) for k, v in value[1:]}
+    if isinstance(value, tuple) and value and value[0] == "__list__":
+        return [_thaw(v) for v in value[1:]]
+    return value
+
+
+def diff_entities(old: list, new: list, key_field: str) -> dict:
+    """
+    Diff a keyed section (courses by course_id, faculty by name).
+
+    All sections of a course share one key and are compared together.
+    Unchanged entities cost one equality check each, so the diff is linear
+    in the number of entities.
+
+    Parameters:
+        old (list): Entities before
+        new (list): Entities after
+        key_field (str): Attribute identifying an entity
+
+    Returns:
+        dict: 'added' and 'removed' key lists and 'modified', mapping each
+            changed key to {field: (old, new)}. Fields of multi-section
+            courses are prefixed with the section index ('[1].credits');
+            a change in the number of sections is reported as 'sections'.
+            Empty keys are omitted.
+    """
+    old_groups = group_entities(old, key_field)
+    new_groups = group_entities(new, key_field)
+    result: dict = {}
+
+    added = [key for key in new_groups if key not in old_groups]
+    removed = [key for key in old_groups if key not in new_groups]
+    modified = {}
+    for key, new_group in new_groups.items():
+        old_group = old_groups.get(key)
+        if old_group is None or old_group == new_group:
+            continue
+        if len(old_group) == 1 and len(new_group) == 1:
+            modified[key] = _field_changes(old_group[0], new_group[0])
+            continue
+        changes = {}
+        if len(old_group) != len(new_group):
+            changes["sections"] = (len(old_group), len(new_group))
+        for index, (before, after) in enumerate(zip(old_group, new_group)):
+            if before != after:
+                changes.update(_field_changes(before, after, f"[{index}]."))
+        modified[key] = changes
+
+    if added:
+        result["added"] = added
+    if removed:
+        result["removed"] = removed
+    if modified:
+        result["modified"] = modified
+    return result
+
+
+def diff_time_slots(old, new) -> dict:
+    """
+    Diff two TimeSlotConfig objects.
+
+    Returns:
+        dict: 'times' mapping each changed day to added/removed blocks,
+            'classes' with added/removed class patterns, and 'modified'
+            for any other changed field. Empty keys are omitted.
+    """
+    if old == new:
+        return {}
+    result: dict = {}
+    times = {}
+    for day in old.times.keys() | new.times.keys():
+        change = _diff_values(old.times.get(day, []), new.times.get(day, []))
+        if change:
+            times[str(day)] = change
+    if times:
+        result["times"] = times
+    classes = _diff_values(old.classes, new.classes)
+    if classes:
+        result["classes"] = classes
+    modified = {
+        field: changes
+        for field, changes in _field_changes(old, new).items()
+        if field not in ("times", "classes")
+    }
+    if modified:
+        result["modified"] = modified
+    return result
+
+
+def diff_configs(old, new) -> dict:
+    """
+    Compute the entity-level differences between two CombinedConfigs.
+
+    Parameters:
+        old (CombinedConfig): Configuration before (e.g. the file on disk)
+        new (CombinedConfig): Configuration after (e.g. the in-memory one)
+
+    Returns:
+        dict: Only the parts that differ, each present only if changed:
+            'rooms'/'labs': {'added', 'removed'} value lists (or
+                {'reordered': True});
+            'courses'/'faculty': see diff_entities();
+            'time_slot_config': see diff_time_slots();
+            'limit'/'optimizer_flags': (old, new).
+            An empty dict means the configurations are equal.
+    """
+    result: dict = {}
+    for section in ("rooms", "labs"):
+        change = _diff_values(
+            getattr(old.config, section), getattr(new.config, section)
+        )
+        if change:
+            result[section] = change
+    for section, key_field in ENTITY_KEYS.items():
+        change = diff_entities(
+            getattr(old.config, section), getattr(new.config, section), key_field
+        )
+        if change:
+            result[section] = change
+    time_slots = diff_time_slots(old.time_slot_config, new.time_slot_config)
+    if time_slots:
+        result["time_slot_config"] = time_slots
+    for name in ("limit", "optimizer_flags"):
+        before = _dump(getattr(old, name))
+        after = _dump(getattr(new, name))
+        if before != after:
+            result[name] = (before, after)
+    return result
+
+
+def changed_keys(diff: dict) -> dict[str, set | None]:
+    """
+    Reduce a diff to the changed sections and entity keys, in the format
+    DirtyState uses (None for a whole section).
+
+    Parameters:
+        diff (dict): Result of diff_configs()
+
+    Returns:
+        dict[str, set | None]: Section -> changed keys
+    """
+    keys: dict[str, set | None] = {}
+    for section, change in diff.items():
+        if section in ENTITY_KEYS:
+            keys[section] = (
+                set(change.get("added", ()))
+                | set(change.get("removed", ()))
+                | set(change.get("modified", {}))
+            )
+        else:
+            keys[section] = None
+    return keys
+
+
+def summarize_diff(diff: dict) -> list[str]:
+    """
+    Describe a diff as short human-readable lines, e.g. for a pending
+    changes panel.
+
+    Parameters:
+        diff (dict): Result of diff_configs()
+
+    Returns:
+        list[str]: One line per change
+    """
+    lines = []
+    for section in ("rooms", "labs"):
+        change = diff.get(section, {})
+        for value in change.get("added", []):
+            lines.append(f"Added {section[:-1]} {value}")
+        for value in change.get("removed", []):
+            lines.append(f"Removed {section[:-1]} {value}")
+        if change.get("reordered"):
+            lines.append(f"Reordered {section}")
+    for section, label in (("courses", "course"), ("faculty", "faculty")):
+        change = diff.get(section, {})
+        for key in change.get("added", []):
+            lines.append(f"Added {label} {key}")
+        for key in change.get("removed", []):
+            lines.append(f"Removed {label} {key}")
+        for key, fields in change.get("modified", {}).items():
+            lines.append(f"Modified {label} {key}: {', '.join(sorted(fields))}")
+    time_slots = diff.get("time_slot_config", {})
+    for day in sorted(time_slots.get("times", {})):
+        lines.append(f"Changed time blocks on {day}")
+    if "classes" in time_slots:
+        lines.append("Changed class patterns")
+    for field in sorted(time_slots.get("modified", {})):
+        lines.append(f"Changed time slot setting {field}")
+    for name in ("limit", "optimizer_flags"):
+        if name in diff:
+            lines.append(f"Changed {name}: {diff[name][0]} -> {diff[name][1]}")
+    return lines
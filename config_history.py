@@ -0,0 +1,388 @@
+# Filename: config_history.py
+# Description: Undo/redo history of the in-memory config with shared snapshots
+
+import pickle
+
+# Default memory budget for the history, in bytes
+DEFAULT_BUDGET = 16 * 1024 * 1024
+
+# Eviction policies once the budget is exceeded:
+#   'oldest' drops the oldest steps,
+#   'thin' drops every other step in the older half, so old states stay
+#   reachable at a coarser granularity
+EVICTION_POLICIES = ("oldest", "thin")
+
+# Field identifying an entity within each keyed section
+ENTITY_KEYS = {"courses": "course_id", "faculty": "name"}
+
+# Estimated in-memory size of a copied object per byte of its pickle
+_BYTES_PER_PICKLE_BYTE = 4
+_TUPLE_SLOT_BYTES = 8
+
+
+class _Snapshot:
+    """
+    One history state. Sections are tuples of frozen entity copies that are
+    shared with neighbouring snapshots wherever nothing changed.
+    """
+
+    __slots__ = ("cost", "introduced", "sections", "time_slots")
+
+    def __init__(self, sections: dict[str, tuple], time_slots, introduced, cost):
+        self.sections = sections
+        self.time_slots = time_slots
+        # id -> size of every frozen object first created for this snapshot
+        self.introduced: dict[int, int] = introduced
+        self.cost = cost
+
+
+def _copy(value) -> tuple[object, int]:
+    """
+    Return an independent copy of a model (or list of models) and its
+    estimated size. A pickle round trip is faster than model_copy(deep=True).
+    """
+    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.loads(blob), len(blob) * _BYTES_PER_PICKLE_BYTE
+
+
+class ConfigHistory:
+    """
+    Undo/redo history for a ConfigModel.
+
+    A snapshot is taken at each checkpoint (one per user action). Only the
+    entities changed since the previous checkpoint are copied; everything
+    else, including whole unchanged sections, is shared with the previous
+    snapshot. Undoing or redoing any number of steps restores the target
+    snapshot directly, copying only the entities that differ from the live
+    config.
+
+    There is no limit on the number of steps; once the estimated memory
+    use exceeds the budget, steps are evicted according to the policy.
+
+    Attributes:
+        budget (int): Memory budget in bytes
+        eviction (str): 'oldest' or 'thin'
+    """
+
+    def __init__(self, budget: int = DEFAULT_BUDGET, eviction: str = "oldest"):
+        """
+        Parameters:
+            budget (int): Memory budget in bytes
+            eviction (str): 'oldest' or 'thin' (see EVICTION_POLICIES)
+
+        Raises:
+            ValueError: If the eviction policy is unknown
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction}")
+        self.budget = budget
+        self.eviction = eviction
+        self._snapshots: list[_Snapshot] = []
+        self._position = -1
+        self._noted: dict[str, set | None] = {}
+        # id(live entity) -> (live, frozen) for the entities of the current snapshot
+        self._frozen_of: dict[int, tuple] = {}
+        # id(frozen entity) -> live entity for the current snapshot
+        self._live_of: dict[int, object] = {}
+        self._cost = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def reset(self, config) -> None:
+        """
+        Forget all history and start from the given config.
+        """
+        self._snapshots = []
+        self._position = -1
+        self._noted = {}
+        self._frozen_of = {}
+        self._live_of = {}
+        self._cost = 0
+        self.checkpoint(config)
+
+    def note(self, section: str, key=None) -> None:
+        """
+        Record that a section, or one entity in it, changed in memory.
+        """
+        if section in self._noted and self._noted[section] is None:
+            return
+        if key is None:
+            self._noted[section] = None
+        else:
+            self._noted.setdefault(section, set()).add(key)
+
+    def checkpoint(self, config) -> bool:
+        """
+        Close the current step, snapshotting what changed since the last
+        checkpoint. Discards any redo steps if something changed.
+
+        Parameters:
+            config (CombinedConfig): The live configuration
+
+        Returns:
+            bool: True if a new step was recorded
+        """
+        previous = self._snapshots[self._position] if self._snapshots else None
+        noted, self._noted = self._noted, {}
+        sections: dict[str, tuple] = {}
+        introduced: dict[int, int] = {}
+        changed = previous is None
+
+        for section in ("rooms", "labs"):
+            live = getattr(config.config, section)
+            if previous is not None and (
+                section not in noted or previous.sections[section] == tuple(live)
+            ):
+                sections[section] = previous.sections[section]
+            else:
+                sections[section] = tuple(live)
+                introduced[id(sections[section])] = len(live) * _TUPLE_SLOT_BYTES + sum(
+                    len(v) for v in live
+                )
+                changed = True
+
+        for section, key_field in ENTITY_KEYS.items():
+            live = getattr(config.config, section)
+            if previous is not None and section not in noted:
+                sections[section] = previous.sections[section]
+                continue
+            if previous is None:
+                # Copy the whole section at once
+                frozen, size = _copy(list(live))
+                sections[section] = tuple(frozen)
+                for copy in frozen:
+                    introduced[id(copy)] = size // max(len(frozen), 1)
+                introduced[id(sections[section])] = len(frozen) * _TUPLE_SLOT_BYTES
+                continue
+            keys = noted.get(section)
+            frozen = []
+            section_changed = len(live) != len(previous.sections[section])
+            for entity in live:
+                known = self._frozen_of.get(id(entity))
+                copy = known[1] if known is not None and known[0] is entity else None
+                if copy is not None and (
+                    keys is not None
+                    and getattr(entity, key_field) not in keys
+                    or copy == entity
+                ):
+                    frozen.append(copy)
+                    continue
+                copy, size = _copy(entity)
+                introduced[id(copy)] = size
+                frozen.append(copy)
+                section_changed = True
+            if not section_changed:
+                section_changed = any(
+                    a is not b for a, b in zip(frozen, previous.sections[section])
+                )
+            if section_changed:
+                sections[section] = tuple(frozen)
+                introduced[id(sections[section])] = len(frozen) * _TUPLE_SLOT_BYTES
+                changed = True
+            else:
+                sections[section] = previous.sections[section]
+
+        time_slots = config.time_slot_config
+        if previous is not None and previous.time_slots == time_slots:
+            time_slots = previous.time_slots
+        else:
+            time_slots, size = _copy(time_slots)
+            introduced[id(time_slots)] = size
+            changed = True
+
+        if not changed:
+            return False
+
+        snapshot = _Snapshot(sections, time_slots, introduced, sum(introduced.values()))
+        for dropped in self._snapshots[self._position + 1 :]:
+            self._cost -= dropped.cost
+        del self._snapshots[self._position + 1 :]
+        self._snapshots.append(snapshot)
+        self._position = len(self._snapshots) - 1
+        self._cost += snapshot.cost
+        self._map_live(config, snapshot)
+        self._evict()
+        return True
+
+    def _map_live(self, config, snapshot: _Snapshot) -> None:
+        self._frozen_of = {}
+        self._live_of = {}
+        for section in ENTITY_KEYS:
+            for live, frozen in zip(
+                getattr(config.config, section), snapshot.sections[section]
+            ):
+                self._frozen_of[id(live)] = (live, frozen)
+                self._live_of[id(frozen)] = live
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _remove(self, index: int) -> None:
+        """
+        Drop one snapshot, moving the cost of objects it shares with the
+        next snapshot over to that snapshot.
+        """
+        removed = self._snapshots.pop(index)
+        self._cost -= removed.cost
+        if index < len(self._snapshots):
+            successor = self._snapshots[index]
+            shared = {id(successor.time_slots)}
+            for values in successor.sections.values():
+                shared.add(id(values))
+                shared.update(id(v) for v in values if not isinstance(v, str))
+            for object_id, size in removed.introduced.items():
+                if object_id in shared:
+                    successor.introduced[object_id] = size
+                    successor.cost += size
+                    self._cost += size
+        if index <= self._position:
+            self._position -= 1
+
+    def _evict(self) -> None:
+        while self._cost > self.budget and len(self._snapshots) > 1:
+            if self.eviction == "thin":
+                before = len(self._snapshots)
+                # Keep the oldest state and every other step up to half way
+                for index in range(self._position // 2 - 1, 0, -2):
+                    self._remove(index)
+                if len(self._snapshots) < before:
+                    continue
+            if self._position == 0:
+                # Never evict the current state; drop redo steps instead
+                removed = self._snapshots.pop()
+                self._cost -= removed.cost
+            else:
+                self._remove(0)
+
+    # ------------------------------------------------------------------
+    # Navigation
+    # ------------------------------------------------------------------
+
+    def undo_steps(self) -> int:
+        """
+        Return how many steps can currently be undone.
+        """
+        return max(self._position, 0)
+
+    def redo_steps(self) -> int:
+        """
+        Return how many steps can currently be redone.
+        """
+        return len(self._snapshots) - 1 - self._position
+
+    def memory_usage(self) -> int:
+        """
+        Return the estimated memory held by the history, in bytes.
+        """
+        return self._cost
+
+    def move(self, config, steps: int) -> dict[str, set | None]:
+        """
+        Jump back (negative) or forward (positive) through the history and
+        restore that state into the live config.
+
+        Call checkpoint() first so in-progress edits become a step of their
+        own and can be redone.
+
+        Parameters:
+            config (CombinedConfig): The live configuration
+            steps (int): Number of steps; clamped to the available range
+
+        Returns:
+            dict[str, set | None]: Section -> entity keys that changed (None
+                for a whole section), in DirtyState format
+        """
+        target = min(max(self._position + steps, 0), len(self._snapshots) - 1)
+        if target == self._position or target < 0:
+            return {}
+        snapshot = self._snapshots[target]
+        changes = self._restore(config, self._snapshots[self._position], snapshot)
+        self._position = target
+        self._noted = {}
+        self._map_live(config, snapshot)
+        return changes
+
+    def current(self) -> _Snapshot | None:
+        """
+        Return the snapshot of the last checkpoint, for use with rollback().
+        """
+        return self._snapshots[self._position] if self._snapshots else None
+
+    def rollback(self, config, base: _Snapshot) -> dict[str, set | None]:
+        """
+        Discard every edit made since base was current and restore it into
+        the live config. The steps recorded after base are dropped, so the
+        discarded edits cannot be redone.
+
+        Parameters:
+            config (CombinedConfig): The live configuration
+            base (_Snapshot): Snapshot returned by current()
+
+        Returns:
+            dict[str, set | None]: Section -> entity keys that changed (None
+                for a whole section), in DirtyState format
+        """
+        self.checkpoint(config)
+        current = self._snapshots[self._position]
+        if current is base:
+            return {}
+        changes = self._restore(config, current, base)
+        position = next(
+            (i for i, snapshot in enumerate(self._snapshots) if snapshot is base),
+            None,
+        )
+        if position is None:
+            # base was evicted; start over from the restored state
+            self.reset(config)
+            return changes
+        for dropped in self._snapshots[position + 1 :]:
+            self._cost -= dropped.cost
+        del self._snapshots[position + 1 :]
+        self._position = position
+        self._noted = {}
+        self._map_live(config, base)
+        return changes
+
+    def _restore(
+        self, config, current: _Snapshot, snapshot: _Snapshot
+    ) -> dict[str, set | None]:
+        """
+        Make the live config match snapshot, given that it matches current.
+        """
+        changes: dict[str, set | None] = {}
+
+        for section in ("rooms", "labs"):
+            if snapshot.sections[section] is not current.sections[section]:
+                getattr(config.config, section)[:] = snapshot.sections[section]
+                changes[section] = None
+
+        for section, key_field in ENTITY_KEYS.items():
+            wanted = snapshot.sections[section]
+            if wanted is current.sections[section]:
+                continue
+            live = getattr(config.config, section)
+            keep = {id(frozen) for frozen in wanted}
+            keys = {
+                getattr(frozen, key_field)
+                for frozen in current.sections[section]
+                if id(frozen) not in keep
+            }
+            missing = [frozen for frozen in wanted if id(frozen) not in self._live_of]
+            copies = iter(_copy(missing)[0])
+            restored = []
+            for frozen in wanted:
+                entity = self._live_of.get(id(frozen))
+                if entity is None:
+                    entity = next(copies)
+                    keys.add(getattr(frozen, key_field))
+                restored.append(entity)
+            live[:] = restored
+            changes[section] = keys
+
+        if snapshot.time_slots is not current.time_slots:
+            config.time_slot_config = _copy(snapshot.time_slots)[0]
+            changes["time_slot_config"] = None
+        return changes
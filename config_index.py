@@ -0,0 +1,567 @@
+# Filename: config_index.py
+# Description: Incrementally maintained lookup index over a CombinedConfig
+
+# Fields through which entities reference rooms, labs, courses and faculty:
+# attribute -> kind of the referenced entity
+COURSE_REFERENCES = {
+    "room": "room",
+    "lab": "lab",
+    "conflicts": "course",
+    "faculty": "faculty",
+}
+FACULTY_REFERENCES = {
+    "room_preferences": "room",
+    "lab_preferences": "lab",
+    "course_preferences": "course",
+}
+
+
+class _ReverseIndex:
+    """
+    Maps each referenced name to the entities of one section (courses or
+    faculty) that reference it, in the order they were indexed, and counts
+    the referencing entities per key.
+    """
+
+    def __init__(self, fields: dict[str, str], key):
+        self._fields = fields
+        # entity -> key it is grouped under ('course_id' or casefolded name)
+        self._key = key
+        # (kind, name) -> {id(entity): entity}
+        self._referrers: dict[tuple[str, str], dict[int, object]] = {}
+        # (kind, name) -> {key: number of referencing entities with that key}
+        self._referrer_keys: dict[tuple[str, str], dict[str, int]] = {}
+        # key -> {id(entity): (entity, references it is indexed under)}
+        self._indexed: dict[str, dict[int, tuple]] = {}
+
+    def _references(self, entity) -> frozenset:
+        return frozenset(
+            (kind, name)
+            for field, kind in self._fields.items()
+            for name in getattr(entity, field)
+        )
+
+    def _add(self, key: str, entity, references) -> None:
+        for reference in references:
+            self._referrers.setdefault(reference, {})[id(entity)] = entity
+            keys = self._referrer_keys.setdefault(reference, {})
+            keys[key] = keys.get(key, 0) + 1
+
+    def _remove(self, key: str, entity, references) -> None:
+        for reference in references:
+            referrers = self._referrers.get(reference)
+            if referrers is None or referrers.pop(id(entity), None) is None:
+                continue
+            if not referrers:
+                del self._referrers[reference]
+            keys = self._referrer_keys[reference]
+            keys[key] -= 1
+            if not keys[key]:
+                del keys[key]
+                if not keys:
+                    del self._referrer_keys[reference]
+
+    def build(self, entities: list) -> None:
+        self._referrers = {}
+        self._referrer_keys = {}
+        self._indexed = {}
+        for entity in entities:
+            key = self._key(entity)
+            references = self._references(entity)
+            self._add(key, entity, references)
+            self._indexed.setdefault(key, {})[id(entity)] = (entity, references)
+
+    def refresh(self, key: str, current: list) -> None:
+        """
+        Re-read the references of the entities grouped under one key;
+        current holds the entities that have that key now.
+        """
+        previous = self._indexed.pop(key, {})
+        current_ids = {id(entity) for entity in current}
+        for entity_id, (entity, references) in previous.items():
+            if entity_id not in current_ids:
+                self._remove(key, entity, references)
+        indexed = {}
+        for entity in current:
+            references = self._references(entity)
+            old = previous.get(id(entity))
+            if old is None:
+                self._add(key, entity, references)
+            elif old[1] != references:
+                self._remove(key, entity, old[1] - references)
+                self._add(key, entity, references - old[1])
+            indexed[id(entity)] = (entity, references)
+        if indexed:
+            self._indexed[key] = indexed
+
+    def referrers(self, kind: str, name: str) -> list:
+        return list(self._referrers.get((kind, name), {}).values())
+
+    def referrer_keys(self, kind: str, name: str) -> dict[str, int]:
+        return self._referrer_keys.get((kind, name), {})
+
+    def references(self, key: str) -> set[tuple[str, str]]:
+        """
+        Return everything referenced by the entities grouped under a key.
+        """
+        found: set[tuple[str, str]] = set()
+        for _, references in self._indexed.get(key, {}).values():
+            found |= references
+        return found
+
+
+class ConfigIndex:
+    """
+    Constant-time lookups of rooms, labs, course sections and faculty.
+
+    Each section is indexed on first use. Models report their mutations
+    (room_added(), faculty_renamed(), ...) so the index is updated in place
+    instead of rebuilt. Bulk changes that replace entities (undo, external
+    edits) call invalidate() instead.
+
+    The index also maps every room, lab, course and faculty name to the
+    courses and faculty that reference it, so cascading renames and deletes
+    and "affected by" queries only visit the referencing entities. These
+    reverse references are refreshed per entity from mark_dirty()
+    (see entity_changed()).
+
+    Course sections also get stable ids: small integers that follow the
+    section object itself, so they keep pointing at the same section when
+    earlier sections are deleted. A section replaced by a new object (for
+    example by undo) gets a new id.
+
+    As a safety net, the index remembers the identity and length of each
+    section list it covers. A section changed without being reported (for
+    example a direct append) is re-indexed on the next lookup, and a hit is
+    checked against the entity it points at before being returned.
+
+    Attributes:
+        config (CombinedConfig): The indexed configuration
+    """
+
+    def __init__(self, config):
+        """
+        Parameters:
+            config (CombinedConfig): Configuration to index
+        """
+        self.config = config
+        # section -> (id(list), len(list)) when the section was last in sync
+        self._synced: dict[str, tuple[int, int]] = {}
+        self._rooms: set[str] = set()
+        self._labs: set[str] = set()
+        # course_id -> positions of its sections in config.courses
+        self._courses: dict[str, list[int]] = {}
+        # id(section) -> (section, stable id) for every indexed course section
+        self._section_ids: dict[int, tuple[object, int]] = {}
+        # stable id -> position in config.courses
+        self._section_positions: dict[int, int] = {}
+        self._next_section_id = 1
+        # casefolded name -> FacultyConfig
+        self._faculty: dict[str, object] = {}
+        # section -> reverse references held by that section's entities
+        self._reverse: dict[str, _ReverseIndex] = {}
+        # section -> (id(list), len(list)) when its references were in sync
+        self._reverse_synced: dict[str, tuple[int, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def _values(self, section: str) -> list:
+        return getattr(self.config.config, section)
+
+    def _ensure(self, section: str) -> list:
+        values = self._values(section)
+        if self._synced.get(section) != (id(values), len(values)):
+            self._build(section, values)
+        return values
+
+    def _build(self, section: str, values: list) -> None:
+        if section == "rooms":
+            self._rooms = set(values)
+        elif section == "labs":
+            self._labs = set(values)
+        elif section == "courses":
+            positions: dict[str, list[int]] = {}
+            section_ids: dict[int, tuple[object, int]] = {}
+            for position, course in enumerate(values):
+                positions.setdefault(course.course_id, []).append(position)
+                known = self._section_ids.get(id(course))
+                if known is None or known[0] is not course:
+                    known = (course, self._new_section_id())
+                section_ids[id(course)] = known
+            self._courses = positions
+            # Sections no longer in the list drop their ids
+            self._section_ids = section_ids
+            self._section_positions = {
+                section_ids[id(course)][1]: position
+                for position, course in enumerate(values)
+            }
+        else:
+            self._faculty = {f.name.casefold(): f for f in values}
+        self._synced[section] = (id(values), len(values))
+
+    def _new_section_id(self) -> int:
+        section_id = self._next_section_id
+        self._next_section_id += 1
+        return section_id
+
+    def invalidate(self, section: str | None = None) -> None:
+        """
+        Re-index a section (or every section) on its next lookup.
+
+        Parameters:
+            section (str | None): Section name, or None for all
+        """
+        if section is None:
+            self._synced.clear()
+            self._reverse_synced.clear()
+        else:
+            self._synced.pop(section, None)
+            self._reverse_synced.pop(section, None)
+
+    def _update(self, section: str, size_change: int) -> bool:
+        """
+        Check that the index was in sync before a reported mutation that
+        changed the section's length by size_change, and record that it is
+        in sync again. Returns False (and invalidates) if it was not, in
+        which case the caller skips its in-place update.
+        """
+        values = self._values(section)
+        expected = (id(values), len(values) - size_change)
+        if self._synced.get(section) != expected:
+            self._synced.pop(section, None)
+            return False
+        self._synced[section] = (id(values), len(values))
+        return True
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def has_room(self, name: str) -> bool:
+        """
+        Return True if the room exists.
+        """
+        self._ensure("rooms")
+        return name in self._rooms
+
+    def has_lab(self, name: str) -> bool:
+        """
+        Return True if the lab exists.
+        """
+        self._ensure("labs")
+        return name in self._labs
+
+    def course_positions(self, course_id: str) -> list[int]:
+        """
+        Return the positions in config.courses of every section of a course.
+
+        Parameters:
+            course_id (str): Course ID
+
+        Returns:
+            list[int]: Positions in ascending order (empty if none)
+        """
+        courses = self._ensure("courses")
+        positions = self._courses.get(course_id, [])
+        if any(courses[p].course_id != course_id for p in positions):
+            self._build("courses", courses)
+            positions = self._courses.get(course_id, [])
+        return list(positions)
+
+    def courses_by_id(self, course_id: str) -> list:
+        """
+        Return every section of a course, in config order.
+        """
+        courses = self._values("courses")
+        return [courses[p] for p in self.course_positions(course_id)]
+
+    def _known_section_id(self, course) -> int | None:
+        known = self._section_ids.get(id(course))
+        return known[1] if known is not None and known[0] is course else None
+
+    def section_ids(self) -> list[int]:
+        """
+        Return the stable id of every course section, in config order.
+        """
+        courses = self._ensure("courses")
+        ids = [self._known_section_id(course) for course in courses]
+        if None in ids:
+            self._build("courses", courses)
+            ids = [self._known_section_id(course) for course in courses]
+        return ids
+
+    def section_id(self, position: int) -> int:
+        """
+        Return the stable id of the course section at a position.
+
+        Parameters:
+            position (int): Position in config.courses
+
+        Returns:
+            int: Stable section id
+
+        Raises:
+            IndexError: If there is no section at that position
+        """
+        courses = self._ensure("courses")
+        section_id = self._known_section_id(courses[position])
+        if section_id is None:
+            self._build("courses", courses)
+            section_id = self._known_section_id(courses[position])
+        return section_id
+
+    def section_position(self, section_id: int) -> int | None:
+        """
+        Return the current position of a course section.
+
+        Parameters:
+            section_id (int): Stable id from section_id() or section_ids()
+
+        Returns:
+            int | None: Position in config.courses, or None if the section
+                no longer exists
+        """
+        courses = self._ensure("courses")
+        position = self._section_positions.get(section_id)
+        if position is None or (
+            position < len(courses)
+            and self._known_section_id(courses[position]) == section_id
+        ):
+            return position
+        self._build("courses", courses)
+        return self._section_positions.get(section_id)
+
+    def faculty_by_name(self, name: str):
+        """
+        Return the faculty member with the given name (case-insensitive).
+
+        Parameters:
+            name (str): Faculty name
+
+        Returns:
+            FacultyConfig | None: The faculty member, or None if not found
+        """
+        key = name.casefold()
+        faculty = self._ensure("faculty")
+        member = self._faculty.get(key)
+        if member is not None and member.name.casefold() != key:
+            self._build("faculty", faculty)
+            member = self._faculty.get(key)
+        return member
+
+    # ------------------------------------------------------------------
+    # Mutations reported by the models (call after mutating)
+    # ------------------------------------------------------------------
+
+    def room_added(self, name: str) -> None:
+        """
+        Report a room appended to config.rooms.
+        """
+        if self._update("rooms", 1):
+            self._rooms.add(name)
+
+    def room_removed(self, name: str) -> None:
+        """
+        Report a room removed from config.rooms in place.
+        """
+        if self._update("rooms", -1):
+            self._rooms.discard(name)
+
+    def room_renamed(self, old_name: str, new_name: str) -> None:
+        """
+        Report a room renamed in place.
+        """
+        if self._update("rooms", 0):
+            self._rooms.discard(old_name)
+            self._rooms.add(new_name)
+
+    def rooms_renamed(self, renames: dict[str, str]) -> None:
+        """
+        Report several rooms renamed in place at once (swaps allowed).
+        """
+        if self._update("rooms", 0):
+            self._rooms.difference_update(renames)
+            self._rooms.update(renames.values())
+
+    def lab_added(self, name: str) -> None:
+        """
+        Report a lab appended to config.labs.
+        """
+        if self._update("labs", 1):
+            self._labs.add(name)
+
+    def lab_removed(self, name: str) -> None:
+        """
+        Report a lab removed from config.labs in place.
+        """
+        if self._update("labs", -1):
+            self._labs.discard(name)
+
+    def lab_renamed(self, old_name: str, new_name: str) -> None:
+        """
+        Report a lab renamed in place.
+        """
+        if self._update("labs", 0):
+            self._labs.discard(old_name)
+            self._labs.add(new_name)
+
+    def course_added(self, course) -> None:
+        """
+        Report a course section appended to config.courses.
+        """
+        if self._update("courses", 1):
+            position = len(self._values("courses")) - 1
+            self._courses.setdefault(course.course_id, []).append(position)
+            section_id = self._new_section_id()
+            self._section_ids[id(course)] = (course, section_id)
+            self._section_positions[section_id] = position
+
+    def courses_removed(self) -> None:
+        """
+        Report removed course sections. Later sections shift position, so
+        the courses are re-indexed on the next lookup.
+        """
+        self._synced.pop("courses", None)
+
+    def faculty_added(self, faculty) -> None:
+        """
+        Report a faculty member appended to config.faculty.
+        """
+        if self._update("faculty", 1):
+            self._faculty[faculty.name.casefold()] = faculty
+
+    def faculty_removed(self, name: str) -> None:
+        """
+        Report a faculty member removed from config.faculty in place.
+        """
+        if self._update("faculty", -1):
+            self._faculty.pop(name.casefold(), None)
+
+    def faculty_renamed(self, old_name: str, faculty) -> None:
+        """
+        Report a faculty member whose name changed (old_name is the previous name).
+        """
+        if self._update("faculty", 0):
+            self._faculty.pop(old_name.casefold(), None)
+            self._faculty[faculty.name.casefold()] = faculty
+
+    # ------------------------------------------------------------------
+    # Reverse references
+    # ------------------------------------------------------------------
+
+    def _reverse_index(self, section: str) -> _ReverseIndex:
+        values = self._values(section)
+        if self._reverse_synced.get(section) != (id(values), len(values)):
+            if section == "courses":
+                reverse = _ReverseIndex(COURSE_REFERENCES, lambda c: c.course_id)
+            else:
+                reverse = _ReverseIndex(FACULTY_REFERENCES, lambda f: f.name.casefold())
+            reverse.build(values)
+            self._reverse[section] = reverse
+            self._reverse_synced[section] = (id(values), len(values))
+        return self._reverse[section]
+
+    def courses_referencing(self, kind: str, name: str) -> list:
+        """
+        Return the course sections that reference an entity.
+
+        Parameters:
+            kind (str): 'room', 'lab', 'course' (conflicts) or 'faculty'
+            name (str): Name or course ID of the referenced entity
+
+        Returns:
+            list[CourseConfig]: Referencing sections
+        """
+        return self._reverse_index("courses").referrers(kind, name)
+
+    def faculty_referencing(self, kind: str, name: str) -> list:
+        """
+        Return the faculty members whose preferences reference an entity.
+
+        Parameters:
+            kind (str): 'room', 'lab' or 'course'
+            name (str): Name or course ID of the referenced entity
+
+        Returns:
+            list[FacultyConfig]: Referencing faculty members
+        """
+        return self._reverse_index("faculty").referrers(kind, name)
+
+    def entity_changed(self, section: str, key: str | None = None) -> None:
+        """
+        Refresh the references held by a changed course or faculty member.
+
+        Called from ConfigModel.mark_dirty() after every mutation, with the
+        same arguments. A course key covers all of its sections; a renamed
+        entity is reported under both names.
+
+        Parameters:
+            section (str): Changed section
+            key (str | None): Course id or faculty name, or None if the
+                whole section changed
+        """
+        if section not in ("courses", "faculty") or (
+            section not in self._reverse_synced
+        ):
+            return
+        values = self._values(section)
+        if key is None or self._reverse_synced[section][0] != id(values):
+            # Whole section changed, or its list was replaced: rebuild lazily
+            self._reverse_synced.pop(section, None)
+            return
+        if section == "courses":
+            current = self.courses_by_id(key)
+        else:
+            member = self.faculty_by_name(key)
+            current = [] if member is None else [member]
+            key = key.casefold()
+        self._reverse[section].refresh(key, current)
+        self._reverse_synced[section] = (id(values), len(values))
+
+    # ------------------------------------------------------------------
+    # Course conflicts
+    # ------------------------------------------------------------------
+
+    def lists_conflict(self, course_id: str, other_id: str) -> bool:
+        """
+        Return True if any section of course_id lists other_id as a conflict.
+        """
+        reverse = self._reverse_index("courses")
+        return course_id in reverse.referrer_keys("course", other_id)
+
+    def conflict_exists(self, course_id_1: str, course_id_2: str) -> bool:
+        """
+        Return True if a section of either course lists the other as a
+        conflict and the listed course has at least one section.
+        """
+        return (
+            self.lists_conflict(course_id_1, course_id_2)
+            and bool(self.course_positions(course_id_2))
+        ) or (
+            self.lists_conflict(course_id_2, course_id_1)
+            and bool(self.course_positions(course_id_1))
+        )
+
+    def conflicting_ids(self, course_id: str) -> set[str]:
+        """
+        Return the ids of the existing courses that conflict with a course,
+        in either direction.
+
+        Parameters:
+            course_id (str): Course ID
+
+        Returns:
+            set[str]: Conflicting course ids (excluding course_id itself)
+        """
+        reverse = self._reverse_index("courses")
+        neighbours = {
+            name
+            for kind, name in reverse.references(course_id)
+            if kind == "course" and self.course_positions(name)
+        }
+        if self.course_positions(course_id):
+            neighbours.update(reverse.referrer_keys("course", course_id))
+        neighbours.discard(course_id)
+        return neighbours
@@ -0,0 +1,333 @@
+# Filename: config_journal.py
+# Description: Append-only edit journal for temp saves, with background compaction
+
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from safe_save import SECTIONS
+
+logger = logging.getLogger(__name__)
+
+# Key in the compacted .temp file recording the last journal record folded in
+SEQ_KEY = "_journal_seq"
+
+# Field identifying an entity within each keyed section
+ENTITY_KEYS = {"courses": "course_id", "faculty": "name"}
+
+# Compact after this many records have been appended
+DEFAULT_COMPACT_THRESHOLD = 200
+
+
+def apply_record(data: dict, record: dict) -> None:
+    """
+    Apply one journal record to a raw config dictionary in place.
+
+    A record holds a list of changes. Each change either replaces a whole
+    section ('set') or replaces the entities with the given keys, inserting
+    the new versions at their positions in the final list ('entities').
+    """
+    for change in record["changes"]:
+        section = change["section"]
+        if section == "time_slot_config":
+            data["time_slot_config"] = change["value"]
+        elif change["op"] == "set":
+            data["config"][section] = change["value"]
+        else:
+            key_field = ENTITY_KEYS[section]
+            keys = set(change["keys"])
+            entities = [
+                e for e in data["config"].get(section, []) if e[key_field] not in keys
+            ]
+            for index, value in sorted(change["items"], key=lambda item: item[0]):
+                entities.insert(index, value)
+            data["config"][section] = entities
+
+
+class ConfigJournal:
+    """
+    Write-ahead journal of in-memory config edits.
+
+    Each temp save appends one line holding the changed sections and
+    entities instead of rewriting the '.temp' accumulator file; callers
+    serialize the changes with build_changes() and write them with append().
+    On load the journal is replayed over the '.temp' file (or the config
+    itself if there is none). Once enough records build up they are folded
+    into '.temp' on a background thread.
+
+    Attributes:
+        config_path (str): Path to the main configuration JSON file
+        path (str): Path to the journal file
+        temp_path (str): Path to the compacted '.temp' file
+        compact_threshold (int): Records appended before compacting
+    """
+
+    def __init__(
+        self, config_path: str, compact_threshold: int = DEFAULT_COMPACT_THRESHOLD
+    ):
+        """
+        Parameters:
+            config_path (str): Path to the main configuration JSON file
+            compact_threshold (int): Records appended before compacting
+        """
+        self.config_path = config_path
+        self.path = config_path + ".journal"
+        self.temp_path = config_path + ".temp"
+        self.compact_threshold = compact_threshold
+        self._lock = threading.Lock()
+        self._compactor: threading.Thread | None = None
+        self._seq = 0
+        self._uncompacted = 0
+        self._last_time_slots: str | None = None
+
+    def has_pending(self) -> bool:
+        """
+        Return True if there is a journal left by an earlier session that
+        is still newer than the config file it applies to.
+        """
+        if not os.path.exists(self.path):
+            return False
+        if not os.path.exists(self.config_path):
+            return True
+        return os.path.getmtime(self.path) >= os.path.getmtime(self.config_path)
+
+    def _read_records(self) -> list[dict]:
+        records = []
+        with open(self.path, "r") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # torn final write from a crash
+        return records
+
+    def _read_base(self) -> dict:
+        path = self.temp_path if os.path.exists(self.temp_path) else self.config_path
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def replay(self) -> dict:
+        """
+        Rebuild the raw config by replaying the journal over its base.
+
+        Returns:
+            dict: Raw config data, ready for CombinedConfig validation
+        """
+        with self._lock:
+            data = self._read_base()
+            base_seq = data.pop(SEQ_KEY, 0)
+            records = self._read_records() if os.path.exists(self.path) else []
+        self._seq = base_seq
+        for record in records:
+            if record["seq"] > base_seq:
+                apply_record(data, record)
+                self._seq = record["seq"]
+                self._uncompacted += 1
+        self._last_time_slots = json.dumps(data.get("time_slot_config"))
+        return data
+
+    def set_aside(self) -> list[str]:
+        """
+        Rename the journal and the compacted '.temp' file out of the way,
+        keeping them for inspection, after they failed to replay.
+
+        Returns:
+            list[str]: New paths of the files that were moved
+        """
+        self.wait()
+        moved = []
+        with self._lock:
+            for path in (self.path, self.temp_path):
+                if not os.path.exists(path):
+                    continue
+                target = path + ".failed"
+                suffix = 1
+                while os.path.exists(target):
+                    suffix += 1
+                    target = f"{path}.failed{suffix}"
+                os.replace(path, target)
+                moved.append(target)
+        return moved
+
+    def start(self) -> None:
+        """
+        Begin a fresh journal over the config file, discarding any journal
+        or '.temp' file it would otherwise be replayed on top of.
+        """
+        self.discard()
+        self._seq = 0
+        self._uncompacted = 0
+        self._last_time_slots = None
+
+    def discard(self) -> None:
+        """
+        Delete the journal and the compacted '.temp' file.
+        """
+        self.wait()
+        with self._lock:
+            for path in (self.path, self.temp_path):
+                if os.path.exists(path):
+                    os.remove(path)
+        self._uncompacted = 0
+
+    def build_changes(self, config, changes: dict[str, set | None]) -> list[dict]:
+        """
+        Serialize the given in-memory changes into journal entries.
+
+        Reads the live configuration, so callers that write from another
+        thread must hold the config lock while calling this.
+
+        Parameters:
+            config: The CombinedConfig holding the current in-memory data
+            changes (dict[str, set | None]): Section -> changed entity keys
+
+        Returns:
+            list[dict]: Entries for append()
+        """
+        entries = []
+        valid_courses = None
+        for section in SECTIONS:
+            if section not in changes:
+                continue
+            keys = changes[section]
+            if section == "time_slot_config":
+                value = config.time_slot_config.model_dump(
+                    mode="json", exclude_unset=True
+                )
+                encoded = json.dumps(value)
+                if encoded == self._last_time_slots:
+                    continue
+                self._last_time_slots = encoded
+                entries.append({"op": "set", "section": section, "value": value})
+            elif section in ("rooms", "labs"):
+                value = list(getattr(config.config, section))
+                entries.append({"op": "set", "section": section, "value": value})
+            else:
+                key_field = ENTITY_KEYS[section]
+                items = []
+                for index, entity in enumerate(getattr(config.config, section)):
+                    if keys is not None and getattr(entity, key_field) not in keys:
+                        continue
+                    value = entity.model_dump(mode="json", exclude_unset=True)
+                    if section == "faculty":
+                        if valid_courses is None:
+                            valid_courses = {c.course_id for c in config.config.courses}
+                        value["course_preferences"] = {
+                            k: v
+                            for k, v in value.get("course_preferences", {}).items()
+                            if k in valid_courses
+                        }
+                    items.append([index, value])
+                if keys is None:
+                    value = [item for _, item in items]
+                    entries.append({"op": "set", "section": section, "value": value})
+                else:
+                    entries.append(
+                        {
+                            "op": "entities",
+                            "section": section,
+                            "keys": sorted(keys),
+                            "items": items,
+                        }
+                    )
+        return entries
+
+    def append(self, entries: list[dict]) -> bool:
+        """
+        Write change entries from build_changes() as one journal record.
+
+        Only file I/O happens here, so it is safe to call without access
+        to the live configuration.
+
+        Parameters:
+            entries (list[dict]): Entries returned by build_changes()
+
+        Returns:
+            bool: True if appended (or nothing to append), False on error
+        """
+        if not entries:
+            return True
+        with self._lock:
+            try:
+                line = json.dumps({"seq": self._seq + 1, "changes": entries})
+                with open(self.path, "a") as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except (OSError, ValueError) as e:
+                logger.error("Journal append to %s failed: %s", self.path, e)
+                return False
+            self._seq += 1
+        self._uncompacted += 1
+        if self._uncompacted >= self.compact_threshold:
+            self.compact_in_background()
+        return True
+
+    def compact(self) -> None:
+        """
+        Fold the journal into the '.temp' file and drop the folded records.
+
+        Records appended while compaction runs are kept in the journal.
+        """
+        with self._lock:
+            if not os.path.exists(self.path):
+                return
+            data = self._read_base()
+            base_seq = data.pop(SEQ_KEY, 0)
+            records = self._read_records()
+
+        folded = base_seq
+        for record in records:
+            if record["seq"] > base_seq:
+                apply_record(data, record)
+                folded = record["seq"]
+        data[SEQ_KEY] = folded
+
+        dir_name = os.path.dirname(os.path.abspath(self.config_path))
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=dir_name, delete=False, suffix=".tmp"
+        ) as tmp:
+            json.dump(data, tmp, indent=2)
+        try:
+            with self._lock:
+                # The new .temp records its seq, so a crash before the journal
+                # is rewritten only makes replay skip the folded records
+                os.replace(tmp.name, self.temp_path)
+                tail = [r for r in self._read_records() if r["seq"] > folded]
+                with tempfile.NamedTemporaryFile(
+                    mode="w", dir=dir_name, delete=False, suffix=".tmp"
+                ) as journal_tmp:
+                    for record in tail:
+                        journal_tmp.write(json.dumps(record) + "\n")
+                os.replace(journal_tmp.name, self.path)
+                self._uncompacted = len(tail)
+        finally:
+            if os.path.exists(tmp.name):
+                os.remove(tmp.name)
+
+    def compact_in_background(self) -> None:
+        """
+        Start compaction on a daemon thread unless one is already running.
+        """
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+
+        def run():
+            try:
+                self.compact()
+            except (OSError, ValueError, KeyError) as e:
+                # The journal is left as it was and replays the same way
+                logger.error("Journal compaction of %s failed: %s", self.path, e)
+
+        self._compactor = threading.Thread(target=run, daemon=True)
+        self._compactor.start()
+
+    def wait(self) -> None:
+        """
+        Block until a running background compaction finishes.
+        """
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
@@ -0,0 +1,112 @@
+# Filename: config_metadata.py
+# Description: Cached file-level config values for page renders
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Seconds a cached entry is trusted before the file is stat()ed again
+STAT_INTERVAL = 1.0
+
+# Absolute path -> (stamp, time of last stat, metadata)
+_cache: dict[str, tuple[tuple[int, int], float, dict]] = {}
+_lock = threading.Lock()
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def summarize(data: dict, raw: bytes) -> dict:
+    """
+    Build the metadata for a config file.
+
+    Parameters:
+        data (dict): Parsed config JSON
+        raw (bytes): The file contents, for the content hash
+
+    Returns:
+        dict: 'limit' (None if the file has none), 'optimizer_flags',
+            'counts' (rooms, labs, courses, faculty) and 'hash' (hex digest
+            of the file contents)
+    """
+    config = data.get("config", {})
+    return {
+        "limit": data.get("limit"),
+        "optimizer_flags": list(data.get("optimizer_flags", [])),
+        "counts": {
+            section: len(config.get(section, []))
+            for section in ("rooms", "labs", "courses", "faculty")
+        },
+        "hash": hashlib.blake2b(raw, digest_size=16).hexdigest(),
+    }
+
+
+def get_metadata(config_path: str) -> dict:
+    """
+    Return the metadata of the config file as it is on disk.
+
+    The file is parsed only when its modification time or size changed
+    since it was last read or saved by the app, and those are checked at
+    most once per STAT_INTERVAL.
+
+    Parameters:
+        config_path (str): Path to configuration JSON file
+
+    Returns:
+        dict: See summarize(); callers must not modify it
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    key = os.path.abspath(config_path)
+    now = time.monotonic()
+    with _lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        stamp, checked, metadata = cached
+        if now - checked < STAT_INTERVAL:
+            return metadata
+        if _file_stamp(config_path) == stamp:
+            with _lock:
+                _cache[key] = (stamp, now, metadata)
+            return metadata
+
+    stamp = _file_stamp(config_path)
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    metadata = summarize(json.loads(raw), raw)
+    with _lock:
+        _cache[key] = (stamp, now, metadata)
+    return metadata
+
+
+def remember_metadata(config_path: str, data: dict, raw: bytes) -> None:
+    """
+    Record the metadata of a config file the app has just written, so the
+    next lookup does not read it back.
+
+    Parameters:
+        config_path (str): Path the data was written to
+        data (dict): The data written
+        raw (bytes): The exact bytes written
+    """
+    metadata = summarize(data, raw)
+    stamp = _file_stamp(config_path)
+    with _lock:
+        _cache[os.path.abspath(config_path)] = (stamp, time.monotonic(), metadata)
+
+
+def forget_metadata(config_path: str | None = None) -> None:
+    """
+    Drop the cached metadata for one file, or for every file.
+    """
+    with _lock:
+        if config_path is None:
+            _cache.clear()
+        else:
+            _cache.pop(os.path.abspath(config_path), None)
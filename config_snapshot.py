@@ -0,0 +1,239 @@
+# Filename: config_snapshot.py
+# Description: Load configs from cached, already-validated snapshots
+
+import hashlib
+import hmac
+import json
+import os
+import pickle
+import stat
+import sys
+import tempfile
+from collections import OrderedDict
+from importlib import metadata
+
+import pydantic
+from scheduler import CombinedConfig
+
+# Environment variable overriding where snapshot files are kept
+SNAPSHOT_DIR_ENV = "SCHEDULER_SNAPSHOT_DIR"
+
+# Snapshot files kept on disk / pickled snapshots kept in memory
+MAX_DISK_SNAPSHOTS = 32
+MAX_MEMORY_SNAPSHOTS = 8
+
+# Per-directory secret that disk snapshots are signed with
+SECRET_FILE = "snapshot.key"
+SECRET_SIZE = 32
+
+
+def _version_tag() -> bytes:
+    try:
+        scheduler_version = metadata.version("course-constraint-scheduler")
+    except metadata.PackageNotFoundError:
+        scheduler_version = "unknown"
+    return (
+        f"{sys.version_info[:2]}|pydantic {pydantic.VERSION}|"
+        f"scheduler {scheduler_version}|"
+    ).encode()
+
+
+# Mixed into every key so snapshots from other library versions are never used
+_VERSION_TAG = _version_tag()
+
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+_memory_snapshots: OrderedDict[str, bytes] = OrderedDict()
+
+
+def default_snapshot_dir() -> str:
+    """
+    Return the snapshot directory: $SCHEDULER_SNAPSHOT_DIR, or a folder in
+    the user's cache directory.
+    """
+    if os.environ.get(SNAPSHOT_DIR_ENV):
+        return os.environ[SNAPSHOT_DIR_ENV]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "notavirus-scheduler", "snapshots")
+
+
+def snapshot_key(data: bytes) -> str:
+    """
+    Return the snapshot key for raw config file contents.
+    """
+    return hashlib.blake2b(_VERSION_TAG + data, digest_size=20).hexdigest()
+
+
+def _private_dir(snapshot_dir: str) -> bool:
+    """
+    Return True if snapshot_dir is a real directory that only the current
+    user can access. Unpickling runs code, so snapshots are never read
+    from or written to a directory anyone else could have written to.
+    """
+    try:
+        info = os.lstat(snapshot_dir)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if not hasattr(os, "getuid"):
+        return True  # No POSIX ownership (Windows); rely on the signature
+    return info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def _secret(snapshot_dir: str, create: bool) -> bytes | None:
+    """
+    Return the signing secret of a snapshot directory, creating it if
+    asked and missing. Returns None if there is no usable secret.
+    """
+    path = os.path.join(snapshot_dir, SECRET_FILE)
+    try:
+        with open(path, "rb") as f:
+            secret = f.read()
+    except FileNotFoundError:
+        if not create:
+            return None
+        secret = os.urandom(SECRET_SIZE)
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            return _secret(snapshot_dir, create=False)
+        except OSError:
+            return None
+        with os.fdopen(fd, "wb") as f:
+            f.write(secret)
+    except OSError:
+        return None
+    return secret if len(secret) == SECRET_SIZE else None
+
+
+def _signature(secret: bytes, key: str, blob: bytes) -> bytes:
+    return hmac.new(secret, key.encode() + blob, hashlib.sha256).digest()
+
+
+def _remember(key: str, blob: bytes) -> None:
+    _memory_snapshots[key] = blob
+    _memory_snapshots.move_to_end(key)
+    while len(_memory_snapshots) > MAX_MEMORY_SNAPSHOTS:
+        _memory_snapshots.popitem(last=False)
+
+
+def _read_snapshot(key: str, snapshot_dir: str) -> bytes | None:
+    blob = _memory_snapshots.get(key)
+    if blob is not None:
+        _memory_snapshots.move_to_end(key)
+        return blob
+    if not _private_dir(snapshot_dir):
+        return None
+    secret = _secret(snapshot_dir, create=False)
+    if secret is None:
+        return None
+    try:
+        with open(os.path.join(snapshot_dir, key + ".pickle"), "rb") as f:
+            signed = f.read()
+    except OSError:
+        return None
+    signature, blob = signed[:_SIGNATURE_SIZE], signed[_SIGNATURE_SIZE:]
+    if not hmac.compare_digest(signature, _signature(secret, key, blob)):
+        return None
+    _remember(key, blob)
+    return blob
+
+
+def _write_snapshot(key: str, blob: bytes, snapshot_dir: str) -> None:
+    """
+    Store a signed snapshot on disk, pruning the oldest ones. Best effort:
+    the cache is only an accelerator, so I/O errors are ignored.
+    """
+    try:
+        os.makedirs(snapshot_dir, mode=0o700, exist_ok=True)
+        if not _private_dir(snapshot_dir):
+            print(
+                f"WARNING: not caching config snapshots in {snapshot_dir}: "
+                "it must be a directory only you can access (mode 0700)"
+            )
+            return
+        secret = _secret(snapshot_dir, create=True)
+        if secret is None:
+            return
+        with tempfile.NamedTemporaryFile(
+            dir=snapshot_dir, delete=False, suffix=".tmp"
+        ) as tmp:
+            tmp.write(_signature(secret, key, blob) + blob)
+        os.replace(tmp.name, os.path.join(snapshot_dir, key + ".pickle"))
+
+        snapshots = [
+            os.path.join(snapshot_dir, name)
+            for name in os.listdir(snapshot_dir)
+            if name.endswith(".pickle")
+        ]
+        if len(snapshots) > MAX_DISK_SNAPSHOTS:
+            snapshots.sort(key=os.path.getmtime)
+            for path in snapshots[: len(snapshots) - MAX_DISK_SNAPSHOTS]:
+                os.remove(path)
+    except OSError:
+        pass
+
+
+def load_config(config_path: str, snapshot_dir: str | None = None) -> CombinedConfig:
+    """
+    Load a CombinedConfig, skipping validation if this exact file content
+    was validated before.
+
+    The file contents are hashed; a matching snapshot (in memory, or a
+    pickle in snapshot_dir) is unpickled into a fresh object. Otherwise the
+    JSON is validated as load_config_from_file() would and a snapshot is
+    stored for next time.
+
+    Disk snapshots are signed with HMAC-SHA256 using a secret kept in
+    snapshot_dir, and are only used if that directory is owned by the
+    current user and closed to everyone else, so no other user can plant
+    a pickle that would run code on load.
+
+    Parameters:
+        config_path (str): Path to configuration JSON file
+        snapshot_dir (str | None): Snapshot directory (default:
+            default_snapshot_dir())
+
+    Returns:
+        CombinedConfig: The loaded configuration
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the JSON is malformed or fails validation
+    """
+    if snapshot_dir is None:
+        snapshot_dir = default_snapshot_dir()
+
+    with open(config_path, "rb") as f:
+        data = f.read()
+    key = snapshot_key(data)
+
+    blob = _read_snapshot(key, snapshot_dir)
+    if blob is not None:
+        try:
+            return pickle.loads(blob)
+        except (
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            _memory_snapshots.pop(key, None)  # stale or corrupt; rebuild
+
+    config = CombinedConfig(**json.loads(data))
+    blob = pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL)
+    _remember(key, blob)
+    _write_snapshot(key, blob, snapshot_dir)
+    return config
+
+
+def clear_memory_snapshots() -> None:
+    """
+    Drop the in-memory snapshots (disk snapshots are kept).
+    """
+    _memory_snapshots.clear()
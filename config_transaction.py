@@ -0,0 +1,138 @@
+# Filename: config_transaction.py
+# Description: Edit sessions that apply several changes as one validated step
+
+import threading
+
+# Order in which deferred saves are published at commit
+SAVE_ORDER = ("temp", "config", "safe")
+
+
+class ConfigTransaction:
+    """
+    Groups the edits made to a ConfigModel into one all-or-nothing step.
+
+    Models keep mutating the live config, so reads inside the transaction
+    see its own edits. The undo history already holds a frozen copy of
+    every entity as of the last checkpoint; that snapshot is the
+    copy-on-write base, so opening a transaction copies nothing and a
+    rollback restores only the entities that changed.
+
+    Saves requested while the transaction is open are deferred. On exit
+    the cross-references of the whole config are validated once, then the
+    deferred saves are published together and the transaction becomes a
+    single undo step. An exception or a failed validation rolls back.
+    Nested transactions join the outermost one.
+
+    A transaction belongs to the thread that opened it and holds the
+    config model's lock until it ends, so edits and saves made on other
+    threads wait for it instead of joining it. Keep transactions short:
+    do not hold one open across slow work such as a network call.
+
+    Attributes:
+        config_model (ConfigModel): Model whose edits are grouped
+        saves (dict[str, set[str]]): Deferred save type -> features
+        saved (bool): Whether the last commit published its saves
+    """
+
+    def __init__(self, config_model):
+        """
+        Parameters:
+            config_model (ConfigModel): Model whose edits are grouped
+        """
+        self.config_model = config_model
+        self.saves: dict[str, set[str]] = {}
+        self.saved = True
+        self._base = None
+        self._depth = 0
+        self._owner: int | None = None
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether a transaction is open on the calling thread.
+        """
+        return self._depth > 0 and self._owner == threading.get_ident()
+
+    def __enter__(self):
+        model = self.config_model
+        model.lock.acquire()
+        if self._depth == 0:
+            self._owner = threading.get_ident()
+            # Close the step in progress so the transaction starts its own
+            model.history.checkpoint(model.config)
+            self._base = model.history.current()
+            self.saves = {}
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        try:
+            self._depth -= 1
+            if self._depth:
+                return False
+            self._owner = None
+            if exc_type is not None:
+                self.rollback()
+                return False
+            saves = self._close()
+        finally:
+            self.config_model.lock.release()
+        # Saves may wait for the background saver, so publish without the lock
+        self._publish(saves)
+        return False
+
+    def defer(self, save_type: str, feature: str) -> None:
+        """
+        Record a save requested inside the transaction.
+
+        Parameters:
+            save_type (str): 'temp', 'config' or 'safe' (for safe_save())
+            feature (str): Section saved, or 'all'
+        """
+        self.saves.setdefault(save_type, set()).add(feature)
+
+    def _close(self) -> dict[str, set[str]]:
+        """
+        Validate the config and close the undo step.
+
+        Returns:
+            dict[str, set[str]]: The deferred saves, for _publish()
+
+        Raises:
+            ValueError: If the config has invalid cross-references; the
+                transaction is rolled back first
+        """
+        model = self.config_model
+        try:
+            model.config.config.validate()
+        except ValueError:
+            self.rollback()
+            raise
+        model.history.checkpoint(model.config)
+        saves, self.saves = self.saves, {}
+        return saves
+
+    def _publish(self, saves: dict[str, set[str]]) -> None:
+        """
+        Publish deferred saves, once each.
+        """
+        model = self.config_model
+        self.saved = True
+        for save_type in SAVE_ORDER:
+            features = saves.get(save_type)
+            if not features:
+                continue
+            if save_type == "safe":
+                self.saved = model.safe_save() and self.saved
+            else:
+                feature = next(iter(features)) if len(features) == 1 else "all"
+                self.saved = model.save_feature(save_type, feature) and self.saved
+
+    def rollback(self) -> None:
+        """
+        Discard every edit made since the transaction began.
+        """
+        model = self.config_model
+        self.saves = {}
+        with model.lock:
+            model.mark_restored(model.history.rollback(model.config, self._base))
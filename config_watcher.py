@@ -0,0 +1,267 @@
+# Filename: config_watcher.py
+# Description: Poll the config file and hot-apply external edits entity by entity
+
+import os
+import threading
+from collections.abc import Callable
+
+from scheduler import CombinedConfig
+
+from config_diff import ENTITY_KEYS, changed_keys, diff_configs, group_entities
+from config_snapshot import load_config
+
+# Environment variable enabling the watcher: polling interval in seconds
+WATCH_INTERVAL_ENV = "SCHEDULER_WATCH_INTERVAL"
+
+# Seconds between polls of the config file
+DEFAULT_INTERVAL = 1.0
+
+# Top-level values that are copied over as a whole
+TOP_LEVEL = ("time_slot_config", "limit", "optimizer_flags")
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _plan_entities(
+    current: list, incoming: list, key_field: str, changed: set, local
+) -> tuple:
+    """
+    Work out the new list for a keyed section.
+
+    Changed keys take the disk version; unchanged keys keep their current
+    objects. Keys with unsaved local edits (in `local`, or every key if
+    local is None) keep the in-memory version.
+
+    Returns:
+        tuple: (new list, applied keys, conflicting keys)
+    """
+    current_groups = group_entities(current, key_field)
+    conflicts = changed if local is None else changed & local
+    applied = changed - conflicts
+
+    result = []
+    placed = set()
+    for entity in incoming:
+        key = getattr(entity, key_field)
+        if key in applied:
+            result.append(entity)
+        elif key in current_groups and key not in placed:
+            result.extend(current_groups[key])
+        placed.add(key)
+    # Keep entities deleted on disk but edited locally, and local additions
+    for entity in current:
+        key = getattr(entity, key_field)
+        if key not in placed and key not in applied:
+            result.append(entity)
+    return result, applied, conflicts
+
+
+def apply_external(config_model, incoming: CombinedConfig) -> tuple[dict, dict]:
+    """
+    Apply the differences between a freshly loaded config and the in-memory
+    one, touching only what changed.
+
+    Lists are updated in place so models holding references keep working.
+    Sections and entities with uncommitted in-memory edits are left alone
+    and reported as conflicts; the next commit will overwrite them on disk.
+    Call with config_model.lock held.
+
+    Parameters:
+        config_model (ConfigModel): The live configuration
+        incoming (CombinedConfig): The configuration now on disk
+
+    Returns:
+        tuple[dict, dict]: (applied, conflicts), each mapping a section to
+            the changed entity keys (None for the whole section)
+
+    Raises:
+        ValueError: If merging disk changes with local edits would produce
+            an invalid configuration (nothing is applied)
+    """
+    config = config_model.config
+    local = config_model.dirty.uncommitted()
+    applied: dict[str, set | None] = {}
+    conflicts: dict[str, set | None] = {}
+    plan = {}
+
+    changes = changed_keys(diff_configs(config, incoming))
+
+    for section in ("rooms", "labs"):
+        if section not in changes:
+            continue
+        if section in local:
+            conflicts[section] = None
+        else:
+            plan[section] = list(getattr(incoming.config, section))
+            applied[section] = None
+
+    for section, key_field in ENTITY_KEYS.items():
+        if section not in changes:
+            continue
+        new, changed, conflicting = _plan_entities(
+            getattr(config.config, section),
+            getattr(incoming.config, section),
+            key_field,
+            changes[section],
+            local.get(section, set()),
+        )
+        if changed:
+            plan[section] = new
+            applied[section] = changed
+        if conflicting:
+            conflicts[section] = conflicting
+
+    top_level = {}
+    for name in TOP_LEVEL:
+        if name not in changes:
+            continue
+        if name in local:
+            conflicts[name] = None
+        else:
+            top_level[name] = getattr(incoming, name)
+            applied[name] = None
+
+    if not applied:
+        return applied, conflicts
+
+    if local:
+        # Disk changes were validated against the disk file only; make sure
+        # they still fit together with the unsaved local edits
+        merged = config.model_dump(mode="json")
+        for section, entities in plan.items():
+            merged["config"][section] = [
+                e if isinstance(e, str) else e.model_dump(mode="json") for e in entities
+            ]
+        for name in top_level:
+            merged[name] = incoming.model_dump(mode="json", include={name})[name]
+        CombinedConfig(**merged)
+
+    for section, entities in plan.items():
+        getattr(config.config, section)[:] = entities
+        config_model.index.invalidate(section)
+    for name, value in top_level.items():
+        setattr(config, name, value)
+
+    # Memory now matches the file for these, so they are not local edits
+    for section, keys in applied.items():
+        if section in ("limit", "optimizer_flags"):
+            continue
+        for key in [None] if keys is None else keys:
+            config_model.mark_dirty(section, key, committed=True)
+    return applied, conflicts
+
+
+class ConfigWatcher:
+    """
+    Polls a ConfigModel's file and applies external edits to it.
+
+    Only os.stat() runs on each poll. When the modification time or size
+    changes, the file is loaded (through the validated snapshot cache) and
+    the differences are applied with apply_external() while holding the
+    config model's lock, so they never interleave with an edit made on the
+    event loop. The app's own saves
+    also change the file, but then the diff is empty and nothing happens.
+
+    Attributes:
+        interval (float): Seconds between polls
+    """
+
+    def __init__(
+        self,
+        config_model,
+        interval: float = DEFAULT_INTERVAL,
+        on_change: Callable[[dict, dict], None] | None = None,
+    ):
+        """
+        Parameters:
+            config_model (ConfigModel): The live configuration to keep in sync
+            interval (float): Seconds between polls
+            on_change (Callable[[dict, dict], None] | None): Called with
+                (applied, conflicts) after external changes were found
+        """
+        self.interval = interval
+        self._config_model = config_model
+        self._on_change = on_change
+        self._stamp = _file_stamp(config_model.config_path)
+        # The time slot page edits in place without marking changes, so
+        # local edits are detected against the last version seen on disk
+        self._disk_time_slots = config_model.config.time_slot_config.model_dump(
+            mode="json"
+        )
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def check(self) -> tuple[dict, dict] | None:
+        """
+        Poll the file once and apply any external changes.
+
+        Returns:
+            tuple[dict, dict] | None: (applied, conflicts) if the file
+                changed, None otherwise
+        """
+        path = self._config_model.config_path
+        stamp = _file_stamp(path)
+        if stamp is None or stamp == self._stamp:
+            return None
+        config_model = self._config_model
+        try:
+            incoming = load_config(path)
+            # Edits hold the same lock, so none is merged half-applied
+            with config_model.lock:
+                time_slots = config_model.config.time_slot_config.model_dump(
+                    mode="json"
+                )
+                if time_slots != self._disk_time_slots:
+                    config_model.mark_dirty("time_slot_config")
+                applied, conflicts = apply_external(config_model, incoming)
+        except (OSError, ValueError) as e:
+            # Probably caught mid-write or hand-edited into an invalid state;
+            # retry once the file changes again
+            print(f"Config watcher: ignoring change to {path}: {e}")
+            self._stamp = stamp
+            return None
+        self._stamp = stamp
+        self._disk_time_slots = incoming.time_slot_config.model_dump(mode="json")
+
+        if applied:
+            config_model.save_feature("temp", "all")
+            print(f"Config watcher: applied external changes to {sorted(applied)}")
+        if conflicts:
+            print(
+                "Config watcher: kept unsaved local edits over external changes "
+                f"to {sorted(conflicts)}"
+            )
+        if (applied or conflicts) and self._on_change is not None:
+            self._on_change(applied, conflicts)
+        return applied, conflicts
+
+    def start(self) -> None:
+        """
+        Start polling on a daemon thread.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def stop(self) -> None:
+        """
+        Stop polling and wait for the thread to exit.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
@@ -0,0 +1,311 @@
+# Filename: conflict_analytics.py
+# Description: Conflict-graph analytics and time-slot capacity bounds
+
+import heapq
+
+from availability_index import AvailabilityIndex
+from slot_table import SlotTable, meetings
+
+# Number of clusters reported by analyze_conflicts
+DEFAULT_CLUSTERS = 5
+
+
+def connected_components(graph: dict) -> list[list]:
+    """
+    Split a graph into its connected components.
+
+    Parameters:
+        graph (dict): Vertex -> set of adjacent vertices (symmetric)
+
+    Returns:
+        list[list]: Components, largest first, each in the graph's vertex order
+    """
+    seen = set()
+    components = []
+    for start in graph:
+        if start in seen:
+            continue
+        seen.add(start)
+        stack = [start]
+        component = []
+        while stack:
+            vertex = stack.pop()
+            component.append(vertex)
+            for neighbour in graph[vertex]:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+        order = set(component)
+        components.append([v for v in graph if v in order])
+    components.sort(key=len, reverse=True)
+    return components
+
+
+def greedy_clique(graph: dict, vertices=None) -> list:
+    """
+    Find a large clique by growing one from each high-degree vertex.
+
+    Any clique is a lower bound on the number of pairwise disjoint time
+    slots its vertices need, so this never overstates the requirement.
+
+    Parameters:
+        graph (dict): Vertex -> set of adjacent vertices (symmetric)
+        vertices (iterable | None): Restrict the search to these vertices
+
+    Returns:
+        list: Vertices of the largest clique found
+    """
+    vertices = list(graph if vertices is None else vertices)
+    degree = {v: len(graph[v]) for v in vertices}
+    order = sorted(vertices, key=lambda v: -degree[v])
+    best: list = []
+    for seed in order:
+        # A clique through seed has at most degree + 1 vertices
+        if degree[seed] + 1 <= len(best):
+            break
+        clique = [seed]
+        for candidate in sorted(graph[seed], key=lambda v: -len(graph[v])):
+            if all(candidate in graph[member] for member in clique[1:]):
+                clique.append(candidate)
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def greedy_coloring(graph: dict) -> dict:
+    """
+    Color a graph with the DSatur heuristic.
+
+    The number of colors used is an upper bound on the number of pairwise
+    disjoint time slots the vertices need.
+
+    Parameters:
+        graph (dict): Vertex -> set of adjacent vertices (symmetric)
+
+    Returns:
+        dict: Vertex -> color (0, 1, ...)
+    """
+    colors: dict = {}
+    neighbour_colors = {v: set() for v in graph}
+    order = {v: i for i, v in enumerate(graph)}
+    heap = [(0, -len(graph[v]), order[v], v) for v in graph]
+    heapq.heapify(heap)
+    while heap:
+        saturation, _, _, vertex = heapq.heappop(heap)
+        # Skip entries superseded by a later push
+        if vertex in colors or -saturation != len(neighbour_colors[vertex]):
+            continue
+        color = 0
+        while color in neighbour_colors[vertex]:
+            color += 1
+        colors[vertex] = color
+        for neighbour in graph[vertex]:
+            if neighbour in colors or color in neighbour_colors[neighbour]:
+                continue
+            neighbour_colors[neighbour].add(color)
+            heapq.heappush(
+                heap,
+                (
+                    -len(neighbour_colors[neighbour]),
+                    -len(graph[neighbour]),
+                    order[neighbour],
+                    neighbour,
+                ),
+            )
+    return colors
+
+
+def slot_capacity(slots: list) -> tuple[int, int]:
+    """
+    Bound the number of pairwise non-overlapping slots among a set of slots.
+
+    The lower bound is a disjoint selection that actually exists. The upper
+    bound is the number of instants needed to hit every slot, since two
+    slots sharing an instant overlap.
+
+    Parameters:
+        slots (list[TimeSlot]): Candidate time slots
+
+    Returns:
+        tuple[int, int]: (lower, upper) bounds
+    """
+    slot_meetings = [meetings(slot) for slot in slots]
+
+    chosen: list[int] = []
+    by_end = sorted(
+        range(len(slots)), key=lambda i: max(m[2] for m in slot_meetings[i])
+    )
+    for i in by_end:
+        if not any(slots[i].overlaps(slots[j]) for j in chosen):
+            chosen.append(i)
+
+    # Every slot contains the start of its own meetings, so those instants
+    # are enough to hit them all
+    points = {(day, start) for slot in slot_meetings for day, start, _ in slot}
+    hits = {
+        point: {
+            i
+            for i, slot in enumerate(slot_meetings)
+            if any(
+                day == point[0] and start <= point[1] < end for day, start, end in slot
+            )
+        }
+        for point in points
+    }
+    uncovered = set(range(len(slots)))
+    upper = 0
+    while uncovered:
+        point = max(sorted(hits), key=lambda p: len(hits[p] & uncovered))
+        uncovered -= hits.pop(point)
+        upper += 1
+    return len(chosen), upper
+
+
+def _density(graph: dict, component: list) -> tuple[int, float]:
+    edges = sum(len(graph[v]) for v in component) // 2
+    pairs = len(component) * (len(component) - 1) // 2
+    return edges, edges / pairs if pairs else 0.0
+
+
+def unteachable_sections(courses: list, faculty: list, availability) -> list[int]:
+    """
+    Find sections with no time slot that any of their candidate faculty can
+    teach.
+
+    Candidates are the section's listed faculty, else everyone with the
+    course in their preferences, else all faculty (as in the solver).
+
+    Parameters:
+        courses (list[CourseConfig]): Course sections
+        faculty (list[FacultyConfig]): All faculty
+        availability (AvailabilityIndex): Faculty availability over the slots
+
+    Returns:
+        list[int]: Positions of the sections that cannot be scheduled
+    """
+    names = [f.name for f in faculty]
+    found = []
+    for position, course in enumerate(courses):
+        candidates = course.faculty or [
+            f.name for f in faculty if course.course_id in f.course_preferences
+        ]
+        mask = 0
+        for name in candidates or names:
+            mask |= availability.available(name)
+        if not mask & availability.table.credit_masks.get(course.credits, 0):
+            found.append(position)
+    return found
+
+
+def analyze_conflicts(
+    graph: dict,
+    courses: list,
+    time_slot_config,
+    clusters: int = DEFAULT_CLUSTERS,
+    faculty: list | None = None,
+    slots: SlotTable | None = None,
+) -> dict:
+    """
+    Bound the number of disjoint time slots the conflicts require and
+    compare it to what the time slot configuration offers.
+
+    A clique of conflicting sections needs pairwise non-overlapping slots,
+    so a clique larger than the slot capacity of its credit patterns proves
+    the configuration infeasible without running the solver.
+
+    Parameters:
+        graph (dict[int, set[int]]): Section position -> conflicting positions
+        courses (list[CourseConfig]): Course sections, indexed by position
+        time_slot_config (TimeSlotConfig): Available times and class patterns
+        clusters (int): Number of densest clusters to report
+        faculty (list[FacultyConfig] | None): When given, also check that
+            every section has a slot one of its faculty can teach
+        slots (SlotTable | None): Materialized slots of time_slot_config,
+            e.g. ConfigModel.time_slots(); built here if not given
+
+    Returns:
+        dict: 'sections', 'edges', 'components' (count), 'clique' and
+            'colors' (largest clique found and colors used overall),
+            'clusters' (densest components first, each with 'sections',
+            'edges', 'density', 'clique', 'colors', 'credits', 'capacity'
+            and 'status': 'infeasible', 'fits' or 'unknown'),
+            'unteachable' (positions of sections no candidate faculty can
+            teach in any slot; empty without faculty), 'infeasible' (bool)
+            and 'reasons' (list[str])
+    """
+    table = slots if slots is not None else SlotTable(time_slot_config)
+    capacities: dict[frozenset, tuple[int, int]] = {}
+
+    def capacity(credit_values) -> tuple[int, int]:
+        key = frozenset(credit_values)
+        if key not in capacities:
+            mask = 0
+            for credits in key:
+                mask |= table.credit_masks.get(credits, 0)
+            capacities[key] = slot_capacity(table.slots_of(mask))
+        return capacities[key]
+
+    reasons = []
+    for credits in sorted({course.credits for course in courses}):
+        if not table.count(credits):
+            reasons.append(f"No time slots are available for {credits}-credit courses.")
+
+    unteachable: list[int] = []
+    if faculty is not None:
+        availability = AvailabilityIndex(table, faculty)
+        unteachable = unteachable_sections(courses, faculty, availability)
+        for course_id in dict.fromkeys(courses[p].course_id for p in unteachable):
+            reasons.append(
+                f"No time slot fits the availability of any faculty who can "
+                f"teach {course_id}."
+            )
+
+    colors = greedy_coloring(graph)
+    components = connected_components(graph)
+    overall_clique: list = []
+    report = []
+    for component in components:
+        if len(component) < 2:
+            break
+        clique = greedy_clique(graph, component)
+        if len(clique) > len(overall_clique):
+            overall_clique = clique
+        edges, density = _density(graph, component)
+        credits = sorted({courses[v].credits for v in component})
+        lower, upper = capacity(credits)
+        used = len({colors[v] for v in component})
+        available = capacity(courses[v].credits for v in clique)[1]
+        if len(clique) > available:
+            status = "infeasible"
+            reasons.append(
+                f"{len(clique)} mutually conflicting sections need disjoint "
+                f"time slots but at most {available} exist."
+            )
+        elif len(credits) == 1 and used <= lower:
+            status = "fits"
+        else:
+            status = "unknown"
+        report.append(
+            {
+                "sections": component,
+                "edges": edges,
+                "density": density,
+                "clique": clique,
+                "colors": used,
+                "credits": credits,
+                "capacity": (lower, upper),
+                "status": status,
+            }
+        )
+    report.sort(key=lambda c: (-len(c["clique"]), -c["density"]))
+    return {
+        "sections": len(graph),
+        "edges": sum(len(n) for n in graph.values()) // 2,
+        "components": len(components),
+        "clique": len(overall_clique) if overall_clique else min(len(graph), 1),
+        "colors": len(set(colors.values())),
+        "clusters": report[:clusters],
+        "unteachable": unteachable,
+        "infeasible": bool(reasons),
+        "reasons": reasons,
+    }
@@ -6,31 +6,15 @@ This is the main controller that coordinates all feature controllers
 and handles the main menu loop for the scheduler application.
 """
 
-from models.config_model import ConfigModel
-from models.faculty_model import FacultyModel
-from models.course_model import CourseModel
-from models.conflict_model import ConflictModel
-from models.lab_model import LabModel
-from models.room_model import RoomModel
-from models.scheduler_model import SchedulerModel
-
-from controllers.faculty_controller import FacultyController
-from controllers.course_controller import CourseController
-from controllers.conflict_controller import ConflictController
-from controllers.lab_controller import LabController
-from controllers.room_controller import RoomController
-from controllers.schedule_controller import ScheduleController
-from controllers.chatbot_controller import ChatbotController
+from config_diff import summarize_diff
+from controllers.config_swap import swap_config, swap_config_async, switch_config
+from controllers.config_workspace import ConfigWorkspace
 
 from views.gui_view import GUIView
-from views.lab_gui_view import LabGUIView
-from views.room_gui_view import RoomGUIView
-from views.chatbot_gui_view import ChatbotGUIView
-from views.faculty_gui_view import FacultyGUIView
-from views.course_gui_view import CourseGUIView
-from views.conflict_gui_view import ConflictGUIView
-from views.schedule_gui_view import ScheduleGUIView
-from nicegui import ui
+from nicegui import app, ui
+
+# Schedule limit reported when no config is loaded
+DEFAULT_LIMIT = 100
 
 
 class SchedulerController:
@@ -47,6 +31,7 @@ class SchedulerController:
         config_path (str): Path to configuration file
         config_model (ConfigModel): Central configuration model
         view (GUIView): User interface
+        workspace (ConfigWorkspace): Loaded configurations kept in memory
         faculty_controller (FacultyController): Faculty operations
         course_controller (CourseController): Course operations
         conflict_controller (ConflictController): Conflict operations
@@ -71,6 +56,7 @@ class SchedulerController:
             None
         """
         self.view = GUIView()
+        self.workspace = ConfigWorkspace()
 
         GUIView.controller = self
 
@@ -110,59 +96,7 @@ class SchedulerController:
         Returns:
             None
         """
-        self.config_path = config_path
-
-        # Models
-        self.config_model = ConfigModel(config_path)
-        self.faculty_model = FacultyModel(self.config_model)
-        self.course_model = CourseModel(self.config_model)
-        self.conflict_model = ConflictModel(self.config_model)
-        self.lab_model = LabModel(self.config_model)
-        self.room_model = RoomModel(self.config_model)
-        self.scheduler_model = SchedulerModel(self.config_model)
-
-        # Sub-controllers
-        self.faculty_controller = FacultyController(self.faculty_model, self.view)
-        self.course_controller = CourseController(self.course_model, self.config_model)
-        self.conflict_controller = ConflictController(self.conflict_model, self.view)
-        self.lab_controller = LabController(self.lab_model, self.view)
-        self.room_controller = RoomController(self.room_model, self.view)
-        self.schedule_controller = ScheduleController(self.scheduler_model, self.view)
-        self.chatbot_controller = ChatbotController(
-            self.lab_model,
-            self.room_model,
-            self.course_model,
-            self.faculty_model,
-            self.conflict_model,
-        )
-
-        LabGUIView._lab_controller = self.lab_controller
-
-        from views.schedule_gui_view import _state as _schedule_state
-
-        FacultyGUIView.faculty_model = self.faculty_model
-        FacultyGUIView.faculty_controller = self.faculty_controller
-
-        CourseGUIView.course_model = self.course_model
-        CourseGUIView.course_controller = self.course_controller
-
-        ConflictGUIView.conflict_model = self.conflict_model
-        ConflictGUIView.conflict_controller = self.conflict_controller
-
-        LabGUIView.lab_model = self.lab_model
-        LabGUIView.lab_controller = self.lab_controller
-        LabGUIView._lab_controller = self.lab_controller
-
-        RoomGUIView.room_model = self.room_model
-        RoomGUIView.room_controller = self.room_controller
-
-        if _schedule_state is not None:
-            _schedule_state._scheduler_model = self.scheduler_model
-        ScheduleGUIView.schedule_controller = self.schedule_controller
-
-        ChatbotGUIView._chatbot_controller = self.chatbot_controller
-
-        GUIView.controller = self
+        swap_config(self, config_path)
 
     def save_configuration(self) -> bool:
         """
@@ -196,6 +130,56 @@ class SchedulerController:
         except Exception as e:
             return False, str(e)
 
+    async def load_config_async(self, config_path: str) -> tuple[bool, str]:
+        """
+        Loads a new configuration file without blocking the event loop.
+
+        The file is read and validated on a worker thread; the new models
+        and sub-controllers are published only once they are all built, so
+        other users keep working with the current configuration meanwhile.
+
+        Parameters:
+            config_path (str): Absolute path to the JSON config file.
+        Returns:
+            tuple[bool, str]: (True, '') on success, (False, error message) on failure.
+        """
+        return await swap_config_async(self, config_path)
+
+    def switch_config(self, config_path: str) -> tuple[bool, str]:
+        """
+        Makes a previously loaded configuration active again without
+        re-reading it.
+
+        Parameters:
+            config_path (str): Path of a resident configuration.
+        Returns:
+            tuple[bool, str]: (True, '') on success, (False, error message) on failure.
+        """
+        return switch_config(self, config_path)
+
+    def get_resident_configs(self) -> list[str]:
+        """
+        Returns the paths of the configurations kept in memory, least
+        recently used first.
+
+        Parameters:
+            None
+        Returns:
+            list[str]
+        """
+        return self.workspace.paths()
+
+    def get_memory_report(self) -> list[dict]:
+        """
+        Returns the estimated memory held by each resident configuration.
+
+        Parameters:
+            None
+        Returns:
+            list[dict]: See ConfigWorkspace.memory_report().
+        """
+        return self.workspace.memory_report()
+
     def temp_save(self, feature: str = "all") -> bool:
         """
         Writes the current in-memory state to the temp store.
@@ -230,6 +214,79 @@ class SchedulerController:
             return False
         return self.config_model.save_feature("config", feature)
 
+    def undo(self) -> tuple[bool, str]:
+        """
+        Reverts the most recent edit.
+
+        Parameters:
+            None
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        if self.config_model is None:
+            return False, "No configuration loaded."
+        if not self.config_model.undo():
+            return False, "Nothing to undo."
+        return True, "Undid the last change."
+
+    def redo(self) -> tuple[bool, str]:
+        """
+        Re-applies the most recently undone edit.
+
+        Parameters:
+            None
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        if self.config_model is None:
+            return False, "No configuration loaded."
+        if not self.config_model.redo():
+            return False, "Nothing to redo."
+        return True, "Redid the last undone change."
+
+    def get_pending_changes(self) -> tuple[bool, list[str]]:
+        """
+        Describes the in-memory changes that have not been committed to the
+        config file yet.
+
+        Parameters:
+            None
+        Returns:
+            tuple[bool, list[str]]: (success, one line per change, or an
+                error message)
+        """
+        if self.config_model is None:
+            return False, ["No configuration loaded."]
+        try:
+            return True, summarize_diff(self.config_model.pending_changes())
+        except (OSError, ValueError) as e:
+            return False, [f"Could not compare with the saved config: {e}"]
+
+    def get_save_metrics(self) -> dict:
+        """
+        Returns background temp-save statistics, including flush latency.
+
+        Parameters:
+            None
+        Returns:
+            dict: Save metrics, or an empty dict if no config is loaded.
+        """
+        if self.config_model is None:
+            return {}
+        return self.config_model.save_metrics()
+
+    def shutdown(self) -> None:
+        """
+        Flushes pending temp saves of every resident configuration before
+        the server stops.
+
+        Parameters:
+            None
+        Returns:
+            None
+        """
+        self.workspace.close()
+
     def has_config(self) -> bool:
         """
         Returns True if a configuration is currently loaded.
@@ -245,9 +302,11 @@ class SchedulerController:
         """
         Returns the schedule generation limit from the loaded config.
 
-        Reads the raw JSON so the View always sees the value that is
-        actually on disk, not a potentially stale in-memory value.
-        Falls back to 100 if the config is missing or the key is absent.
+        Uses the value that is actually on disk, not a potentially stale
+        in-memory value, via the cached config metadata so rendering does
+        not re-read the file. Falls back to the in-memory value if the
+        file has no limit or cannot be read, and to DEFAULT_LIMIT if there
+        is no config.
 
         Parameters:
             None
@@ -255,15 +314,14 @@ class SchedulerController:
             int: The schedule limit.
         """
         if self.config_model is None:
-            return 100
+            return DEFAULT_LIMIT
         try:
-            import json
-
-            with open(self.config_model.config_path, "r") as f:
-                raw = json.load(f)
-            return raw.get("limit", getattr(self.config_model.config, "limit", 100))
+            limit = self.config_model.get_metadata()["limit"]
         except Exception:
-            return getattr(self.config_model.config, "limit", 100)
+            limit = None
+        if limit is None:
+            return getattr(self.config_model.config, "limit", DEFAULT_LIMIT)
+        return limit
 
     def validate_schedule_config(self) -> str:
         """
@@ -355,4 +413,5 @@ class SchedulerController:
             "  ⚠️  Ctrl+C during generation stops generating — press again to kill server"
         )
         print("=" * 70 + "\n")
+        app.on_shutdown(self.shutdown)
         ui.run(title="Scheduler", reload=False, storage_secret="scheduler_secret_key")
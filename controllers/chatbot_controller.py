@@ -33,6 +33,7 @@ You can:
 - Add, delete, or modify FACULTY members
 - Add, delete, or modify CONFLICTS between courses
 - List all labs, rooms, courses, faculty, and conflicts
+- Delete several courses, rename several rooms, or add several conflicts at once
 
 Rules:
 - Always use a tool to fulfill a request. Do not make up results.
@@ -45,6 +46,7 @@ Rules:
 - When adding a course, ask the user for: course ID, credits, acceptable rooms (comma-separated), acceptable labs (comma-separated, can be empty), and faculty (comma-separated, can be empty).
 - When adding faculty, ask for: name, position (full time or adjunct), max days (default 5), and availability times in the format "MON:08:00-17:00,WED:08:00-17:00".
 - When modifying faculty, ask for their name, then ask which fields to change: position (full time or adjunct), availability times (format 'MON:08:00-17:00'), course preferences (comma-separated course IDs with optional weights like 'CMSC 161:8'), room preferences (comma-separated room names with optional weights), or lab preferences (comma-separated lab names with optional weights). Only pass the fields the user wants to change.
+- When the user asks for the same change to several courses, rooms or conflicts, use the batch tool (delete_courses, rename_rooms, add_conflicts) in a single call.
 - Valid days are: MON, TUE, WED, THU, FRI.
 - All changes are in-memory only. Remind the user to press the Export to Config button to save changes to disk.
 - If the user asks for something outside your capabilities, say so clearly.
@@ -153,6 +155,34 @@ class _ModifyConflictSchema(BaseModel):
     new_course_id_2: str = Field(description="New second course ID")
 
 
+class _DeleteCoursesSchema(BaseModel):
+    course_ids: str = Field(
+        description="Comma-separated course IDs to delete (e.g. 'CMSC 140,CMSC 152')"
+    )
+
+
+class _RenameRoomsSchema(BaseModel):
+    renames: str = Field(
+        description="Comma-separated 'old:new' room pairs (e.g. 'Roddy 136:Roddy 236')"
+    )
+
+
+class _AddConflictsSchema(BaseModel):
+    pairs: str = Field(
+        description="Comma-separated 'course:course' pairs (e.g. 'CMSC 140:CMSC 161')"
+    )
+
+
+def _split_pairs(text: str) -> list[tuple[str, str]]:
+    """Parse 'a:b,c:d' into [('a', 'b'), ('c', 'd')]."""
+    pairs = []
+    for item in text.split(","):
+        if item.strip():
+            left, _, right = item.partition(":")
+            pairs.append((left.strip(), right.strip()))
+    return pairs
+
+
 def requires_config(func):
     """
     Decorator that checks if a configuration is loaded before executing a tool method.
@@ -175,6 +205,33 @@ def requires_config(func):
     return wrapper
 
 
+def edits_in_transaction(func):
+    """
+    Decorator that runs a tool method that edits the configuration as one
+    transaction on the calling (worker) thread.
+
+    The transaction covers only the edit itself, never the time the agent
+    spends thinking, so edits made in the GUI during a turn are neither
+    deferred nor rolled back with it. Invalid results are rolled back and
+    reported back to the agent.
+
+    Parameters:
+        func: The tool method to wrap.
+    Returns:
+        The wrapped function.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            with self.lab_model.config_model.transaction():
+                return func(self, *args, **kwargs)
+        except ValueError as e:
+            return f"The change was rolled back: {e}"
+
+    return wrapper
+
+
 class ChatbotController:
     """
     Wraps LangChain ReAct agent with tools bound to the scheduler's models.
@@ -211,6 +268,7 @@ class ChatbotController:
     # ── Lab tools ────────────────────────────────────────────────────────────
 
     @requires_config
+    @edits_in_transaction
     def _add_lab(self, name: str) -> str:
         result = (
             f"Lab '{name}' added."
@@ -220,6 +278,7 @@ class ChatbotController:
         return result
 
     @requires_config
+    @edits_in_transaction
     def _delete_lab(self, name: str) -> str:
         return (
             f"Lab '{name}' deleted."
@@ -228,6 +287,7 @@ class ChatbotController:
         )
 
     @requires_config
+    @edits_in_transaction
     def _rename_lab(self, old_name: str, new_name: str) -> str:
         return (
             f"Lab renamed from '{old_name}' to '{new_name}'."
@@ -251,6 +311,7 @@ class ChatbotController:
         return ""
 
     @requires_config
+    @edits_in_transaction
     def _add_room(self, name: str) -> str:
         return (
             f"Room '{name}' added."
@@ -259,12 +320,14 @@ class ChatbotController:
         )
 
     @requires_config
+    @edits_in_transaction
     def _delete_room(self, name: str) -> str:
         if self.room_model.delete_room(name):
             return f"Room '{name}' deleted"
         return f"Failed to delete room '{name}' (not found).{self._suggest_room(name)}"
 
     @requires_config
+    @edits_in_transaction
     def _rename_room(self, old_name: str, new_name: str) -> str:
         return (
             f"Room renamed from '{old_name}' to '{new_name}'."
@@ -272,6 +335,14 @@ class ChatbotController:
             else f"Failed to rename room '{old_name}' (not found).{self._suggest_room(old_name)}."
         )
 
+    @requires_config
+    @edits_in_transaction
+    def _rename_rooms(self, renames: str) -> str:
+        mapping = dict(_split_pairs(renames))
+        if mapping and self.room_model.rename_rooms(mapping):
+            return f"Renamed {len(mapping)} room(s)."
+        return "Failed to rename rooms (rooms must exist and new names must be unique)."
+
     @requires_config
     def _get_rooms(self) -> str:
         rooms = self.room_model.get_all_rooms()
@@ -280,6 +351,7 @@ class ChatbotController:
     # ── Course tools ─────────────────────────────────────────────────────────
 
     @requires_config
+    @edits_in_transaction
     def _add_course(
         self, course_id: str, credits: int, rooms: str, labs: str, faculty: str
     ) -> str:
@@ -326,6 +398,7 @@ class ChatbotController:
             return f"Failed to add course '{course_id}': {e}"
 
     @requires_config
+    @edits_in_transaction
     def _delete_course(self, course_id: str) -> str:
         return (
             f"Course '{course_id}' deleted."
@@ -334,6 +407,18 @@ class ChatbotController:
         )
 
     @requires_config
+    @edits_in_transaction
+    def _delete_courses(self, course_ids: str) -> str:
+        ids = [c.strip() for c in course_ids.split(",") if c.strip()]
+        missing = [c for c in ids if not self.course_model.course_exists(c)]
+        if missing:
+            return f"Failed to delete courses: not found: {', '.join(missing)}."
+        if ids and self.course_model.delete_courses(ids):
+            return f"Deleted {len(ids)} course(s): {', '.join(ids)}."
+        return "Failed to delete courses."
+
+    @requires_config
+    @edits_in_transaction
     def _modify_course(self, course_id: str, field: str, value: str) -> str:
         valid_fields = {"credits", "room", "lab", "faculty"}
         if field not in valid_fields:
@@ -402,6 +487,7 @@ class ChatbotController:
         return result
 
     @requires_config
+    @edits_in_transaction
     def _add_faculty(
         self,
         name: str,
@@ -445,6 +531,7 @@ class ChatbotController:
             return f"Failed to add faculty '{name}': {e}"
 
     @requires_config
+    @edits_in_transaction
     def _delete_faculty(self, name: str) -> str:
         if self.faculty_model.delete_faculty(name):
             return f"Faculty '{name}' deleted"
@@ -469,6 +556,7 @@ class ChatbotController:
         return result
 
     @requires_config
+    @edits_in_transaction
     def _modify_faculty(
         self,
         name: str,
@@ -537,6 +625,7 @@ class ChatbotController:
     # ── Conflict tools ────────────────────────────────────────────────────────
 
     @requires_config
+    @edits_in_transaction
     def _add_conflict(self, course_id_1: str, course_id_2: str) -> str:
         ok = self.conflict_model.add_conflict(course_id_1, course_id_2)
         if ok:
@@ -546,6 +635,15 @@ class ChatbotController:
         )
 
     @requires_config
+    @edits_in_transaction
+    def _add_conflicts(self, pairs: str) -> str:
+        parsed = _split_pairs(pairs)
+        if parsed and self.conflict_model.add_conflicts(parsed):
+            return f"Added {len(parsed)} conflict(s)."
+        return "Failed to add conflicts (every course must exist and differ from its pair)."
+
+    @requires_config
+    @edits_in_transaction
     def _delete_conflict(self, course_id_1: str, course_id_2: str) -> str:
         ok = self.conflict_model.delete_conflict(course_id_1, course_id_2)
         if ok:
@@ -553,6 +651,7 @@ class ChatbotController:
         return "Failed to remove conflict (may not exist)."
 
     @requires_config
+    @edits_in_transaction
     def _modify_conflict(
         self,
         old_course_id_1: str,
@@ -626,6 +725,12 @@ class ChatbotController:
                 description="Rename a room",
                 args_schema=_RenameSchema,
             ),
+            StructuredTool.from_function(
+                name="rename_rooms",
+                func=self._rename_rooms,
+                description="Rename several rooms at once",
+                args_schema=_RenameRoomsSchema,
+            ),
             StructuredTool.from_function(
                 name="get_rooms",
                 func=self._get_rooms,
@@ -645,6 +750,12 @@ class ChatbotController:
                 description="Delete a course by ID",
                 args_schema=_DeleteCourseSchema,
             ),
+            StructuredTool.from_function(
+                name="delete_courses",
+                func=self._delete_courses,
+                description="Delete several courses by ID at once",
+                args_schema=_DeleteCoursesSchema,
+            ),
             StructuredTool.from_function(
                 name="modify_course",
                 func=self._modify_course,
@@ -701,6 +812,12 @@ class ChatbotController:
                 description="Add a conflict between two courses",
                 args_schema=_ConflictSchema,
             ),
+            StructuredTool.from_function(
+                name="add_conflicts",
+                func=self._add_conflicts,
+                description="Add conflicts between several pairs of courses at once",
+                args_schema=_AddConflictsSchema,
+            ),
             StructuredTool.from_function(
                 name="delete_conflict",
                 func=self._delete_conflict,
@@ -727,6 +844,9 @@ class ChatbotController:
         Send a query to the agent and return the response text.
 
         Runs the blocking LangChain call in a thread to avoid blocking NiceGUI's event loop.
+        Each editing tool call is its own transaction (see
+        edits_in_transaction), so a failed turn keeps the edits of the tool
+        calls that completed.
 
         Parameters:
             query: The current user message.
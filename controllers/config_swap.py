@@ -0,0 +1,285 @@
+# controllers/config_swap.py
+"""
+ConfigSwap - Build a configuration's model graph and publish it in one step
+
+Loading a configuration creates every model and sub-controller and points
+the controller and the view classes at them. build_graph() does the slow
+part (reading and validating the file) without touching any shared state,
+so it can run on a worker thread. publish() then swaps everything over in
+a single synchronous step, so a page rendered on the event loop sees either
+the old configuration or the new one, never a mix.
+
+Built graphs stay resident in the controller's ConfigWorkspace, so
+switching back to an earlier file only calls publish() again.
+"""
+
+import asyncio
+import os
+
+from config_watcher import WATCH_INTERVAL_ENV
+from controllers.chatbot_controller import ChatbotController
+from controllers.config_workspace import intern_config
+from controllers.conflict_controller import ConflictController
+from controllers.course_controller import CourseController
+from controllers.faculty_controller import FacultyController
+from controllers.lab_controller import LabController
+from controllers.room_controller import RoomController
+from controllers.schedule_controller import ScheduleController
+from models.config_model import ConfigModel
+from models.conflict_model import ConflictModel
+from models.course_model import CourseModel
+from models.faculty_model import FacultyModel
+from models.lab_model import LabModel
+from models.room_model import RoomModel
+from models.scheduler_model import SchedulerModel
+from views.chatbot_gui_view import ChatbotGUIView
+from views.conflict_gui_view import ConflictGUIView
+from views.course_gui_view import CourseGUIView
+from views.faculty_gui_view import FacultyGUIView
+from views.gui_view import GUIView
+from views.lab_gui_view import LabGUIView
+from views.room_gui_view import RoomGUIView
+from views.schedule_gui_view import ScheduleGUIView
+
+# Attributes of SchedulerController that make up a loaded configuration
+GRAPH_ATTRIBUTES = (
+    "config_path",
+    "config_model",
+    "faculty_model",
+    "course_model",
+    "conflict_model",
+    "lab_model",
+    "room_model",
+    "scheduler_model",
+    "faculty_controller",
+    "course_controller",
+    "conflict_controller",
+    "lab_controller",
+    "room_controller",
+    "schedule_controller",
+    "chatbot_controller",
+)
+
+# Serializes concurrent swaps (e.g. two users uploading at once)
+_swap_lock: asyncio.Lock | None = None
+
+
+class ConfigGraph:
+    """
+    All models and sub-controllers for one configuration file.
+
+    Attributes:
+        One attribute per name in GRAPH_ATTRIBUTES.
+    """
+
+    def __init__(self, config_path: str, view):
+        """
+        Load and validate the configuration and build its models and
+        sub-controllers. Touches no shared state.
+
+        Parameters:
+            config_path (str): Path to the JSON config
+            view (GUIView): View passed to the sub-controllers
+
+        Raises:
+            Exception: If the file cannot be read or fails validation
+        """
+        self.config_path = config_path
+        self.config_model = ConfigModel(config_path)
+        try:
+            intern_config(self.config_model.config)
+            self.faculty_model = FacultyModel(self.config_model)
+            self.course_model = CourseModel(self.config_model)
+            self.conflict_model = ConflictModel(self.config_model)
+            self.lab_model = LabModel(self.config_model)
+            self.room_model = RoomModel(self.config_model)
+            self.scheduler_model = SchedulerModel(self.config_model)
+
+            self.faculty_controller = FacultyController(self.faculty_model, view)
+            self.course_controller = CourseController(
+                self.course_model, self.config_model
+            )
+            self.conflict_controller = ConflictController(self.conflict_model, view)
+            self.lab_controller = LabController(self.lab_model, view)
+            self.room_controller = RoomController(self.room_model, view)
+            self.schedule_controller = ScheduleController(self.scheduler_model, view)
+            self.chatbot_controller = ChatbotController(
+                self.lab_model,
+                self.room_model,
+                self.course_model,
+                self.faculty_model,
+                self.conflict_model,
+            )
+
+            self.config_model.enable_write_behind()
+            watch_interval = os.environ.get(WATCH_INTERVAL_ENV)
+            if watch_interval:
+                self.config_model.enable_watch(float(watch_interval))
+        except Exception:
+            self.config_model.close()
+            raise
+
+
+def build_graph(config_path: str, view) -> ConfigGraph:
+    """
+    Build the model graph for a configuration file (safe off the event loop).
+
+    Parameters:
+        config_path (str): Path to the JSON config
+        view (GUIView): View passed to the sub-controllers
+
+    Returns:
+        ConfigGraph: The new models and sub-controllers
+    """
+    return ConfigGraph(config_path, view)
+
+
+def publish(controller, graph: ConfigGraph):
+    """
+    Point the controller and every view class at a new model graph.
+
+    Runs without awaiting, so on the event loop the swap is atomic.
+
+    Parameters:
+        controller (SchedulerController): The application controller
+        graph (ConfigGraph): Graph returned by build_graph()
+
+    Returns:
+        None
+    """
+    from views.schedule_gui_view import _state as _schedule_state
+
+    for name in GRAPH_ATTRIBUTES:
+        setattr(controller, name, getattr(graph, name))
+
+    FacultyGUIView.faculty_model = graph.faculty_model
+    FacultyGUIView.faculty_controller = graph.faculty_controller
+
+    CourseGUIView.course_model = graph.course_model
+    CourseGUIView.course_controller = graph.course_controller
+
+    ConflictGUIView.conflict_model = graph.conflict_model
+    ConflictGUIView.conflict_controller = graph.conflict_controller
+
+    LabGUIView.lab_model = graph.lab_model
+    LabGUIView.lab_controller = graph.lab_controller
+    LabGUIView._lab_controller = graph.lab_controller
+
+    RoomGUIView.room_model = graph.room_model
+    RoomGUIView.room_controller = graph.room_controller
+
+    if _schedule_state is not None:
+        _schedule_state._scheduler_model = graph.scheduler_model
+    ScheduleGUIView.schedule_controller = graph.schedule_controller
+
+    ChatbotGUIView._chatbot_controller = graph.chatbot_controller
+
+    GUIView.controller = controller
+    GUIView.config_path = graph.config_path
+
+
+def _flush_if_resident(controller, config_path: str):
+    """
+    Write the queued temp saves of a file's resident model before loading
+    it again, so they reach the edit journal the new model replays. The
+    resident model stays open and published; if loading fails it is
+    still the current configuration.
+
+    Returns:
+        ConfigGraph | None: The resident graph, to be closed once the new
+            graph is published
+    """
+    graph = controller.workspace.get(config_path)
+    if graph is not None:
+        graph.config_model.flush_saves()
+    return graph
+
+
+def _make_resident(controller, graph: ConfigGraph) -> list:
+    """
+    Add a graph to the workspace and publish it.
+
+    Returns:
+        list[ConfigGraph]: Graphs evicted from the workspace, to be closed
+    """
+    evicted = controller.workspace.add(graph)
+    publish(controller, graph)
+    return evicted
+
+
+def swap_config(controller, config_path: str) -> None:
+    """
+    Load a configuration and publish it, synchronously.
+
+    Other resident configurations stay loaded.
+
+    Parameters:
+        controller (SchedulerController): The application controller
+        config_path (str): Path to the JSON config
+
+    Raises:
+        Exception: If the configuration cannot be loaded; the current
+            configuration stays in place
+    """
+    replaced = _flush_if_resident(controller, config_path)
+    graph = build_graph(config_path, controller.view)
+    evicted = _make_resident(controller, graph)
+    if replaced is not None:
+        evicted.append(replaced)
+    for old in evicted:
+        old.config_model.close()
+
+
+async def swap_config_async(controller, config_path: str) -> tuple[bool, str]:
+    """
+    Load a configuration on a worker thread and publish it on the event loop.
+
+    Other users keep working with the current configuration while a large
+    file is read and validated. Concurrent swaps are applied in order.
+
+    Parameters:
+        controller (SchedulerController): The application controller
+        config_path (str): Path to the JSON config
+
+    Returns:
+        tuple[bool, str]: (True, '') on success, (False, error message) on
+            failure, in which case the current configuration stays in place
+    """
+    global _swap_lock
+    if _swap_lock is None:
+        _swap_lock = asyncio.Lock()
+    async with _swap_lock:
+        try:
+            replaced = await asyncio.to_thread(
+                _flush_if_resident, controller, config_path
+            )
+            graph = await asyncio.to_thread(build_graph, config_path, controller.view)
+        except (OSError, ValueError) as e:
+            return False, str(e)
+        evicted = _make_resident(controller, graph)
+        if replaced is not None:
+            evicted.append(replaced)
+        for old in evicted:
+            # Flushing pending saves is file I/O; keep it off the event loop
+            await asyncio.to_thread(old.config_model.close)
+        return True, ""
+
+
+def switch_config(controller, config_path: str) -> tuple[bool, str]:
+    """
+    Publish a resident configuration. Takes constant time: nothing is
+    read or rebuilt.
+
+    Parameters:
+        controller (SchedulerController): The application controller
+        config_path (str): Path of a config loaded earlier
+
+    Returns:
+        tuple[bool, str]: (True, '') on success, (False, error message) if
+            the file is not resident
+    """
+    graph = controller.workspace.activate(config_path)
+    if graph is None:
+        return False, f"{config_path} is not loaded."
+    publish(controller, graph)
+    return True, ""
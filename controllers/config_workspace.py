@@ -0,0 +1,221 @@
+# controllers/config_workspace.py
+"""
+ConfigWorkspace - Several loaded configurations kept in memory at once
+
+Departments and terms are usually kept in separate config files. The
+workspace keeps the model graph of each loaded file resident so switching
+between them only republishes an already-built graph instead of re-reading
+and re-validating the JSON.
+
+Names that recur across files (rooms, labs, courses, faculty, days) are
+interned when a config is loaded, so resident configs share one copy of
+each string.
+"""
+
+import os
+import sys
+from collections import OrderedDict
+
+# Environment variable capping the number of resident configs
+MAX_RESIDENT_ENV = "SCHEDULER_MAX_RESIDENT_CONFIGS"
+DEFAULT_MAX_RESIDENT = 4
+
+
+def _intern_list(values: list) -> None:
+    values[:] = [sys.intern(v) if type(v) is str else v for v in values]
+
+
+def _intern_keys(mapping: dict) -> None:
+    items = [(sys.intern(k) if type(k) is str else k, v) for k, v in mapping.items()]
+    mapping.clear()
+    mapping.update(items)
+
+
+def intern_config(config) -> None:
+    """
+    Replace the names in a CombinedConfig with interned strings, in place.
+
+    Entity names are assigned normally; validating an equal string keeps
+    the interned object, so the swap costs one field validation each.
+
+    Parameters:
+        config (CombinedConfig): Configuration to intern
+
+    Returns:
+        None
+    """
+    _intern_list(config.config.rooms)
+    _intern_list(config.config.labs)
+    for course in config.config.courses:
+        course.course_id = sys.intern(course.course_id)
+        _intern_list(course.room)
+        _intern_list(course.lab)
+        _intern_list(course.conflicts)
+        _intern_list(course.faculty)
+    for faculty in config.config.faculty:
+        faculty.name = sys.intern(faculty.name)
+        _intern_keys(faculty.times)
+        _intern_keys(faculty.course_preferences)
+        _intern_keys(faculty.room_preferences)
+        _intern_keys(faculty.lab_preferences)
+
+
+def _object_sizes(root) -> dict[int, int]:
+    """
+    Return id -> size in bytes of every object reachable from a config.
+    """
+    sizes: dict[int, int] = {}
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in sizes:
+            continue
+        sizes[id(obj)] = sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__") and not isinstance(obj, type):
+            stack.append(obj.__dict__)
+    return sizes
+
+
+class ConfigWorkspace:
+    """
+    Resident model graphs keyed by config file, least recently used first.
+
+    Once more than max_resident configs are loaded, the least recently used
+    inactive ones are closed and dropped.
+
+    Attributes:
+        max_resident (int): Maximum number of resident configs
+        active (str | None): Absolute path of the published config
+    """
+
+    def __init__(self, max_resident: int | None = None):
+        """
+        Parameters:
+            max_resident (int | None): Maximum number of resident configs;
+                defaults to SCHEDULER_MAX_RESIDENT_CONFIGS or 4
+        """
+        if max_resident is None:
+            max_resident = int(os.environ.get(MAX_RESIDENT_ENV) or DEFAULT_MAX_RESIDENT)
+        self.max_resident = max(max_resident, 1)
+        self.active: str | None = None
+        self._graphs: OrderedDict = OrderedDict()
+
+    @staticmethod
+    def key(config_path: str) -> str:
+        """
+        Return the key a config file is stored under.
+        """
+        return os.path.abspath(config_path)
+
+    def paths(self) -> list[str]:
+        """
+        Return the paths of the resident configs, least recently used first.
+        """
+        return [graph.config_path for graph in self._graphs.values()]
+
+    def get(self, config_path: str):
+        """
+        Return the resident graph for a file, or None.
+        """
+        return self._graphs.get(self.key(config_path))
+
+    def add(self, graph) -> list:
+        """
+        Make a graph resident and mark it as active.
+
+        Parameters:
+            graph (ConfigGraph): Newly built graph
+
+        Returns:
+            list[ConfigGraph]: Graphs evicted to stay within max_resident;
+                the caller must close their config models
+        """
+        key = self.key(graph.config_path)
+        self._graphs[key] = graph
+        self.activate(graph.config_path)
+        evicted = []
+        for other in list(self._graphs):
+            if len(self._graphs) <= self.max_resident:
+                break
+            if other != key:
+                evicted.append(self._graphs.pop(other))
+        return evicted
+
+    def activate(self, config_path: str):
+        """
+        Mark a resident config as active.
+
+        Returns:
+            ConfigGraph | None: Its graph, or None if it is not resident
+        """
+        key = self.key(config_path)
+        graph = self._graphs.get(key)
+        if graph is not None:
+            self._graphs.move_to_end(key)
+            self.active = key
+        return graph
+
+    def remove(self, config_path: str):
+        """
+        Drop a config from the workspace without closing it.
+
+        Returns:
+            ConfigGraph | None: The removed graph, or None if not resident
+        """
+        key = self.key(config_path)
+        if key == self.active:
+            self.active = None
+        return self._graphs.pop(key, None)
+
+    def memory_report(self) -> list[dict]:
+        """
+        Estimate the memory held by each resident config.
+
+        Objects reachable from several configs (interned names, shared
+        day and preference values) are reported once, as shared bytes.
+
+        Returns:
+            list[dict]: One entry per config with 'path', 'active',
+                'bytes' (held only by this config), 'shared_bytes' and
+                'history_bytes' (undo/redo snapshots)
+        """
+        sizes = {
+            key: _object_sizes(graph.config_model.config)
+            for key, graph in self._graphs.items()
+        }
+        owners: dict[int, int] = {}
+        for object_sizes in sizes.values():
+            for object_id in object_sizes:
+                owners[object_id] = owners.get(object_id, 0) + 1
+        report = []
+        for key, graph in self._graphs.items():
+            own = shared = 0
+            for object_id, size in sizes[key].items():
+                if owners[object_id] > 1:
+                    shared += size
+                else:
+                    own += size
+            report.append(
+                {
+                    "path": graph.config_path,
+                    "active": key == self.active,
+                    "bytes": own,
+                    "shared_bytes": shared,
+                    "history_bytes": graph.config_model.history.memory_usage(),
+                }
+            )
+        return report
+
+    def close(self) -> None:
+        """
+        Close every resident config and empty the workspace.
+        """
+        for graph in self._graphs.values():
+            graph.config_model.close()
+        self._graphs.clear()
+        self.active = None
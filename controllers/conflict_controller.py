@@ -7,8 +7,11 @@ This controller class manages all conflict workflows including:
 - Modifying existing conflicts
 - Deleting conflicts
 - Validating conflict data
+- Analysing the conflict graph
 """
 
+from conflict_analytics import analyze_conflicts
+
 
 class ConflictController:
     """
@@ -58,6 +61,21 @@ class ConflictController:
             result.append((label, idx, course))
         return result
 
+    def get_sections(self) -> list:
+        """
+        Return courses as (label, section_id, course) with stable section ids.
+
+        Parameters:
+            None
+        Returns:
+            list: Tuples of (section_label, section_id, course_object).
+        """
+        ids = self.config_model.index.section_ids()
+        return [
+            (label, ids[idx], course)
+            for label, idx, course in self.get_courses_with_sections()
+        ]
+
     def gui_get_all_conflicts(self) -> list[tuple[str, str, int, int]]:
         """
         Get all config-level conflict pairs for display.
@@ -88,6 +106,32 @@ class ConflictController:
             result[f"{label1}  ↔  {label2}"] = (c1, c2, i1, i2)
         return result
 
+    def get_conflict_analysis(self) -> dict:
+        """
+        Analyse the section conflict graph against the available time slots.
+
+        Parameters:
+            None
+        Returns:
+            dict: Output of analyze_conflicts(), with each cluster's
+                'sections' and 'clique' and the 'unteachable' sections given
+                as section labels.
+        """
+        config = self.config_model.config
+        analysis = analyze_conflicts(
+            self.model.get_section_conflict_graph(),
+            config.config.courses,
+            config.time_slot_config,
+            faculty=config.config.faculty,
+            slots=self.config_model.time_slots(),
+        )
+        labels = {idx: label for label, idx, _ in self.get_courses_with_sections()}
+        for cluster in analysis["clusters"]:
+            cluster["sections"] = [labels[i] for i in cluster["sections"]]
+            cluster["clique"] = [labels[i] for i in cluster["clique"]]
+        analysis["unteachable"] = [labels[i] for i in analysis["unteachable"]]
+        return analysis
+
     def gui_validate_delete(
         self,
         index_1: int,
@@ -123,6 +167,8 @@ class ConflictController:
         course_id_b: str,
         section_index_a: int | None = None,
         section_index_b: int | None = None,
+        section_id_a: int | None = None,
+        section_id_b: int | None = None,
     ) -> tuple[bool, str]:
         """
         Add a conflict between two courses and temp-save.
@@ -136,17 +182,39 @@ class ConflictController:
             course_id_b     (str):      Second course ID.
             section_index_a (int|None): Global index of first section, or None.
             section_index_b (int|None): Global index of second section, or None.
+            section_id_a    (int|None): Stable id of first section, instead of an index.
+            section_id_b    (int|None): Stable id of second section, instead of an index.
         Returns:
             tuple[bool, str]: (success, message)
         """
         ok = self.model.add_conflict(
-            course_id_a, course_id_b, section_index_a, section_index_b
+            course_id_a,
+            course_id_b,
+            section_index_a,
+            section_index_b,
+            section_id_1=section_id_a,
+            section_id_2=section_id_b,
         )
         if ok:
             self.config_model.save_feature("temp", "courses")
             return True, f"Conflict added between '{course_id_a}' and '{course_id_b}'."
         return False, "Failed to add conflict."
 
+    def add_conflicts(self, pairs: list[tuple[str, str]]) -> tuple[bool, str]:
+        """
+        Add conflicts between all sections of several course pairs and
+        temp-save once.
+
+        Parameters:
+            pairs (list[tuple[str, str]]): (course_id_a, course_id_b) pairs.
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        if self.model.add_conflicts(pairs):
+            self.config_model.save_feature("temp", "courses")
+            return True, f"{len(pairs)} conflict(s) added."
+        return False, "Failed to add conflicts."
+
     def gui_delete_conflict(
         self,
         section_id_1: str,
@@ -38,6 +38,10 @@ class CourseController:
         """Return list of (section_label, index, course_object)."""
         return self.model.get_courses_with_sections()
 
+    def get_sections(self) -> list:
+        """Return list of (section_label, section_id, course_object) with stable ids."""
+        return self.model.get_sections()
+
     def get_available_resources(self) -> dict:
         """
         Return available rooms, labs, and faculty for GUI dropdowns.
@@ -94,8 +98,9 @@ class CourseController:
     def modify_course(
         self,
         course_id: str,
-        section_index: int,
+        section_index: int | None,
         modifications: dict,
+        section_id: int | None = None,
     ) -> tuple[bool, str]:
         """
         Validate, apply modifications to a course section, and temp-save.
@@ -104,6 +109,7 @@ class CourseController:
             course_id     (str):  Course ID.
             section_index (int):  Section index to modify.
             modifications (dict): Fields to update.
+            section_id    (int|None): Stable section id, instead of section_index.
         Returns:
             tuple[bool, str]: (success, message)
         """
@@ -117,7 +123,7 @@ class CourseController:
                 return False, error_msg
 
             success = self.model.modify_course(
-                course_id, section_index=section_index, **updates
+                course_id, section_index=section_index, section_id=section_id, **updates
             )
             if success:
                 self.config_model.save_feature("temp", "all")
@@ -127,7 +133,10 @@ class CourseController:
             return False, f"Failed to modify course: {e}"
 
     def delete_course(
-        self, course_id: str, section_index: int | None = None
+        self,
+        course_id: str,
+        section_index: int | None = None,
+        section_id: int | None = None,
     ) -> tuple[bool, str]:
         """
         Delete a course section (or all sections) and temp-save.
@@ -135,10 +144,15 @@ class CourseController:
         Parameters:
             course_id     (str):      Course ID to delete.
             section_index (int|None): Section index to delete, or None for all.
+            section_id    (int|None): Stable section id, instead of section_index.
         Returns:
             tuple[bool, str]: (success, message)
         """
         try:
+            if section_id is not None:
+                section_index = self.model.section_position(section_id)
+                if section_index is None:
+                    return False, f"That section of '{course_id}' no longer exists."
             # Calculate 1-based relative section number before deletion
             display_index = section_index
             if section_index is not None:
@@ -149,7 +163,7 @@ class CourseController:
                         if all_courses[i].course_id == course_id:
                             display_index += 1
 
-            success = self.model.delete_course(course_id, section_index)
+            success = self.model.delete_course(course_id, section_index, section_id)
             if success:
                 self.config_model.save_feature("temp", "courses")
                 label = (
@@ -162,6 +176,29 @@ class CourseController:
         except Exception as e:
             return False, f"Failed to delete course: {e}"
 
+    def delete_courses(self, course_ids: list[str]) -> tuple[bool, str]:
+        """
+        Delete every section of several courses and temp-save once.
+
+        Parameters:
+            course_ids (list[str]): Course IDs to delete.
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        course_ids = list(dict.fromkeys(c.strip() for c in course_ids if c.strip()))
+        if not course_ids:
+            return False, "No courses selected."
+        missing = [c for c in course_ids if not self.model.course_exists(c)]
+        if missing:
+            return False, f"Courses not found: {', '.join(missing)}."
+        try:
+            if self.model.delete_courses(course_ids):
+                self.config_model.save_feature("temp", "all")
+                return True, f"{len(course_ids)} course(s) deleted successfully."
+            return False, "Failed to delete courses."
+        except ValueError as e:
+            return False, f"Failed to delete courses: {e}"
+
     def _build_course_config(self, data: dict):
         return self.model.build_course_config(data)
 
@@ -56,6 +56,10 @@ class FacultyController:
         """Return list of all faculty names."""
         return [f.name for f in self.model.get_all_faculty()]
 
+    def get_slot_fit(self, name: str) -> dict[int, tuple[int, int]]:
+        """Return credits -> (fitting, total) time slots for a faculty member."""
+        return self.model.get_slot_fit(name)
+
     # ------------------------------------------------------------------
     # GUI command methods — all return (bool, str) and temp-save
     # ------------------------------------------------------------------
@@ -85,6 +89,28 @@ class FacultyController:
         except Exception as e:
             return False, f"Error adding faculty: {e}"
 
+    def add_faculty_many(self, faculty_data: list[dict]) -> tuple[bool, str]:
+        """
+        Add several faculty members and temp-save once.
+
+        Every entry is validated before anything is added.
+
+        Parameters:
+            faculty_data (list[dict]): Faculty data, one dict per member.
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        if not faculty_data:
+            return False, "No faculty to add."
+        try:
+            configs = [self._build_faculty_config(data) for data in faculty_data]
+        except (KeyError, TypeError, ValueError) as e:
+            return False, f"Error adding faculty: {e}"
+        if self.model.add_faculty_many(configs):
+            self.model.config_model.save_feature("temp", "faculty")
+            return True, f"{len(configs)} faculty member(s) saved to memory."
+        return False, "Failed to add faculty — names must be new and unique."
+
     def add_faculty_if_not_exists(self, faculty_data: dict) -> tuple[bool, str]:
         """
         Add faculty only if not already present. Used by save-to-config flow.
@@ -75,6 +75,26 @@ class RoomController:
             return True, "Room modified in memory."
         return False, "Modification failed."
 
+    def rename_rooms(self, renames: dict[str, str]) -> tuple[bool, str]:
+        """
+        Rename several rooms in memory and temp-save once.
+
+        Parameters:
+            renames (dict[str, str]): Current room name -> new room name.
+        Returns:
+            tuple[bool, str]: (success, message)
+        """
+        renames = {old: (new or "").strip() for old, new in renames.items()}
+        if not renames:
+            return False, "No rooms selected."
+        if any(not new for new in renames.values()):
+            return False, "New room names cannot be empty."
+        success = self.model.rename_rooms(renames)
+        if success:
+            self.config_model.save_feature("temp", "all")
+            return True, f"{len(renames)} room(s) renamed in memory."
+        return False, "Renaming failed — rooms must exist and names must be unique."
+
     def delete_room(self, name: str) -> tuple[bool, str]:
         """
         Delete a room from memory and temp-save.
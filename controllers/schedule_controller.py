@@ -8,9 +8,125 @@ This controller class manages schedule generation workflows including:
 - Displaying schedules
 """
 
+import bz2
+import gzip
+import io
+import lzma
+import multiprocessing
 import os
+import struct
+import zlib
+from collections.abc import Callable, Sequence
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from models.lazy_schedules import LazyScheduleList
+
+# File extension of the binary schedule archive format
+ARCHIVE_EXTENSION = ".sarc"
+
+# Compression suffix -> (module used to read it, factory for a streaming compressor)
+COMPRESSION_CODECS = {
+    ".gz": (gzip, lambda: zlib.compressobj(wbits=31)),
+    ".xz": (lzma, lzma.LZMACompressor),
+    ".bz2": (bz2, bz2.BZ2Compressor),
+}
+
+# Errors a malformed, truncated or unreadable schedule file raises when parsed
+PARSE_ERRORS = (
+    OSError,
+    EOFError,
+    ValueError,
+    KeyError,
+    IndexError,
+    TypeError,
+    lzma.LZMAError,
+    struct.error,
+    zlib.error,
+)
+
+
+def split_compression(file_name: str) -> tuple[str, str | None]:
+    """
+    Split a compression suffix off a file name.
+
+    e.g. 'week1.csv.gz' -> ('week1.csv', '.gz'), 'week1.csv' -> ('week1.csv', None)
+    """
+    for suffix in COMPRESSION_CODECS:
+        if file_name.endswith(suffix):
+            return file_name[: -len(suffix)], suffix
+    return file_name, None
+
+
+def compress_stream(chunks, compression: str):
+    """
+    Compress a stream of byte chunks incrementally.
+
+    Parameters:
+        chunks (Iterable[bytes]): Uncompressed chunks
+        compression (str): Compression suffix ('.gz', '.xz' or '.bz2')
+
+    Returns:
+        Iterator[bytes]: Compressed chunks
+    """
+    compressor = COMPRESSION_CODECS[compression][1]()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+# Extensions (before any compression suffix) that can be imported
+IMPORTABLE_EXTENSIONS = (".csv", ".json", ".ndjson", ARCHIVE_EXTENSION)
+
+# Called as (file_name, files_done, files_total, message) after each file
+ImportProgressCallback = Callable[[str, int, int, str], None]
+
+
+def _worker_context():
+    """
+    Return a start method that is safe with background threads running
+    (the write-behind saver), since fork() may copy held locks.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def is_importable(file_name: str) -> bool:
+    """
+    Return True if the file name has a supported schedule extension.
+    """
+    base_name, _ = split_compression(file_name)
+    return base_name.endswith(IMPORTABLE_EXTENSIONS)
+
+
+def is_archive(file_name: str) -> bool:
+    """
+    Return True if the file is a (possibly compressed) binary schedule archive.
+    """
+    base_name, _ = split_compression(file_name)
+    return base_name.endswith(ARCHIVE_EXTENSION)
+
+
+def _parse_schedule_file(file_name: str, file_data: bytes | Path) -> list:
+    """
+    Parse one schedule file in a worker process.
+
+    Kept at module level so ProcessPoolExecutor can pickle it. A Path is
+    read inside the worker so file contents are not copied between processes.
+    """
+    from models.scheduler_model import SchedulerModel
+
+    if isinstance(file_data, Path):
+        file_data = file_data.read_bytes()
+
+    return ScheduleController(SchedulerModel(None), None).import_schedule_file(
+        file_name, file_data
+    )
+
 
 class ScheduleController:
     """
@@ -38,40 +154,292 @@ class ScheduleController:
         self.model = scheduler_model
         self.view = view
 
-    def import_schedule_file(self, fileName, fileData):
+    def import_schedule_file(self, fileName, fileData, lazy: bool = False):
         """
         Handles file import request from the view.
         Determines file type and delegates parsing to model.
+
+        Files compressed with gzip, xz or bzip2 (e.g. 'week1.csv.gz',
+        'week1.ndjson.xz') are decompressed on the fly while parsing.
+
+        With lazy=True only schedule boundaries are indexed and each
+        schedule is parsed the first time it is viewed (compressed files
+        are decompressed in full first so they can be indexed).
         """
 
-        if fileName.endswith(".json"):
-            schedules = self.model.import_from_json(fileData)
-        elif fileName.endswith(".csv"):
-            schedules = self.model.import_from_csv(fileData)
+        base_name, compression = split_compression(fileName)
+
+        if lazy:
+            if compression is not None:
+                fileData = COMPRESSION_CODECS[compression][0].decompress(fileData)
+            format_type = os.path.splitext(base_name)[1].lstrip(".")
+            schedules = self.model.open_lazy(fileData, format_type)
+        elif compression is None:
+            if base_name.endswith(".json"):
+                schedules = self.model.import_from_json(fileData)
+            elif base_name.endswith(".ndjson"):
+                schedules = self.model.import_from_ndjson(fileData)
+            elif base_name.endswith(".csv"):
+                schedules = self.model.import_from_csv(fileData)
+            elif base_name.endswith(ARCHIVE_EXTENSION):
+                schedules = self.model.import_from_archive(fileData)
+            else:
+                raise ValueError("Unsupported file type")
         else:
-            raise ValueError("Unsupported file type")
+            codec = COMPRESSION_CODECS[compression][0]
+            if base_name.endswith(ARCHIVE_EXTENSION):
+                # Random access needs the decompressed bytes
+                schedules = self.model.import_from_archive(codec.decompress(fileData))
+            else:
+                schedules = self._import_compressed(base_name, codec, fileData)
+
+        return schedules
+
+    def merge_schedules(self, current, new):
+        """
+        Append newly imported schedules to the loaded ones.
 
-        # Update config_path so saves go to the imported file, not the original CLI config
-        if schedules and self.model.config_model:
-            self.model.config_model.config_path = os.path.join(
-                os.path.dirname(self.model.config_model.config_path), fileName
+        Lazily imported schedules stay unparsed: if either side is lazy the
+        result is a LazyScheduleList, otherwise current is extended in place.
+
+        Parameters:
+            current (Sequence[list]): Schedules already loaded
+            new (Sequence[list]): Schedules just imported
+        Returns:
+            Sequence[list]: The combined schedules
+        """
+        if isinstance(new, LazyScheduleList) and not isinstance(
+            current, LazyScheduleList
+        ):
+            merged = LazyScheduleList()
+            merged.extend(current)
+            current = merged
+        current += new
+        return current
+
+    def dedup_snapshot(self, schedules) -> tuple:
+        """
+        Return the loaded schedules an import should be deduplicated against.
+
+        Lazily indexed schedules that were never viewed are left out rather
+        than parsed. Call this on the thread that owns the list and hand the
+        returned tuple to import_schedule_files() on a worker.
+
+        Parameters:
+            schedules (Sequence[list]): Schedules already loaded
+        Returns:
+            tuple: Schedules already in memory
+        """
+        if isinstance(schedules, LazyScheduleList):
+            return tuple(schedules.loaded())
+        return tuple(schedules)
+
+    def import_schedule_files(
+        self,
+        files: list[tuple[str, bytes | Path]],
+        existing: Sequence[list] | None = None,
+        progress_callback: ImportProgressCallback | None = None,
+        max_workers: int | None = None,
+    ) -> tuple[list, list[dict]]:
+        """
+        Import several schedule files at once, parsing them in parallel.
+
+        Files are parsed across a process pool. Schedules whose fingerprint
+        matches an already loaded schedule (or one imported earlier in the
+        same batch) are skipped. Files are merged in the order given, so
+        the result does not depend on which worker finishes first.
+
+        Parameters:
+            files (list[tuple[str, bytes | Path]]): (file name, contents or
+                path to read) pairs
+            existing (Sequence[list] | None): Schedules already loaded, for
+                deduplication (see dedup_snapshot())
+            progress_callback (ImportProgressCallback | None): Called after
+                each file finishes parsing
+            max_workers (int | None): Process pool size (default: CPU count)
+        Returns:
+            tuple[list, list[dict]]: (new schedules, per-file report). Each
+                report has 'file', 'imported', 'duplicates' and 'error' keys.
+        """
+        total = len(files)
+        parsed: dict[int, list] = {}
+        errors: dict[int, str] = {}
+
+        def finished(i: int, done: int) -> None:
+            if progress_callback:
+                name = files[i][0]
+                message = errors.get(i) or f"Parsed {len(parsed[i])} schedule(s)"
+                progress_callback(name, done, total, message)
+
+        if total <= 1:
+            for i, (name, data) in enumerate(files):
+                try:
+                    parsed[i] = _parse_schedule_file(name, data)
+                except PARSE_ERRORS as e:
+                    errors[i] = str(e)
+                finished(i, i + 1)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=_worker_context()
+            ) as pool:
+                futures = {
+                    pool.submit(_parse_schedule_file, name, data): i
+                    for i, (name, data) in enumerate(files)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    i = futures[future]
+                    try:
+                        parsed[i] = future.result()
+                    except (*PARSE_ERRORS, BrokenExecutor) as e:
+                        errors[i] = str(e)
+                    finished(i, done)
+
+        seen = {self.model.schedule_fingerprint(s) for s in existing or []}
+        new_schedules = []
+        report = []
+        for i, (name, _) in enumerate(files):
+            imported = duplicates = 0
+            for schedule in parsed.get(i, []):
+                fingerprint = self.model.schedule_fingerprint(schedule)
+                if fingerprint in seen:
+                    duplicates += 1
+                    continue
+                seen.add(fingerprint)
+                new_schedules.append(schedule)
+                imported += 1
+            report.append(
+                {
+                    "file": name,
+                    "imported": imported,
+                    "duplicates": duplicates,
+                    "error": errors.get(i),
+                }
             )
+        return new_schedules, report
+
+    def import_schedule_directory(
+        self,
+        directory: str,
+        existing: Sequence[list] | None = None,
+        progress_callback: ImportProgressCallback | None = None,
+        max_workers: int | None = None,
+    ) -> tuple[list, list[dict]]:
+        """
+        Import every supported schedule file in a directory.
 
-        return schedules
+        Parameters:
+            directory (str): Directory containing schedule files
+            existing (Sequence[list] | None): Schedules already loaded, for
+                deduplication (see dedup_snapshot())
+            progress_callback (ImportProgressCallback | None): Per-file progress
+            max_workers (int | None): Process pool size (default: CPU count)
+        Returns:
+            tuple[list, list[dict]]: Same as import_schedule_files()
+        """
+        files = []
+        for entry in sorted(Path(directory).iterdir()):
+            if entry.is_file() and is_importable(entry.name):
+                files.append((entry.name, entry))
+        return self.import_schedule_files(
+            files, existing, progress_callback, max_workers
+        )
+
+    def _import_compressed(self, base_name: str, codec, file_data: bytes) -> list:
+        """
+        Parse a compressed text export without decompressing it up front.
 
-    def export_schedules(self, format_type, schedules):
+        Parameters:
+            base_name (str): File name with the compression suffix removed
+            codec (module): gzip, lzma or bz2
+            file_data (bytes): Compressed file contents
+        Returns:
+            list: Parsed schedules
+        """
+        with codec.open(io.BytesIO(file_data), "rt", encoding="utf-8") as stream:
+            if base_name.endswith(".ndjson"):
+                return list(self.model.iter_ndjson(stream))
+            if base_name.endswith(".json"):
+                return list(self.model.iter_json(stream))
+            if base_name.endswith(".csv"):
+                return list(self.model.iter_csv(stream))
+        raise ValueError("Unsupported file type")
+
+    def export_schedules(
+        self,
+        format_type,
+        schedules,
+        compact: bool = False,
+        compression: str | None = None,
+    ):
         """
         Handles file export request from view
         Determines file type and delegates to model
         """
+        return b"".join(
+            self.stream_schedules(format_type, schedules, compact, compression)
+        )
+
+    def stream_schedules(
+        self,
+        format_type,
+        schedules,
+        compact: bool = False,
+        compression: str | None = None,
+    ):
+        """
+        Handles a streaming export request from the view.
+
+        Returns an iterator of encoded chunks so large exports can be sent
+        to the browser without building the whole document in memory.
+
+        Parameters:
+            format_type (str): 'csv', 'json', 'ndjson' or 'sarc' (binary archive)
+            schedules (Iterable[list]): Schedules to export
+            compact (bool): Omit JSON indentation (ignored for csv/ndjson)
+            compression (str | None): '.gz', '.xz', '.bz2' or None
+
+        Returns:
+            Iterator[bytes]: Encoded (and optionally compressed) export chunks
+
+        Raises:
+            ValueError: If the format or compression is not supported
+        """
+        if compression is not None:
+            if compression not in COMPRESSION_CODECS:
+                raise ValueError("Unsupported compression")
+            return compress_stream(
+                self.stream_schedules(format_type, schedules, compact), compression
+            )
+
         if format_type == "json":
-            return self.model.export_to_json(schedules)
+            return self.model.stream_json(schedules, indent=None if compact else 2)
+
+        if format_type == "ndjson":
+            return self.model.stream_ndjson(schedules)
 
         if format_type == "csv":
-            return self.model.export_to_csv(schedules)
+            return self.model.stream_csv(schedules)
+
+        if format_type == ARCHIVE_EXTENSION.lstrip("."):
+            return self.model.stream_archive(schedules)
 
         raise ValueError("Unsupported export format")
 
+    def open_schedule_archive(self, path: str):
+        """
+        Open a binary schedule archive on disk for random access.
+
+        The file is memory-mapped, so even very large archives open
+        instantly and any single schedule loads in O(1).
+
+        Parameters:
+            path (str): Path to a schedule archive file
+
+        Returns:
+            ScheduleArchive: Sequence of schedules (call close() when done)
+        """
+        return self.model.open_archive(path)
+
     def run_scheduler(self):
         """
         Complete workflow for running the scheduler.
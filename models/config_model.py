@@ -6,8 +6,37 @@ This model class manages loading, saving, and accessing the scheduler configurat
 All other models use ConfigModel to interact with the configuration file.
 """
 
-from scheduler import load_config_from_file, CombinedConfig
-from safe_save import safe_save, save_configuration
+import functools
+import threading
+
+from scheduler import CombinedConfig
+from config_snapshot import load_config
+from config_metadata import forget_metadata, get_metadata
+from safe_save import SECTIONS, DirtyState, safe_save, save_configuration
+from config_journal import ConfigJournal
+from write_behind import DEFAULT_INTERVAL, WriteBehindSaver
+from config_watcher import ConfigWatcher
+from config_diff import diff_configs
+from config_history import ConfigHistory
+from config_index import ConfigIndex
+from config_transaction import ConfigTransaction
+from slot_table import SlotTable
+
+
+def edits_config(method):
+    """
+    Decorator for model methods that change the live configuration.
+
+    The method runs while holding its config model's lock, so the
+    background saver and watcher never read a half-applied edit.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.config_model.lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
 
 
 class ConfigModel:
@@ -17,20 +46,331 @@ class ConfigModel:
     Attributes:
         config_path (str): Path to configuration JSON file
         config (CombinedConfig): Loaded configuration object
+        dirty (DirtyState): Sections and entities changed since the last save
+        journal (ConfigJournal | None): Edit journal used for temp saves
+        history (ConfigHistory): Undo/redo history of in-memory edits
+        index (ConfigIndex): Lookup index of rooms, labs, courses and faculty
+        active_transaction (ConfigTransaction): Edit session opened with
+            transaction(); saves are deferred while it is active
+        saver (WriteBehindSaver | None): Background saver for temp saves,
+            if enabled with enable_write_behind()
+        watcher (ConfigWatcher | None): Applies external edits of the file,
+            if enabled with enable_watch()
+        slot_version (int): dirty.version of the last change to the time
+            slot config, which the SlotTable from time_slots() is built at
+        lock (threading.RLock): Held while the live config is changed (see
+            edits_config) and while background threads serialize it. Never
+            save while holding it: saves wait for the background saver.
     """
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, use_journal: bool = True):
         """
         Initialize ConfigModel.
 
+        Unchanged files load from a validated snapshot (see config_snapshot).
+        If an edit journal from an earlier session exists (e.g. after a
+        crash), it is replayed so unsaved edits are restored. A journal that
+        cannot be replayed is moved aside and the config file is loaded.
+
         Parameters:
             config_path (str): Path to configuration JSON file
+            use_journal (bool): Append temp saves to an edit journal instead
+                of rewriting the '.temp' file
 
         Returns:
             None
         """
         self.config_path = config_path
-        self.config = load_config_from_file(CombinedConfig, config_path)
+        self.lock = threading.RLock()
+        forget_metadata(config_path)
+        self.dirty = DirtyState()
+        self.saver = None
+        self.watcher = None
+        self.journal = ConfigJournal(config_path) if use_journal else None
+        replayed = None
+        if self.journal is not None and self.journal.has_pending():
+            try:
+                replayed = CombinedConfig(**self.journal.replay())
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                moved = self.journal.set_aside()
+                print(
+                    f"WARNING: edit journal could not be replayed ({e}); "
+                    f"moved aside to {', '.join(moved)}"
+                )
+        if replayed is not None:
+            self.config = replayed
+            # Memory matches the journal but not the config file
+            self.dirty.reset()
+            for section in SECTIONS:
+                self.dirty.mark(section)
+            self.dirty.synced()
+        else:
+            self.config = load_config(config_path)
+            if self.journal is not None:
+                self.journal.start()
+                self.dirty.synced()
+        self.history = ConfigHistory()
+        self.history.reset(self.config)
+        self.index = ConfigIndex(self.config)
+        self.active_transaction = ConfigTransaction(self)
+        self.slot_version = self.dirty.version
+        self._slot_table: SlotTable | None = None
+        self._slot_table_version = self.slot_version
+        self._committed: tuple[str, CombinedConfig] | None = None
+
+    def transaction(self) -> ConfigTransaction:
+        """
+        Group several edits into one validated, all-or-nothing step.
+
+        Use as a context manager. Saves requested inside are deferred and
+        published once at the end, after the whole config is validated; an
+        exception or a validation error rolls every edit back.
+
+        Parameters:
+            None
+
+        Returns:
+            ConfigTransaction: Context manager for the edit session
+
+        Raises:
+            ValueError: On exit, if the edits leave invalid cross-references
+        """
+        return self.active_transaction
+
+    def mark_dirty(
+        self, section: str, key: str | None = None, committed: bool = False
+    ) -> None:
+        """
+        Record an in-memory change so the next temp save only rewrites it.
+
+        Models call this after every mutation, including cascaded ones. It
+        also refreshes the reverse references of the changed entity in the
+        index.
+
+        Parameters:
+            section (str): 'rooms', 'labs', 'courses', 'faculty' or 'time_slot_config'
+            key (str | None): Course id or faculty name that changed, or None
+                if the whole section changed
+            committed (bool): The change came from the main config file, so
+                it is not an uncommitted edit
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.dirty.mark(section, key, committed)
+            self.history.note(section, key)
+            self.index.entity_changed(section, key)
+            if section == "time_slot_config":
+                self.slot_version = self.dirty.version
+
+    def undo(self, steps: int = 1) -> bool:
+        """
+        Revert the last edits, one user action per step.
+
+        Only the entities that differ are restored; the change is then
+        temp-saved like any other edit.
+
+        Parameters:
+            steps (int): Number of actions to undo
+
+        Returns:
+            bool: True if anything was undone
+        """
+        return self._move_history(-steps)
+
+    def redo(self, steps: int = 1) -> bool:
+        """
+        Re-apply edits reverted by undo().
+
+        Parameters:
+            steps (int): Number of actions to redo
+
+        Returns:
+            bool: True if anything was redone
+        """
+        return self._move_history(steps)
+
+    def _move_history(self, steps: int) -> bool:
+        with self.lock:
+            self.history.checkpoint(self.config)
+            changes = self.history.move(self.config, steps)
+            if not changes:
+                return False
+            self.mark_restored(changes)
+        self.save_feature("temp", "all")
+        return True
+
+    def mark_restored(self, changes: dict) -> None:
+        """
+        Record entities restored from the history into the live config.
+
+        Parameters:
+            changes (dict[str, set | None]): Section -> restored entity keys
+                (None for a whole section), as returned by ConfigHistory
+
+        Returns:
+            None
+        """
+        with self.lock:
+            for section, keys in changes.items():
+                self.index.invalidate(section)
+                for key in [None] if keys is None else keys:
+                    self.dirty.mark(section, key)
+            if "time_slot_config" in changes:
+                self.slot_version = self.dirty.version
+
+    def time_slots(self) -> SlotTable:
+        """
+        Return every concrete time slot of the time slot config, with the
+        overlap masks between them.
+
+        The table is built on first use and reused until the time slot
+        config is next marked dirty (or replaced by a reload or an undo),
+        so edits to other sections do not rebuild it.
+
+        Parameters:
+            None
+
+        Returns:
+            SlotTable: Materialized time slots
+        """
+        table = self._slot_table
+        if (
+            table is None
+            or table.config is not self.config.time_slot_config
+            or self._slot_table_version != self.slot_version
+        ):
+            table = SlotTable(self.config.time_slot_config)
+            self._slot_table = table
+            self._slot_table_version = self.slot_version
+        return table
+
+    def get_metadata(self) -> dict:
+        """
+        Return file-level values of the config as saved on disk.
+
+        Served from a cache that is refreshed only when the file changes,
+        so page renders can call this freely.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: 'limit', 'optimizer_flags', 'counts' and 'hash'
+                (see config_metadata.summarize)
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not valid JSON
+        """
+        return get_metadata(self.config_path)
+
+    def pending_changes(self) -> dict:
+        """
+        Return what the in-memory configuration changes relative to the
+        committed config file.
+
+        The parsed file is kept and reused while the content hash from the
+        metadata cache is unchanged, so renders of the pending changes
+        panel only re-read the file after it was saved or edited.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: Entity-level differences (see config_diff.diff_configs);
+                empty if there is nothing to commit
+
+        Raises:
+            OSError: If the config file cannot be read
+            ValueError: If the config file is not a valid configuration
+        """
+        content_hash = self.get_metadata()["hash"]
+        if self._committed is None or self._committed[0] != content_hash:
+            self._committed = (content_hash, load_config(self.config_path))
+        return diff_configs(self._committed[1], self.config)
+
+    def enable_write_behind(self, interval: float = DEFAULT_INTERVAL) -> None:
+        """
+        Defer temp saves to a background thread that coalesces bursts of edits.
+
+        Parameters:
+            interval (float): Seconds of quiet before pending saves are written
+
+        Returns:
+            None
+        """
+        if self.saver is None:
+            self.saver = WriteBehindSaver(self._write_temp, interval)
+
+    def enable_watch(self, interval: float, on_change=None) -> None:
+        """
+        Poll the config file and apply edits made outside the app to the
+        live configuration, entity by entity.
+
+        Parameters:
+            interval (float): Seconds between polls
+            on_change (Callable[[dict, dict], None] | None): Called with
+                (applied, conflicts) when external changes are found
+
+        Returns:
+            None
+        """
+        if self.watcher is None:
+            self.watcher = ConfigWatcher(self, interval, on_change)
+            self.watcher.start()
+
+    def save_metrics(self) -> dict:
+        """
+        Return write-behind save statistics (empty if not enabled).
+
+        Parameters:
+            None
+
+        Returns:
+            dict: See WriteBehindSaver.metrics()
+        """
+        return self.saver.metrics() if self.saver is not None else {}
+
+    def flush_saves(self) -> bool:
+        """
+        Write queued temp saves now and wait for journal compaction.
+
+        Unlike close(), the model stays usable and keeps saving in the
+        background.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if every queued save was written
+        """
+        saved = self.saver.flush() if self.saver is not None else True
+        if self.journal is not None:
+            self.journal.wait()
+        return saved
+
+    def close(self) -> None:
+        """
+        Flush pending temp saves and stop background work.
+
+        Call when the config is replaced or the application shuts down.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+        if self.saver is not None:
+            self.saver.stop()
+            self.saver = None
+        if self.journal is not None:
+            self.journal.wait()
 
     def safe_save(self) -> bool:
         """
@@ -45,12 +385,29 @@ class ConfigModel:
         Returns:
             bool: True if save successful, False otherwise
         """
-        return safe_save(self.config, self.config_path)
+        if self.active_transaction.active:
+            self.active_transaction.defer("safe", "all")
+            return True
+        with self.lock:
+            self.history.checkpoint(self.config)
+        if self.saver is not None:
+            self.saver.flush()
+        with self.lock:
+            if not safe_save(self.config, self.config_path):
+                return False
+            self.dirty.committed()
+            if self.journal is not None:
+                self.journal.discard()
+            return True
 
     def save_feature(self, save_type: str, feature: str) -> bool:
         """
         Saves a specific feature configuration either temporarily or permanently.
 
+        With write-behind enabled, temp saves are queued and return True
+        immediately; a commit first writes anything still queued. Inside a
+        transaction() every save is deferred to its end.
+
         Parameters:
             save_type (str): 'temp' to save to a temporary file, 'config' to commit to the main file.
             feature (str): The feature key to save (e.g., 'faculty', 'courses', 'rooms', 'labs', 'all').
@@ -58,7 +415,75 @@ class ConfigModel:
         Returns:
             bool: True if save successful, False otherwise
         """
-        return save_configuration(self.config, self.config_path, save_type, feature)
+        if self.active_transaction.active:
+            self.active_transaction.defer(save_type, feature)
+            return True
+        # Controllers save after every action, so each save closes an undo step
+        with self.lock:
+            self.history.checkpoint(self.config)
+        if save_type == "temp":
+            if self.saver is not None:
+                self.saver.request(feature)
+                return True
+            return self._write_temp(feature)
+
+        if self.saver is not None:
+            self.saver.flush()
+        if self.journal is None:
+            with self.lock:
+                return save_configuration(
+                    self.config, self.config_path, save_type, feature, self.dirty
+                )
+
+        # Wait for compaction so it cannot recreate '.temp' after the commit
+        self.journal.wait()
+        with self.lock:
+            if not save_configuration(
+                self.config, self.config_path, save_type, feature
+            ):
+                return False
+            if feature == "all":
+                self.dirty.committed()
+            self.journal.discard()
+            # Re-journal whatever is still uncommitted on the next temp save
+            self.dirty.reset_pending()
+        return True
+
+    def _write_temp(self, feature: str) -> bool:
+        """
+        Write unsaved changes for a feature to the temp store.
+
+        Runs on the write-behind thread: the changes are serialized under
+        the config lock and then appended to the journal without it.
+
+        Parameters:
+            feature (str): The feature key to save, or 'all'
+
+        Returns:
+            bool: True if save successful, False otherwise
+        """
+        if self.journal is None:
+            with self.lock:
+                return save_configuration(
+                    self.config, self.config_path, "temp", feature, self.dirty
+                )
+
+        sections = SECTIONS if feature == "all" else (feature,)
+        with self.lock:
+            changes = self.dirty.take(sections)
+            # The time slot page edits its config in place, so always check it
+            if "time_slot_config" in sections:
+                changes.setdefault("time_slot_config", None)
+            try:
+                entries = self.journal.build_changes(self.config, changes)
+            except ValueError as e:
+                print(f"Error during journal append: {e}")
+                entries = None
+        if entries is not None and self.journal.append(entries):
+            return True
+        with self.lock:
+            self.dirty.restore(changes)
+        return False
 
     def reload(self):
         """
@@ -73,7 +498,16 @@ class ConfigModel:
             None
         """
         try:
-            self.config = load_config_from_file(CombinedConfig, self.config_path)
+            forget_metadata(self.config_path)
+            config = load_config(self.config_path)
+            with self.lock:
+                self.config = config
+                self.dirty.reset()
+                if self.journal is not None:
+                    self.journal.start()
+                    self.dirty.synced()
+                self.history.reset(self.config)
+                self.index = ConfigIndex(self.config)
         except Exception as e:
             print(f"WARNING: reload skipped due to validation error: {e}")
 
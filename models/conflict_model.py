@@ -11,6 +11,8 @@ This model class manages all conflict-related data operations including:
 
 from scheduler.config import CourseConfig
 
+from models.config_model import edits_config
+
 
 class ConflictModel:
     """
@@ -31,12 +33,15 @@ class ConflictModel:
         """
         self.config_model = config_model
 
+    @edits_config
     def add_conflict(
         self,
         course_id_1: str,
         course_id_2: str,
         section_index_1: int | None = None,
         section_index_2: int | None = None,
+        section_id_1: int | None = None,
+        section_id_2: int | None = None,
     ) -> bool:
         """
         Add a mutual conflict between two courses (in-memory only).
@@ -55,6 +60,8 @@ class ConflictModel:
             course_id_2     (str):      Second course ID.
             section_index_1 (int|None): Global index of the first section, or None.
             section_index_2 (int|None): Global index of the second section, or None.
+            section_id_1    (int|None): Stable id of the first section, instead of an index.
+            section_id_2    (int|None): Stable id of the second section, instead of an index.
         Returns:
             bool: True if successful, False if validation fails.
         """
@@ -62,6 +69,9 @@ class ConflictModel:
             return False
 
         courses = self.config_model.config.config.courses
+        if section_id_1 is not None and section_id_2 is not None:
+            section_index_1 = self._section_position(section_id_1)
+            section_index_2 = self._section_position(section_id_2)
 
         if section_index_1 is not None and section_index_2 is not None:
             if section_index_1 >= len(courses) or section_index_2 >= len(courses):
@@ -75,8 +85,8 @@ class ConflictModel:
             if course_id_1 not in c2.conflicts:
                 c2.conflicts.append(course_id_1)
         else:
-            c1_list = [c for c in courses if c.course_id == course_id_1]
-            c2_list = [c for c in courses if c.course_id == course_id_2]
+            c1_list = self.get_course_by_id(course_id_1)
+            c2_list = self.get_course_by_id(course_id_2)
             if not c1_list or not c2_list:
                 return False
             for course in c1_list:
@@ -86,14 +96,55 @@ class ConflictModel:
                 if course_id_1 not in course.conflicts:
                     course.conflicts.append(course_id_1)
 
+        self.config_model.mark_dirty("courses", course_id_1)
+        self.config_model.mark_dirty("courses", course_id_2)
+        return True
+
+    @edits_config
+    def add_conflicts(self, pairs: list[tuple[str, str]]) -> bool:
+        """
+        Add several mutual conflicts between all sections of course pairs
+        (in-memory only). Nothing is added unless every pair is valid.
+        Call config_model.safe_save() to persist changes to disk.
+
+        Parameters:
+            pairs (list[tuple[str, str]]): (course_id_1, course_id_2) pairs.
+        Returns:
+            bool: True if successful, False if validation fails.
+        """
+        if not pairs:
+            return False
+        for course_id_1, course_id_2 in pairs:
+            if course_id_1 == course_id_2:
+                return False
+            if not self.get_course_by_id(course_id_1):
+                return False
+            if not self.get_course_by_id(course_id_2):
+                return False
+
+        changed = set()
+        for course_id_1, course_id_2 in pairs:
+            for course_id, other in (
+                (course_id_1, course_id_2),
+                (course_id_2, course_id_1),
+            ):
+                for course in self.get_course_by_id(course_id):
+                    if other not in course.conflicts:
+                        course.conflicts.append(other)
+                        changed.add(course_id)
+        for course_id in changed:
+            self.config_model.mark_dirty("courses", course_id)
         return True
 
+    @edits_config
     def delete_conflict(
         self,
         course_id_1: str,
         course_id_2: str,
         section_index_1: int | None = None,
         section_index_2: int | None = None,
+        section_id_1: int | None = None,
+        section_id_2: int | None = None,
     ) -> bool:
         """
         Delete a mutual conflict between two courses (in-memory only).
@@ -107,10 +158,15 @@ class ConflictModel:
             course_id_2     (str):      Second course ID.
             section_index_1 (int|None): Global index of the first section, or None.
             section_index_2 (int|None): Global index of the second section, or None.
+            section_id_1    (int|None): Stable id of the first section, instead of an index.
+            section_id_2    (int|None): Stable id of the second section, instead of an index.
         Returns:
             bool: True if successful, False if the conflict was not found.
         """
         courses = self.config_model.config.config.courses
+        if section_id_1 is not None and section_id_2 is not None:
+            section_index_1 = self._section_position(section_id_1)
+            section_index_2 = self._section_position(section_id_2)
 
         if section_index_1 is not None and section_index_2 is not None:
             if section_index_1 >= len(courses) or section_index_2 >= len(courses):
@@ -130,20 +186,22 @@ class ConflictModel:
                 return False
         else:
             found = False
-            for course in courses:
-                if course.course_id == course_id_1 and course_id_2 in course.conflicts:
+            for course in self.get_course_by_id(course_id_1):
+                if course_id_2 in course.conflicts:
                     course.conflicts = [x for x in course.conflicts if x != course_id_2]
                     found = True
-                elif (
-                    course.course_id == course_id_2 and course_id_1 in course.conflicts
-                ):
+            for course in self.get_course_by_id(course_id_2):
+                if course_id_1 in course.conflicts:
                     course.conflicts = [x for x in course.conflicts if x != course_id_1]
                     found = True
             if not found:
                 return False
 
+        self.config_model.mark_dirty("courses", course_id_1)
+        self.config_model.mark_dirty("courses", course_id_2)
         return True
 
+    @edits_config
     def modify_conflict(
         self,
         selected_course: CourseConfig,
@@ -173,10 +231,9 @@ class ConflictModel:
         if modify_mode not in (1, 2):
             return False
 
-        courses = self.config_model.config.config.courses
-        selected_list = [c for c in courses if c.course_id == old_course_id]
-        conflict_list = [c for c in courses if c.course_id == conflict_id]
-        new_list = [c for c in courses if c.course_id == new_course_id]
+        selected_list = self.get_course_by_id(old_course_id)
+        conflict_list = self.get_course_by_id(conflict_id)
+        new_list = self.get_course_by_id(new_course_id)
 
         if not selected_list or not conflict_list or not new_list:
             return False
@@ -206,8 +263,11 @@ class ConflictModel:
                 if old_course_id not in course.conflicts:
                     course.conflicts.append(old_course_id)
 
+        for course_id in (old_course_id, conflict_id, new_course_id):
+            self.config_model.mark_dirty("courses", course_id)
         return True
 
+    @edits_config
     def modify_conflict_by_ids(
         self, old_c1: str, old_c2: str, new_c1: str, new_c2: str
     ) -> bool:
@@ -262,15 +322,17 @@ class ConflictModel:
         """
         conflicts = []
         seen = set()
+        index = self.config_model.index
         courses = self.config_model.config.config.courses
+        # Only the sections of each listed course are visited, so the cost
+        # is linear in the number of sections plus the number of pairs
         for i, course in enumerate(courses):
             for conflict_id in course.conflicts:
-                for j, other in enumerate(courses):
-                    if other.course_id == conflict_id:
-                        key = (min(i, j), max(i, j))
-                        if key not in seen:
-                            seen.add(key)
-                            conflicts.append((course.course_id, conflict_id, i, j))
+                for j in index.course_positions(conflict_id):
+                    key = (min(i, j), max(i, j))
+                    if key not in seen:
+                        seen.add(key)
+                        conflicts.append((course.course_id, conflict_id, i, j))
         return conflicts
 
     def conflict_exists(self, course_id_1: str, course_id_2: str) -> bool:
@@ -283,10 +345,74 @@ class ConflictModel:
         Returns:
             bool: True if conflict exists, False otherwise.
         """
-        return any(
-            (c1 == course_id_1 and c2 == course_id_2)
-            or (c1 == course_id_2 and c2 == course_id_1)
-            for c1, c2, i1, i2 in self.get_all_conflicts()
+        return self.config_model.index.conflict_exists(course_id_1, course_id_2)
+
+    def get_conflicting_courses(self, course_id: str) -> set[str]:
+        """
+        Get the ids of all courses that conflict with a course (any section,
+        either direction).
+
+        Parameters:
+            course_id (str): Course ID.
+        Returns:
+            set[str]: Conflicting course IDs.
+        """
+        return self.config_model.index.conflicting_ids(course_id)
+
+    def get_conflict_graph(self) -> dict[str, set[str]]:
+        """
+        Get the course-level conflict graph as an adjacency map.
+
+        Every course appears as a key, including courses without conflicts.
+        Edges are symmetric and only join existing courses.
+
+        Parameters:
+            None
+        Returns:
+            dict[str, set[str]]: Course ID -> conflicting course IDs.
+        """
+        index = self.config_model.index
+        return {
+            course_id: index.conflicting_ids(course_id)
+            for course_id in dict.fromkeys(
+                c.course_id for c in self.config_model.config.config.courses
+            )
+        }
+
+    def get_section_conflict_graph(self) -> dict[int, set[int]]:
+        """
+        Get the section-level conflict graph as an adjacency map.
+
+        A section conflicts with every section of the courses in its
+        conflicts list, which is the pairing the solver enforces. Every
+        section position appears as a key.
+
+        Parameters:
+            None
+        Returns:
+            dict[int, set[int]]: Section position -> conflicting positions.
+        """
+        index = self.config_model.index
+        courses = self.config_model.config.config.courses
+        graph: dict[int, set[int]] = {i: set() for i in range(len(courses))}
+        for i, course in enumerate(courses):
+            for conflict_id in course.conflicts:
+                for j in index.course_positions(conflict_id):
+                    if j != i:
+                        graph[i].add(j)
+                        graph[j].add(i)
+        return graph
+
+    def _section_position(self, section_id: int) -> int:
+        """
+        Return the position of a section, or an out-of-range position if it
+        was deleted so the caller's bounds check rejects it.
+        """
+        position = self.config_model.index.section_position(section_id)
+        return (
+            len(self.config_model.config.config.courses)
+            if position is None
+            else position
         )
 
     def get_course_by_id(self, course_id: str) -> list[CourseConfig]:
@@ -298,8 +424,4 @@ class ConflictModel:
         Returns:
             list[CourseConfig]: All matching course objects.
         """
-        return [
-            c
-            for c in self.config_model.config.config.courses
-            if c.course_id == course_id
-        ]
+        return self.config_model.index.courses_by_id(course_id)
@@ -11,6 +11,8 @@ This model class manages all course-related data operations including:
 
 from scheduler import CourseConfig
 
+from models.config_model import edits_config
+
 
 class CourseModel:
     """
@@ -29,6 +31,7 @@ class CourseModel:
         """
         self.config_model = config_model
 
+    @edits_config
     def add_course(self, course: CourseConfig) -> bool:
         """
         Add course to configuration (in-memory only).
@@ -39,9 +42,17 @@ class CourseModel:
             bool: True if successful, False if course already exists
         """
         self.config_model.config.config.courses.append(course)
+        self.config_model.index.course_added(course)
+        self.config_model.mark_dirty("courses", course.course_id)
         return True
 
-    def delete_course(self, course_id: str, section_index: int | None = None) -> bool:
+    @edits_config
+    def delete_course(
+        self,
+        course_id: str,
+        section_index: int | None = None,
+        section_id: int | None = None,
+    ) -> bool:
         """
         Delete course by ID and optional section index (in-memory only).
         Also removes all references to this course from conflicts and faculty preferences.
@@ -49,22 +60,29 @@ class CourseModel:
         Parameters:
             course_id (str): Course ID to delete (e.g., "CMSC 340")
             section_index (int | None): Specific index to delete, or None to delete all
+            section_id (int | None): Stable id of the section to delete, instead
+                of section_index
         Returns:
-            bool: True if successful, False if course not found
+            bool: True if successful, False if course or section not found
         """
         if not self.course_exists(course_id):
             return False
+        if section_id is not None:
+            section_index = self._section_of(course_id, section_id)
+            if section_index is None:
+                return False
 
         # Remove conflict references from other courses
-        for course in self.config_model.config.config.courses:
+        index = self.config_model.index
+        for course in index.courses_referencing("course", course_id):
             if course.course_id != course_id:
-                if course_id in course.conflicts:
-                    course.conflicts = [c for c in course.conflicts if c != course_id]
+                course.conflicts = [c for c in course.conflicts if c != course_id]
+                self.config_model.mark_dirty("courses", course.course_id)
 
         # Remove from faculty preferences
-        for faculty in self.config_model.config.config.faculty:
-            if course_id in faculty.course_preferences:
-                del faculty.course_preferences[course_id]
+        for faculty in index.faculty_referencing("course", course_id):
+            del faculty.course_preferences[course_id]
+            self.config_model.mark_dirty("faculty", faculty.name)
 
         # Remove course using list.pop() to avoid assignment validation
         courses = self.config_model.config.config.courses
@@ -72,14 +90,68 @@ class CourseModel:
             if section_index < len(courses):
                 courses.pop(section_index)
         else:
-            for i in range(len(courses) - 1, -1, -1):
-                if courses[i].course_id == course_id:
-                    courses.pop(i)
+            for i in reversed(self.config_model.index.course_positions(course_id)):
+                courses.pop(i)
+        self.config_model.index.courses_removed()
+        self.config_model.mark_dirty("courses", course_id)
+
+        return True
+
+    @edits_config
+    def delete_courses(self, course_ids: list[str]) -> bool:
+        """
+        Delete every section of several courses in one pass (in-memory only).
+        References from conflicts and faculty preferences are removed in the
+        same pass. Nothing is deleted unless every course exists.
+        Call config_model.safe_save() to persist changes to disk.
+        Parameters:
+            course_ids (list[str]): Course IDs to delete
+        Returns:
+            bool: True if successful, False if any course was not found
+        """
+        targets = set(course_ids)
+        if not targets or not all(self.course_exists(c) for c in targets):
+            return False
 
+        # Collect everything that references any target once, then update
+        # each referencing course and faculty member in a single pass
+        index = self.config_model.index
+        referencing_courses = {}
+        referencing_faculty = {}
+        for course_id in targets:
+            for course in index.courses_referencing("course", course_id):
+                referencing_courses[id(course)] = course
+            for faculty in index.faculty_referencing("course", course_id):
+                referencing_faculty[id(faculty)] = faculty
+
+        changed_courses = set()
+        for course in referencing_courses.values():
+            if course.course_id not in targets:
+                course.conflicts = [c for c in course.conflicts if c not in targets]
+                changed_courses.add(course.course_id)
+        changed_faculty = []
+        for faculty in referencing_faculty.values():
+            for course_id in targets.intersection(faculty.course_preferences):
+                del faculty.course_preferences[course_id]
+            changed_faculty.append(faculty.name)
+
+        # Slice assignment keeps the list in place and skips validation
+        courses = self.config_model.config.config.courses
+        courses[:] = [c for c in courses if c.course_id not in targets]
+        self.config_model.index.courses_removed()
+        for course_id in changed_courses | targets:
+            self.config_model.mark_dirty("courses", course_id)
+        for name in changed_faculty:
+            self.config_model.mark_dirty("faculty", name)
         return True
 
+    @edits_config
     def modify_course(
-        self, course_id: str, section_index: int | None = None, **updates
+        self,
+        course_id: str,
+        section_index: int | None = None,
+        section_id: int | None = None,
+        **updates,
     ) -> bool:
         """
         Modify a course's attributes (in-memory only).
@@ -87,30 +159,58 @@ class CourseModel:
         Parameters:
             course_id (str): Course ID to modify
             section_index (int | None): Specific section index to modify, or None to modify all matching
+            section_id (int | None): Stable id of the section to modify, instead
+                of section_index
         Returns:
-            bool: True if successful, False if course not found
+            bool: True if successful, False if course or section not found
         """
         if not self.course_exists(course_id):
             return False
+        if section_id is not None:
+            section_index = self._section_of(course_id, section_id)
+            if section_index is None:
+                return False
 
         courses = self.config_model.config.config.courses
-        for i, course in enumerate(courses):
-            if course.course_id == course_id:
-                if section_index is not None and i != section_index:
-                    continue
-                if "credits" in updates:
-                    if updates["credits"] < 0:
-                        return False
-                    course.credits = updates["credits"]
-                if "room" in updates:
-                    course.room = updates["room"]
-                if "lab" in updates:
-                    course.lab = updates["lab"]
-                if "faculty" in updates:
-                    course.faculty = updates["faculty"]
+        for i in self.config_model.index.course_positions(course_id):
+            course = courses[i]
+            if section_index is not None and i != section_index:
+                continue
+            if "credits" in updates:
+                if updates["credits"] < 0:
+                    return False
+                course.credits = updates["credits"]
+            if "room" in updates:
+                course.room = updates["room"]
+            if "lab" in updates:
+                course.lab = updates["lab"]
+            if "faculty" in updates:
+                course.faculty = updates["faculty"]
+            self.config_model.mark_dirty("courses", course_id)
 
         return True
 
+    def _section_of(self, course_id: str, section_id: int) -> int | None:
+        """
+        Return the position of a section if it exists and belongs to course_id.
+        """
+        position = self.section_position(section_id)
+        if position is None:
+            return None
+        if self.get_all_courses()[position].course_id != course_id:
+            return None
+        return position
+
+    def section_position(self, section_id: int) -> int | None:
+        """
+        Get the current position of a course section from its stable id.
+        Parameters:
+            section_id (int): Stable section id (see get_sections())
+        Returns:
+            int | None: Index in the course list, or None if the section was deleted
+        """
+        return self.config_model.index.section_position(section_id)
+
     def course_exists(self, course_id: str) -> bool:
         """
         Check if course with given ID exists.
@@ -119,9 +219,7 @@ class CourseModel:
         Returns:
             bool: True if course exists, False otherwise
         """
-        return any(
-            c.course_id == course_id for c in self.config_model.config.config.courses
-        )
+        return bool(self.config_model.index.course_positions(course_id))
 
     def get_course_by_id(self, course_id: str) -> CourseConfig | None:
         """
@@ -131,10 +229,8 @@ class CourseModel:
         Returns:
             CourseConfig | None: Course object if found, None otherwise
         """
-        for course in self.config_model.config.config.courses:
-            if course.course_id == course_id:
-                return course
-        return None
+        sections = self.config_model.index.courses_by_id(course_id)
+        return sections[0] if sections else None
 
     def get_all_courses(self) -> list[CourseConfig]:
         """
@@ -217,3 +313,19 @@ class CourseModel:
             label = f"{cid}.{section_counter[cid]:02d}"
             result.append((label, i, course))
         return result
+
+    def get_sections(self) -> list[tuple[str, int, CourseConfig]]:
+        """
+        Get all courses with section labels and stable section ids.
+        Unlike list indices, the ids stay valid when other sections are
+        deleted, so callers may keep them across edits.
+        Parameters:
+            None
+        Returns:
+            list[tuple[str, int, CourseConfig]]: List of (label, section_id, course) tuples
+        """
+        ids = self.config_model.index.section_ids()
+        return [
+            (label, ids[i], course)
+            for label, i, course in self.get_courses_with_sections()
+        ]
@@ -0,0 +1,203 @@
+# models/decomposition.py
+"""
+Decomposition - Split a config into independently solvable sub-problems
+
+Two sections interact only through a shared candidate faculty, room or
+lab, a conflict, or a shared course id (sections of one course must not
+overlap). Sections that cannot reach each other through those links can
+be scheduled separately: every schedule of the whole config is one
+schedule per component, taken together.
+
+stream_product() enumerates those combinations lazily, pulling further
+solutions from each component only when the combinations built from the
+solutions found so far run out.
+"""
+
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from itertools import product
+
+
+def _find(parent: dict, key):
+    root = key
+    while parent[root] != root:
+        root = parent[root]
+    while parent[key] != root:
+        parent[key], key = root, parent[key]
+    return root
+
+
+def _union(parent: dict, a, b) -> None:
+    parent.setdefault(a, a)
+    parent.setdefault(b, b)
+    root_a, root_b = _find(parent, a), _find(parent, b)
+    if root_a != root_b:
+        parent[root_b] = root_a
+
+
+def candidate_faculty(course, faculty: list) -> list[str]:
+    """
+    Return the faculty who may teach a course, as the solver derives them.
+
+    A course without listed faculty may be taught by anyone who has it in
+    their course preferences.
+
+    Parameters:
+        course (CourseConfig): Course section
+        faculty (list[FacultyConfig]): All faculty
+
+    Returns:
+        list[str]: Faculty names (empty if the solver may pick anyone)
+    """
+    if course.faculty:
+        return list(course.faculty)
+    return [f.name for f in faculty if course.course_id in f.course_preferences]
+
+
+def interaction_components(config) -> list[list[int]]:
+    """
+    Partition the sections of a config into independent components.
+
+    Parameters:
+        config (SchedulerConfig): Rooms, labs, courses and faculty
+
+    Returns:
+        list[list[int]]: Section positions per component, in config order,
+            components ordered by their first section
+    """
+    names = [f.name for f in config.faculty]
+    parent: dict = {}
+    for position, course in enumerate(config.courses):
+        section = ("section", position)
+        parent.setdefault(section, section)
+        _union(parent, section, ("course", course.course_id))
+        for conflict_id in course.conflicts:
+            _union(parent, section, ("course", conflict_id))
+        for room in course.room:
+            _union(parent, section, ("room", room))
+        for lab in course.lab:
+            _union(parent, section, ("lab", lab))
+        # With no candidates the solver may assign any faculty member
+        for name in candidate_faculty(course, config.faculty) or names:
+            _union(parent, section, ("faculty", name))
+
+    groups: dict = {}
+    for position in range(len(config.courses)):
+        root = _find(parent, ("section", position))
+        groups.setdefault(root, []).append(position)
+    return list(groups.values())
+
+
+def component_configs(full_config, components: list[list[int]]) -> list:
+    """
+    Build one CombinedConfig per component.
+
+    Each keeps every room and lab (unused ones constrain nothing) and the
+    faculty its sections can be assigned. Faculty no section can be
+    assigned still carry their own limits, so they go with the first
+    component.
+
+    Parameters:
+        full_config (CombinedConfig): Complete configuration
+        components (list[list[int]]): Output of interaction_components()
+
+    Returns:
+        list[CombinedConfig]: Sub-configurations sharing full_config's objects
+    """
+    config = full_config.config
+    names = [f.name for f in config.faculty]
+    claimed: set[str] = set()
+    members = []
+    for component in components:
+        used: set[str] = set()
+        for position in component:
+            course = config.courses[position]
+            used.update(candidate_faculty(course, config.faculty) or names)
+        claimed |= used
+        members.append(used)
+    if members:
+        members[0] |= set(names) - claimed
+
+    result = []
+    for component, used in zip(components, members):
+        sub = config.model_copy(
+            update={
+                "courses": [config.courses[p] for p in component],
+                "faculty": [f for f in config.faculty if f.name in used],
+            }
+        )
+        result.append(full_config.model_copy(update={"config": sub}))
+    return result
+
+
+class _Solutions:
+    """
+    Solutions pulled so far from one component's generator.
+    """
+
+    def __init__(self, iterator: Iterator):
+        self.iterator = iterator
+        self.items: list = []
+        self.done = False
+
+    def fetch(self, n: int) -> bool:
+        """
+        Pull solutions until solution n exists; return whether it does.
+        """
+        while len(self.items) <= n and not self.done:
+            try:
+                self.items.append(next(self.iterator))
+            except StopIteration:
+                self.done = True
+        return len(self.items) > n
+
+
+def stream_product(
+    iterators: list[Iterator], limit: int, executor: Executor | None = None
+) -> Iterator[tuple]:
+    """
+    Lazily enumerate the cartesian product of several solution streams.
+
+    Combinations are produced in rounds: round n yields every combination
+    whose highest solution index is n, so each stream only has to produce
+    about limit ** (1 / len(iterators)) solutions.
+
+    Parameters:
+        iterators (list[Iterator]): One solution stream per component
+        limit (int): Maximum number of combinations
+        executor (Executor | None): Pulls each round's solutions from the
+            streams concurrently when given
+
+    Returns:
+        Iterator[tuple]: One solution per stream
+    """
+    streams = [_Solutions(iterator) for iterator in iterators]
+    if not streams:
+        return
+    emitted = 0
+    n = 0
+    while emitted < limit:
+        if executor is None:
+            available = [stream.fetch(n) for stream in streams]
+        else:
+            available = list(
+                executor.map(_Solutions.fetch, streams, [n] * len(streams))
+            )
+        # A component without any solution leaves nothing to combine
+        if n == 0 and not all(available):
+            return
+        if not any(available):
+            return
+        for j in range(len(streams)):
+            if not available[j]:
+                continue
+            # Streams before j stay below n so each combination is made once
+            ranges = [range(min(n, len(s.items))) for s in streams[:j]]
+            ranges.append((n,))
+            ranges += [range(min(n + 1, len(s.items))) for s in streams[j + 1 :]]
+            for indexes in product(*ranges):
+                yield tuple(streams[i].items[k] for i, k in enumerate(indexes))
+                emitted += 1
+                if emitted >= limit:
+                    return
+        n += 1
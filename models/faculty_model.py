@@ -12,6 +12,9 @@ This model class manages all faculty-related data operations including:
 from scheduler import FacultyConfig
 from scheduler.config import TimeRange
 
+from availability_index import AvailabilityIndex
+from models.config_model import edits_config
+
 # Constants
 FULL_TIME_MAX_CREDITS = 12
 ADJUNCT_MAX_CREDITS = 4
@@ -41,6 +44,7 @@ class FacultyModel:
         """
         self.config_model = config_model
 
+    @edits_config
     def add_faculty(self, faculty: FacultyConfig) -> bool:
         """
         Add faculty to configuration (in-memory only).
@@ -55,8 +59,35 @@ class FacultyModel:
         if self.faculty_exists(faculty.name):
             return False
         self.config_model.config.config.faculty.append(faculty)
+        self.config_model.index.faculty_added(faculty)
+        self.config_model.mark_dirty("faculty", faculty.name)
+        return True
+
+    @edits_config
+    def add_faculty_many(self, faculty: list[FacultyConfig]) -> bool:
+        """
+        Add several faculty members at once (in-memory only).
+        Nothing is added unless every name is new and unique in the batch.
+        Call config_model.safe_save() to persist changes to disk.
+
+        Parameters:
+            faculty (list[FacultyConfig]): Faculty objects to add
+
+        Returns:
+            bool: True if successful, False if any name already exists
+        """
+        names = [f.name.casefold() for f in faculty]
+        if not faculty or len(set(names)) != len(names):
+            return False
+        if any(self.faculty_exists(f.name) for f in faculty):
+            return False
+        self.config_model.config.config.faculty.extend(faculty)
+        for member in faculty:
+            self.config_model.index.faculty_added(member)
+            self.config_model.mark_dirty("faculty", member.name)
         return True
 
+    @edits_config
     def delete_faculty(self, name: str) -> bool:
         """
         Delete faculty by name (in-memory only).
@@ -69,23 +100,25 @@ class FacultyModel:
         Returns:
             bool: True if successful, False if faculty not found
         """
-        if not self.faculty_exists(name):
+        faculty_to_delete = self.get_faculty_by_name(name)
+        if faculty_to_delete is None:
             return False
 
-        faculty_to_delete = self.get_faculty_by_name(name)
-        if faculty_to_delete:
-            for course in self.config_model.config.config.courses:
-                if faculty_to_delete.name in course.faculty:
-                    course.faculty = [
-                        f for f in course.faculty if f != faculty_to_delete.name
-                    ]
-        self.config_model.config.config.faculty = [
-            f
-            for f in self.config_model.config.config.faculty
-            if f.name.lower() != name.lower()
-        ]
+        index = self.config_model.index
+        for course in index.courses_referencing("faculty", faculty_to_delete.name):
+            course.faculty = [f for f in course.faculty if f != faculty_to_delete.name]
+            self.config_model.mark_dirty("courses", course.course_id)
+        # Remove in place so the index can follow the change
+        faculty_list = self.config_model.config.config.faculty
+        for position, faculty in enumerate(faculty_list):
+            if faculty is faculty_to_delete:
+                del faculty_list[position]
+                break
+        self.config_model.index.faculty_removed(faculty_to_delete.name)
+        self.config_model.mark_dirty("faculty", faculty_to_delete.name)
         return True
 
+    @edits_config
     def modify_faculty(self, faculty_name: str, field: str, new_value) -> bool:
         """
         Modify a specific field of a faculty member (in-memory only).
@@ -109,7 +142,12 @@ class FacultyModel:
         faculty = self.get_faculty_by_name(faculty_name)
         if not faculty:
             return False
+        old_name = faculty.name
         setattr(faculty, field, new_value)
+        if faculty.name != old_name:
+            self.config_model.index.faculty_renamed(old_name, faculty)
+            self.config_model.mark_dirty("faculty", faculty.name)
+        self.config_model.mark_dirty("faculty", old_name)
         return True
 
     def faculty_exists(self, name: str) -> bool:
@@ -122,10 +160,7 @@ class FacultyModel:
         Returns:
             bool: True if faculty exists, False otherwise
         """
-        return any(
-            f.name.lower() == name.lower()
-            for f in self.config_model.config.config.faculty
-        )
+        return self.config_model.index.faculty_by_name(name) is not None
 
     def get_faculty_by_name(self, name: str) -> FacultyConfig | None:
         """
@@ -137,10 +172,7 @@ class FacultyModel:
         Returns:
             FacultyConfig | None: Faculty object if found, None otherwise
         """
-        for faculty in self.config_model.config.config.faculty:
-            if faculty.name.lower() == name.lower():
-                return faculty
-        return None
+        return self.config_model.index.faculty_by_name(name)
 
     def get_all_faculty(self) -> list[FacultyConfig]:
         """
@@ -154,6 +186,30 @@ class FacultyModel:
         """
         return self.config_model.config.config.faculty
 
+    def get_slot_fit(self, name: str) -> dict[int, tuple[int, int]]:
+        """
+        Count the time slots a faculty member's availability fits, for each
+        credit level the courses use.
+
+        Parameters:
+            name (str): Faculty name
+
+        Returns:
+            dict[int, tuple[int, int]]: Credits -> (fitting slots, total slots),
+                empty if the faculty member does not exist
+        """
+        faculty = self.get_faculty_by_name(name)
+        if faculty is None:
+            return {}
+        index = AvailabilityIndex(self.config_model.time_slots(), [faculty])
+        credits = {course.credits for course in self.config_model.get_all_courses()}
+        return {
+            value: counts
+            for value, counts in index.fit_counts(faculty.name).items()
+            if value in credits
+        }
+
+    @edits_config
     def set_position_type(self, faculty_name: str, is_fulltime: bool) -> bool:
         """
         Set faculty position type and enforce corresponding credit/course-limit defaults.
@@ -188,6 +244,7 @@ class FacultyModel:
             self.modify_faculty(faculty_name, "maximum_credits", ADJUNCT_MAX_CREDITS)
         return True
 
+    @edits_config
     def set_maximum_credits(self, faculty_name: str, new_max: int) -> bool:
         """
         Set faculty maximum credits and keep minimum_credits and unique_course_limit consistent.
@@ -271,6 +328,7 @@ class FacultyModel:
             lab_preferences=data.get("lab_preferences", {}),
         )
 
+    @edits_config
     def validate_faculty_references(self) -> int:
         """
         Validate that all faculty references in courses exist.
@@ -289,4 +347,5 @@ class FacultyModel:
             if invalid_refs:
                 invalid_count += len(invalid_refs)
                 course.faculty = [f for f in course.faculty if f in valid_faculty_names]
+                self.config_model.mark_dirty("courses", course.course_id)
         return invalid_count
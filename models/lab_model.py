@@ -9,6 +9,8 @@ This model class manages all lab-related data operations including:
 - Managing lab references in courses and faculty
 """
 
+from models.config_model import edits_config
+
 
 class LabModel:
     """
@@ -30,6 +32,7 @@ class LabModel:
         """
         self.config_model = config_model
 
+    @edits_config
     def add_lab(self, lab_name: str) -> bool:
         """
         Add lab to configuration (in-memory only).
@@ -44,8 +47,11 @@ class LabModel:
         if self.lab_exists(lab_name):
             return False
         self.config_model.config.config.labs.append(lab_name)
+        self.config_model.index.lab_added(lab_name)
+        self.config_model.mark_dirty("labs")
         return True
 
+    @edits_config
     def delete_lab(self, lab_name: str) -> bool:
         """
         Delete lab from configuration (in-memory only).
@@ -61,16 +67,20 @@ class LabModel:
         if not self.lab_exists(lab_name):
             return False
 
-        for course in self.config_model.config.config.courses:
+        index = self.config_model.index
+        for course in index.courses_referencing("lab", lab_name):
             course.lab = [lab for lab in course.lab if lab != lab_name]
-        for faculty in self.config_model.config.config.faculty:
-            if lab_name in faculty.lab_preferences:
-                del faculty.lab_preferences[lab_name]
-        self.config_model.config.config.labs = [
-            lab for lab in self.config_model.config.config.labs if lab != lab_name
-        ]
+            self.config_model.mark_dirty("courses", course.course_id)
+        for faculty in index.faculty_referencing("lab", lab_name):
+            del faculty.lab_preferences[lab_name]
+            self.config_model.mark_dirty("faculty", faculty.name)
+        # Remove in place so the index can follow the change
+        self.config_model.config.config.labs.remove(lab_name)
+        self.config_model.index.lab_removed(lab_name)
+        self.config_model.mark_dirty("labs")
         return True
 
+    @edits_config
     def modify_lab(self, old_name: str, new_name: str) -> bool:
         """
         Modify lab name and update all references (in-memory only).
@@ -91,13 +101,15 @@ class LabModel:
         labs = self.config_model.config.config.labs
         index = labs.index(old_name)
         labs[index] = new_name
-        for course in self.config_model.config.config.courses:
+        self.config_model.index.lab_renamed(old_name, new_name)
+        self.config_model.mark_dirty("labs")
+        index = self.config_model.index
+        for course in index.courses_referencing("lab", old_name):
             course.lab = [new_name if lab == old_name else lab for lab in course.lab]
-        for faculty in self.config_model.config.config.faculty:
-            if old_name in faculty.lab_preferences:
-                faculty.lab_preferences[new_name] = faculty.lab_preferences.pop(
-                    old_name
-                )
+            self.config_model.mark_dirty("courses", course.course_id)
+        for faculty in index.faculty_referencing("lab", old_name):
+            faculty.lab_preferences[new_name] = faculty.lab_preferences.pop(old_name)
+            self.config_model.mark_dirty("faculty", faculty.name)
         return True
 
     def lab_exists(self, lab_name: str) -> bool:
@@ -110,7 +122,7 @@ class LabModel:
         Returns:
             bool: True if lab exists, False otherwise
         """
-        return lab_name in self.config_model.config.config.labs
+        return self.config_model.index.has_lab(lab_name)
 
     def get_all_labs(self) -> list[str]:
         """
@@ -134,7 +146,7 @@ class LabModel:
         Returns:
             list: List of CourseConfig objects that use this lab
         """
-        return [c for c in self.config_model.config.config.courses if lab_name in c.lab]
+        return self.config_model.index.courses_referencing("lab", lab_name)
 
     def get_affected_faculty(self, lab_name: str) -> list:
         """
@@ -146,8 +158,4 @@ class LabModel:
         Returns:
             list: List of FacultyConfig objects with preferences for this lab
         """
-        return [
-            f
-            for f in self.config_model.config.config.faculty
-            if lab_name in f.lab_preferences
-        ]
+        return self.config_model.index.faculty_referencing("lab", lab_name)
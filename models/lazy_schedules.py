@@ -0,0 +1,249 @@
+# models/lazy_schedules.py
+"""
+LazyScheduleList - Index schedule boundaries first, materialize on access
+
+Importing a large schedule file normally builds every CourseInstance up
+front even though only a handful of schedules are ever viewed. The helpers
+here do a fast first pass that records only the byte range of each
+schedule, and LazyScheduleList parses a schedule the first time it is
+indexed, keeping a small LRU of recently materialized schedules.
+"""
+
+import bisect
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+
+DEFAULT_CACHE_SIZE = 32
+
+# A JSON string (skipped as a unit) or an array bracket
+_JSON_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]]', re.DOTALL)
+
+
+def index_csv_spans(buffer) -> list[tuple[int, int]]:
+    """
+    Find the byte range of each schedule in a schedule CSV.
+
+    Schedules are separated by blank lines (or rows of empty cells),
+    matching SchedulerModel.iter_csv().
+
+    Parameters:
+        buffer (bytes | mmap): CSV file contents
+
+    Returns:
+        list[tuple[int, int]]: (start, end) offsets, one per schedule
+    """
+    spans = []
+    start = None
+    pos = 0
+    size = len(buffer)
+    while pos < size:
+        end = buffer.find(b"\n", pos)
+        end = size if end < 0 else end + 1
+        if buffer[pos:end].strip(b" \t\r\n,"):
+            if start is None:
+                start = pos
+        elif start is not None:
+            spans.append((start, pos))
+            start = None
+        pos = end
+    if start is not None:
+        spans.append((start, size))
+    return spans
+
+
+def index_ndjson_spans(buffer) -> list[tuple[int, int]]:
+    """
+    Find the byte range of each non-empty line in an NDJSON file.
+
+    Parameters:
+        buffer (bytes | mmap): NDJSON file contents
+
+    Returns:
+        list[tuple[int, int]]: (start, end) offsets, one per schedule
+    """
+    spans = []
+    pos = 0
+    size = len(buffer)
+    while pos < size:
+        end = buffer.find(b"\n", pos)
+        end = size if end < 0 else end + 1
+        if buffer[pos:end].strip():
+            spans.append((pos, end))
+        pos = end
+    return spans
+
+
+def index_json_spans(buffer) -> list[tuple[int, int]]:
+    """
+    Find the byte range of each schedule in a JSON array of schedules.
+
+    Only strings and square brackets are inspected; string contents are
+    skipped by the regular expression engine rather than in Python.
+
+    Parameters:
+        buffer (bytes | mmap): JSON file contents
+
+    Returns:
+        list[tuple[int, int]]: (start, end) offsets, one per schedule
+
+    Raises:
+        ValueError: If the brackets are unbalanced
+    """
+    spans = []
+    depth = 0
+    start = 0
+    for match in _JSON_TOKENS.finditer(buffer):
+        token = match.group()
+        if token == b"[":
+            depth += 1
+            if depth == 2:
+                start = match.start()
+        elif token == b"]":
+            depth -= 1
+            if depth == 1:
+                spans.append((start, match.end()))
+            elif depth < 0:
+                raise ValueError("Unbalanced brackets in schedule JSON")
+    if depth != 0:
+        raise ValueError("Unbalanced brackets in schedule JSON")
+    return spans
+
+
+class LazyScheduleList(Sequence):
+    """
+    Sequence of schedules that are parsed only when accessed.
+
+    The list is made of segments. A lazy segment loads schedule i through a
+    loader callback and caches the result in a shared LRU. A materialized
+    segment simply holds already-built schedules (e.g. freshly generated
+    ones appended later). Appending or extending never forces lazy
+    schedules to be parsed.
+
+    Attributes:
+        cache_size (int): Maximum number of lazily parsed schedules kept
+    """
+
+    def __init__(
+        self,
+        count: int = 0,
+        loader: Callable[[int], list] | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Parameters:
+            count (int): Number of schedules the loader can produce
+            loader (Callable[[int], list] | None): Parses schedule i
+            cache_size (int): Maximum number of parsed schedules to keep
+        """
+        self.cache_size = cache_size
+        self._starts: list[int] = []
+        # (count, loader or list of built schedules, lazy)
+        self._segments: list[tuple[int, object, bool]] = []
+        self._length = 0
+        self._cache: OrderedDict[tuple[int, int], list] = OrderedDict()
+        if loader is not None and count:
+            self._add_segment(count, loader, lazy=True)
+
+    @classmethod
+    def from_spans(
+        cls,
+        buffer,
+        spans: list[tuple[int, int]],
+        parse: Callable[[bytes], list],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> "LazyScheduleList":
+        """
+        Build a lazy list over byte ranges of a buffer.
+
+        Parameters:
+            buffer (bytes | mmap): File contents
+            spans (list[tuple[int, int]]): Byte range of each schedule
+            parse (Callable[[bytes], list]): Parses one schedule's bytes
+            cache_size (int): Maximum number of parsed schedules to keep
+        """
+        return cls(
+            len(spans),
+            lambda i: parse(buffer[spans[i][0] : spans[i][1]]),
+            cache_size,
+        )
+
+    def _add_segment(self, count: int, loader, lazy: bool) -> None:
+        self._starts.append(self._length)
+        self._segments.append((count, loader, lazy))
+        self._length += count
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("schedule index out of range")
+
+        segment = bisect.bisect_right(self._starts, index) - 1
+        _, loader, lazy = self._segments[segment]
+        offset = index - self._starts[segment]
+        if not lazy:
+            return loader[offset]
+
+        key = (segment, offset)
+        schedule = self._cache.get(key)
+        if schedule is not None:
+            self._cache.move_to_end(key)
+            return schedule
+        schedule = loader(offset)
+        self._cache[key] = schedule
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return schedule
+
+    def loaded(self) -> list:
+        """
+        Return the schedules held in memory, without parsing any lazy ones.
+
+        That is every built schedule plus the lazily parsed ones still in
+        the cache.
+        """
+        built = [s for _, loader, lazy in self._segments if not lazy for s in loader]
+        return built + list(self._cache.values())
+
+    def materialized_count(self) -> int:
+        """
+        Return how many lazily loaded schedules are currently cached.
+        """
+        return len(self._cache)
+
+    def append(self, schedule: list) -> None:
+        """
+        Append an already-built schedule.
+        """
+        if self._segments and not self._segments[-1][2]:
+            count, built, _ = self._segments[-1]
+            built.append(schedule)
+            self._segments[-1] = (count + 1, built, False)
+            self._length += 1
+        else:
+            self._add_segment(1, [schedule], lazy=False)
+
+    def extend(self, schedules) -> None:
+        """
+        Append schedules, keeping another LazyScheduleList lazy.
+        """
+        if isinstance(schedules, LazyScheduleList):
+            for count, loader, lazy in schedules._segments:
+                if lazy:
+                    self._add_segment(count, loader, lazy=True)
+                else:
+                    for schedule in loader:
+                        self.append(schedule)
+        else:
+            for schedule in schedules:
+                self.append(schedule)
+
+    def __iadd__(self, schedules):
+        self.extend(schedules)
+        return self
@@ -9,6 +9,8 @@ This model class manages all room-related data operations including:
 - Managing room references in courses and faculty
 """
 
+from models.config_model import edits_config
+
 
 class RoomModel:
     """
@@ -30,6 +32,7 @@ class RoomModel:
         """
         self.config_model = config_model
 
+    @edits_config
     def add_room(self, room_name: str) -> bool:
         """
         Add room to configuration (in-memory only).
@@ -46,8 +49,11 @@ class RoomModel:
         if self.room_exists(room_name):
             return False
         self.config_model.config.config.rooms.append(room_name)
+        self.config_model.index.room_added(room_name)
+        self.config_model.mark_dirty("rooms")
         return True
 
+    @edits_config
     def delete_room(self, room_name: str) -> bool:
         """
         Delete room from configuration (in-memory only).
@@ -64,16 +70,20 @@ class RoomModel:
         if not self.room_exists(room_name):
             return False
 
-        for course in self.config_model.config.config.courses:
+        index = self.config_model.index
+        for course in index.courses_referencing("room", room_name):
             course.room = [r for r in course.room if r != room_name]
-        for faculty in self.config_model.config.config.faculty:
-            if room_name in faculty.room_preferences:
-                del faculty.room_preferences[room_name]
-        self.config_model.config.config.rooms = [
-            r for r in self.config_model.config.config.rooms if r != room_name
-        ]
+            self.config_model.mark_dirty("courses", course.course_id)
+        for faculty in index.faculty_referencing("room", room_name):
+            del faculty.room_preferences[room_name]
+            self.config_model.mark_dirty("faculty", faculty.name)
+        # Remove in place so the index can follow the change
+        self.config_model.config.config.rooms.remove(room_name)
+        self.config_model.index.room_removed(room_name)
+        self.config_model.mark_dirty("rooms")
         return True
 
+    @edits_config
     def modify_room(self, old_name: str, new_name: str) -> bool:
         """
         Modify room name and update all references (in-memory only).
@@ -96,13 +106,66 @@ class RoomModel:
         rooms = self.config_model.config.config.rooms
         index = rooms.index(old_name)
         rooms[index] = new_name
-        for course in self.config_model.config.config.courses:
+        self.config_model.index.room_renamed(old_name, new_name)
+        self.config_model.mark_dirty("rooms")
+        index = self.config_model.index
+        for course in index.courses_referencing("room", old_name):
             course.room = [new_name if r == old_name else r for r in course.room]
-        for faculty in self.config_model.config.config.faculty:
-            if old_name in faculty.room_preferences:
-                faculty.room_preferences[new_name] = faculty.room_preferences.pop(
-                    old_name
-                )
+            self.config_model.mark_dirty("courses", course.course_id)
+        for faculty in index.faculty_referencing("room", old_name):
+            faculty.room_preferences[new_name] = faculty.room_preferences.pop(old_name)
+            self.config_model.mark_dirty("faculty", faculty.name)
+        return True
+
+    @edits_config
+    def rename_rooms(self, renames: dict[str, str]) -> bool:
+        """
+        Rename several rooms and update all references in one pass
+        (in-memory only). Nothing is renamed unless every old room exists
+        and the resulting room names are non-empty and unique.
+        Call config_model.safe_save() to persist changes to disk.
+
+        Parameters:
+            renames (dict[str, str]): Current room name -> new room name
+
+        Returns:
+            bool: True if successful, False if validation fails
+        """
+        renames = {old: new for old, new in renames.items() if old != new}
+        if not renames:
+            return False
+        if any(not new or not new.strip() for new in renames.values()):
+            return False
+        if not all(self.room_exists(old) for old in renames):
+            return False
+        rooms = self.config_model.config.config.rooms
+        renamed = [renames.get(room, room) for room in rooms]
+        if len(set(renamed)) != len(renamed):
+            return False
+
+        # Collect everything that references any renamed room once, then
+        # update each referencing course and faculty member in a single pass
+        index = self.config_model.index
+        referencing_courses = {}
+        referencing_faculty = {}
+        for old_name in renames:
+            for course in index.courses_referencing("room", old_name):
+                referencing_courses[id(course)] = course
+            for faculty in index.faculty_referencing("room", old_name):
+                referencing_faculty[id(faculty)] = faculty
+
+        rooms[:] = renamed
+        index.rooms_renamed(renames)
+        self.config_model.mark_dirty("rooms")
+        for course in referencing_courses.values():
+            course.room = [renames.get(room, room) for room in course.room]
+            self.config_model.mark_dirty("courses", course.course_id)
+        for faculty in referencing_faculty.values():
+            preferences = faculty.room_preferences
+            updated = {renames.get(k, k): v for k, v in preferences.items()}
+            preferences.clear()
+            preferences.update(updated)
+            self.config_model.mark_dirty("faculty", faculty.name)
         return True
 
     def room_exists(self, room_name: str) -> bool:
@@ -115,7 +178,7 @@ class RoomModel:
         Returns:
             bool: True if room exists, False otherwise
         """
-        return room_name in self.config_model.config.config.rooms
+        return self.config_model.index.has_room(room_name)
 
     def get_all_rooms(self) -> list[str]:
         """
@@ -139,9 +202,7 @@ class RoomModel:
         Returns:
             list: List of CourseConfig objects that use this room
         """
-        return [
-            c for c in self.config_model.config.config.courses if room_name in c.room
-        ]
+        return self.config_model.index.courses_referencing("room", room_name)
 
     def get_affected_faculty(self, room_name: str) -> list:
         """
@@ -153,8 +214,4 @@ class RoomModel:
         Returns:
             list: List of FacultyConfig objects with preferences for this room
         """
-        return [
-            f
-            for f in self.config_model.config.config.faculty
-            if room_name in f.room_preferences
-        ]
+        return self.config_model.index.faculty_referencing("room", room_name)
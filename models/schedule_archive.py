@@ -0,0 +1,285 @@
+# models/schedule_archive.py
+"""
+ScheduleArchive - Compact binary schedule archive with random access
+
+Neither CSV nor JSON can jump to a single schedule without parsing every
+schedule before it. The archive format stores schedules as fixed-width
+records behind an offset index so any schedule can be read in O(1), and
+is laid out so a file can be opened through mmap without reading it.
+
+File layout (all integers little-endian):
+
+    header   magic "NVSA", version, schedule count, and the offsets of
+             the string table, slot table, records and index
+    strings  u32 count, then (u32 length + UTF-8 bytes) per string
+    slots    u32 count, then per time slot:
+             i8 lab_index (-1 for none), u8 time count,
+             (u8 day, u16 start, u16 duration) per time
+    records  per schedule: u32 course-instance count, then per instance
+             five u32 fields (course, faculty, room, lab, slot).
+             Course, faculty, room and lab are string ids (NONE_ID for
+             None) and slot is a slot-table id.
+    index    u64 byte offset of each schedule record
+"""
+
+import mmap
+import struct
+import tempfile
+from collections.abc import Sequence
+
+MAGIC = b"NVSA"
+VERSION = 1
+NONE_ID = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHIQQQQ")
+_COUNT = struct.Struct("<I")
+_SLOT_HEAD = struct.Struct("<bB")
+_TIME = struct.Struct("<BHH")
+_INSTANCE = struct.Struct("<IIIII")
+_OFFSET = struct.Struct("<Q")
+
+# Size of the chunks yielded while copying encoded records
+_CHUNK_SIZE = 1 << 16
+
+
+def _instance_fields(ci) -> tuple:
+    """
+    Extract the archived fields from a CourseInstance.
+
+    Returns:
+        tuple: (course_str, faculty, room, lab, lab_index, times)
+    """
+    times = tuple((int(t.day), t.start.value, t.duration.value) for t in ci.times)
+    return (ci.course_str, ci.faculty, ci.room, ci.lab, ci.time.lab_index, times)
+
+
+def stream_archive(schedules):
+    """
+    Encode schedules into the archive format, yielding byte chunks.
+
+    Records are encoded in a single pass into a spooled temporary file while
+    the string and slot tables are collected, so schedules may be a generator.
+
+    Parameters:
+        schedules (Iterable[list]): Schedules of CourseInstance objects
+
+    Returns:
+        Iterator[bytes]: Encoded archive chunks
+    """
+    strings: dict[str, int] = {}
+    slots: dict[tuple, int] = {}
+    offsets: list[int] = []
+
+    def string_id(value) -> int:
+        if value is None:
+            return NONE_ID
+        return strings.setdefault(value, len(strings))
+
+    with tempfile.SpooledTemporaryFile(max_size=_CHUNK_SIZE * 64) as records:
+        position = 0
+        for schedule in schedules:
+            offsets.append(position)
+            chunk = [_COUNT.pack(len(schedule))]
+            for ci in schedule:
+                course, faculty, room, lab, lab_index, times = _instance_fields(ci)
+                slot = slots.setdefault((lab_index, times), len(slots))
+                chunk.append(
+                    _INSTANCE.pack(
+                        string_id(course),
+                        string_id(faculty),
+                        string_id(room),
+                        string_id(lab),
+                        slot,
+                    )
+                )
+            data = b"".join(chunk)
+            records.write(data)
+            position += len(data)
+
+        string_table = [_COUNT.pack(len(strings))]
+        for value in strings:
+            encoded = value.encode("utf-8")
+            string_table.append(_COUNT.pack(len(encoded)) + encoded)
+        string_bytes = b"".join(string_table)
+
+        slot_table = [_COUNT.pack(len(slots))]
+        for lab_index, times in slots:
+            slot_table.append(
+                _SLOT_HEAD.pack(-1 if lab_index is None else lab_index, len(times))
+            )
+            slot_table.extend(_TIME.pack(*t) for t in times)
+        slot_bytes = b"".join(slot_table)
+
+        strings_offset = _HEADER.size
+        slots_offset = strings_offset + len(string_bytes)
+        records_offset = slots_offset + len(slot_bytes)
+        index_offset = records_offset + position
+
+        yield _HEADER.pack(
+            MAGIC,
+            VERSION,
+            0,
+            len(offsets),
+            strings_offset,
+            slots_offset,
+            records_offset,
+            index_offset,
+        )
+        yield string_bytes
+        yield slot_bytes
+
+        records.seek(0)
+        while chunk := records.read(_CHUNK_SIZE):
+            yield chunk
+
+    yield b"".join(_OFFSET.pack(records_offset + o) for o in offsets)
+
+
+class ScheduleArchive(Sequence):
+    """
+    Random-access reader for the binary schedule archive.
+
+    Opening an archive only parses the header and the (deduplicated) string
+    and slot tables. Each schedule is decoded on demand from its index entry.
+
+    Attributes:
+        count (int): Number of schedules in the archive
+    """
+
+    def __init__(self, source, build_schedule=None):
+        """
+        Open an archive.
+
+        Parameters:
+            source (str | bytes | bytearray | memoryview): Path to an archive
+                file (memory-mapped) or the archive bytes themselves
+            build_schedule (Callable | None): Converts a list of decoded
+                instance tuples into a schedule. Defaults to returning the
+                tuples unchanged.
+
+        Raises:
+            ValueError: If the data is not a valid schedule archive
+        """
+        self._mmap = None
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self._buffer = memoryview(source)
+        else:
+            # The map holds its own handle, so the file can be closed now
+            with open(source, "rb") as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)
+        self._build_schedule = build_schedule
+
+        if len(self._buffer) < _HEADER.size:
+            self.close()
+            raise ValueError("Not a schedule archive")
+        (
+            magic,
+            version,
+            _,
+            self.count,
+            strings_offset,
+            slots_offset,
+            self._records_offset,
+            self._index_offset,
+        ) = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError("Not a schedule archive")
+
+        self._strings = self._read_strings(strings_offset)
+        self._slots = self._read_slots(slots_offset)
+
+    def _read_strings(self, offset: int) -> list[str]:
+        (count,) = _COUNT.unpack_from(self._buffer, offset)
+        offset += _COUNT.size
+        strings = []
+        for _ in range(count):
+            (length,) = _COUNT.unpack_from(self._buffer, offset)
+            offset += _COUNT.size
+            strings.append(
+                bytes(self._buffer[offset : offset + length]).decode("utf-8")
+            )
+            offset += length
+        return strings
+
+    def _read_slots(self, offset: int) -> list[tuple]:
+        (count,) = _COUNT.unpack_from(self._buffer, offset)
+        offset += _COUNT.size
+        slots = []
+        for _ in range(count):
+            lab_index, n_times = _SLOT_HEAD.unpack_from(self._buffer, offset)
+            offset += _SLOT_HEAD.size
+            times = []
+            for _ in range(n_times):
+                times.append(_TIME.unpack_from(self._buffer, offset))
+                offset += _TIME.size
+            slots.append((None if lab_index < 0 else lab_index, times))
+        return slots
+
+    def _string(self, string_id: int):
+        return None if string_id == NONE_ID else self._strings[string_id]
+
+    def read_records(self, index: int) -> list[tuple]:
+        """
+        Decode one schedule without building any model objects.
+
+        Parameters:
+            index (int): Schedule position (negative values count from the end)
+
+        Returns:
+            list[tuple]: (course_str, faculty, room, lab, lab_index, times)
+                per course instance, where times is a list of
+                (day, start, duration) tuples
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("schedule index out of range")
+        (offset,) = _OFFSET.unpack_from(
+            self._buffer, self._index_offset + index * _OFFSET.size
+        )
+        (n_instances,) = _COUNT.unpack_from(self._buffer, offset)
+        offset += _COUNT.size
+        records = []
+        for course, faculty, room, lab, slot in _INSTANCE.iter_unpack(
+            self._buffer[offset : offset + n_instances * _INSTANCE.size]
+        ):
+            lab_index, times = self._slots[slot]
+            records.append(
+                (
+                    self._string(course),
+                    self._string(faculty),
+                    self._string(room),
+                    self._string(lab),
+                    lab_index,
+                    times,
+                )
+            )
+        return records
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.count))]
+        records = self.read_records(index)
+        if self._build_schedule is None:
+            return records
+        return self._build_schedule(records)
+
+    def close(self) -> None:
+        """
+        Release the memory map, if any.
+        """
+        self._buffer.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
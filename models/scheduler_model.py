@@ -6,9 +6,25 @@ This model class manages schedule generation using the Scheduler class.
 """
 
 import csv
+import hashlib
 import json
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from scheduler import Scheduler
+from models.decomposition import (
+    component_configs,
+    interaction_components,
+    stream_product,
+)
+from models.schedule_archive import ScheduleArchive, stream_archive
+from models.lazy_schedules import (
+    DEFAULT_CACHE_SIZE,
+    LazyScheduleList,
+    index_csv_spans,
+    index_json_spans,
+    index_ndjson_spans,
+)
 from scheduler.models import (
     CourseInstance,
     TimeInstance,
@@ -40,12 +56,17 @@ class SchedulerModel:
         """
         self.config_model = config_model
 
-    def generate_schedules(self, limit: int | None = None):
+    def generate_schedules(self, limit: int | None = None, decompose: bool = True):
         """
         Generate schedules using the Scheduler.
 
+        When the sections split into independent components (no shared
+        faculty, rooms, labs or conflicts), each component is solved by its
+        own Scheduler in parallel and the schedules are combined lazily.
+
         Parameters:
             limit (int | None): Maximum number of schedules to generate
+            decompose (bool): Solve independent components separately
 
         Returns:
             generator: Generator yielding schedule models
@@ -54,10 +75,37 @@ class SchedulerModel:
         if limit is not None:
             self.config_model.config.limit = limit
 
+        config = self.config_model.config
+        components = interaction_components(config.config) if decompose else []
+        if len(components) > 1:
+            return self._generate_decomposed(config, components)
+
         # Create scheduler and generate
-        scheduler_gen = Scheduler(self.config_model.config)
+        scheduler_gen = Scheduler(config)
         return scheduler_gen.get_models()
 
+    def _generate_decomposed(self, config, components: list[list[int]]):
+        """
+        Solve each component separately and yield combined schedules.
+
+        Course instances are put back in config order, so a combined
+        schedule has the same shape as one from a single Scheduler.
+        """
+
+        def solve(sub_config):
+            yield from Scheduler(sub_config).get_models()
+
+        streams = [solve(sub) for sub in component_configs(config, components)]
+        size = len(config.config.courses)
+        workers = min(len(streams), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for parts in stream_product(streams, config.limit, executor):
+                schedule = [None] * size
+                for component, part in zip(components, parts):
+                    for position, instance in zip(component, part):
+                        schedule[position] = instance
+                yield schedule
+
     def count_possible_schedules(self, max_check: int = 100) -> int:
         """
         Count how many schedules can be generated (up to max_check).
@@ -134,86 +182,100 @@ class SchedulerModel:
         """
 
         text = file_bytes.decode("utf-8")
-        reader = csv.reader(io.StringIO(text))
+        return list(self.iter_csv(io.StringIO(text)))
+
+    def iter_csv(self, lines):
+        """
+        Parse schedule CSV incrementally, yielding one schedule at a time.
+
+        Parameters:
+            lines (Iterable[str]): Text lines, e.g. an open text file
+
+        Returns:
+            Iterator[list[CourseInstance]]: Parsed schedules
+        """
 
-        schedules = []
+        reader = csv.reader(lines)
         schedule = []
 
         for row in reader:
             # ---- Empty line means new schedule ----
             if not row or all(cell.strip() == "" for cell in row):
                 if schedule:
-                    schedules.append(schedule)
+                    yield schedule
                     schedule = []
                 continue
 
-            course_str = row[0]
-            faculty = row[1]
-            room = row[2]
-            lab = row[3]
-
-            # Convert "None" string to actual None
-            if lab == "None":
-                lab = None
-
-            # Remaining columns are time strings
-            time_strings = row[4:]
-
-            times = []
-            day_map = {
-                "MON": 1,
-                "TUE": 2,
-                "WED": 3,
-                "THU": 4,
-                "FRI": 5,
-            }
-
-            lab_index = None
-
-            for idx, t in enumerate(time_strings):
-                # Check if this is the lab time
-                is_lab = t.endswith("^")
-                if is_lab:
-                    t = t.rstrip("^")
-                    lab_index = idx  # mark the lab index
-                # Example format: "MON 09:00-09:50"
-                day_part, time_part = t.split(" ")
-                start_str, end_str = time_part.split("-")
-                # ---- Convert start time ----
-                start_hr, start_min = map(int, start_str.split(":"))
-                start_tp = TimePoint.make_from(start_hr, start_min)
-
-                # ---- Convert end time ----
-                end_hr, end_min = map(int, end_str.split(":"))
-                end_tp = TimePoint.make_from(end_hr, end_min)
-
-                time_instance = self._build_time_instance(
-                    {
-                        "day": day_map.get(day_part.upper()),
-                        "start": start_tp.value,
-                        "duration": end_tp.value - start_tp.value,
-                    }
-                )
+            schedule.append(self._build_csv_instance(row))
 
-                times.append(time_instance)
+        # ---- Add final schedule if file doesn't end with empty line ----
+        if schedule:
+            yield schedule
 
-            dummy_course = self._build_dummy_course(course_str, faculty=faculty)
+    def _build_csv_instance(self, row: list[str]) -> CourseInstance:
+        """
+        Convert one CSV row into a CourseInstance.
+        """
 
-            ci = CourseInstance(
-                course=dummy_course,
-                time=TimeSlot(times=times, lab_index=lab_index),
-                faculty=faculty,
-                room=room,
-                lab=lab,
+        course_str = row[0]
+        faculty = row[1]
+        room = row[2]
+        lab = row[3]
+
+        # Convert "None" string to actual None
+        if lab == "None":
+            lab = None
+
+        # Remaining columns are time strings
+        time_strings = row[4:]
+
+        times = []
+        day_map = {
+            "MON": 1,
+            "TUE": 2,
+            "WED": 3,
+            "THU": 4,
+            "FRI": 5,
+        }
+
+        lab_index = None
+
+        for idx, t in enumerate(time_strings):
+            # Check if this is the lab time
+            is_lab = t.endswith("^")
+            if is_lab:
+                t = t.rstrip("^")
+                lab_index = idx  # mark the lab index
+            # Example format: "MON 09:00-09:50"
+            day_part, time_part = t.split(" ")
+            start_str, end_str = time_part.split("-")
+            # ---- Convert start time ----
+            start_hr, start_min = map(int, start_str.split(":"))
+            start_tp = TimePoint.make_from(start_hr, start_min)
+
+            # ---- Convert end time ----
+            end_hr, end_min = map(int, end_str.split(":"))
+            end_tp = TimePoint.make_from(end_hr, end_min)
+
+            time_instance = self._build_time_instance(
+                {
+                    "day": day_map.get(day_part.upper()),
+                    "start": start_tp.value,
+                    "duration": end_tp.value - start_tp.value,
+                }
             )
 
-            schedule.append(ci)
+            times.append(time_instance)
 
-        # ---- Add final schedule if file doesn't end with empty line ----
-        if schedule:
-            schedules.append(schedule)
+        dummy_course = self._build_dummy_course(course_str, faculty=faculty)
 
-        return schedules
+        return CourseInstance(
+            course=dummy_course,
+            time=TimeSlot(times=times, lab_index=lab_index),
+            faculty=faculty,
+            room=room,
+            lab=lab,
+        )
 
     def export_to_csv(self, schedules: list[list]):
         """
@@ -222,17 +284,28 @@ class SchedulerModel:
         Returns: bytes
         """
 
-        output = io.StringIO()
+        return b"".join(self.stream_csv(schedules))
+
+    def stream_csv(self, schedules):
+        """
+        Stream schedules as CSV, one schedule per chunk.
+        Multiple schedules are separated by a blank line.
+
+        Parameters:
+            schedules (Iterable[list]): Schedules to export (list or generator)
+
+        Returns:
+            Iterator[bytes]: Encoded CSV chunks
+        """
 
         for schedule_index, schedule in enumerate(schedules):
-            for ci in schedule:
-                output.write(ci.as_csv() + "\n")
+            chunk = "".join(ci.as_csv() + "\n" for ci in schedule)
 
             # Separate schedules with blank line
-            if schedule_index < len(schedules) - 1:
-                output.write("\n")
+            if schedule_index > 0:
+                chunk = "\n" + chunk
 
-        return output.getvalue().encode("utf-8")
+            yield chunk.encode("utf-8")
 
     def import_from_json(self, file_bytes: bytes):
         """
@@ -243,58 +316,355 @@ class SchedulerModel:
         text = file_bytes.decode("utf-8")
         raw_schedules = json.loads(text)
 
-        schedules = []
+        return [self._build_json_schedule(data) for data in raw_schedules]
 
-        for schedule_data in raw_schedules:
-            schedule = []
+    def iter_json(self, stream, chunk_size: int = 1 << 16):
+        """
+        Parse a JSON array of schedules incrementally from a text stream.
 
-            for ci_data in schedule_data:
-                print("building time instances")
-                # times is the days + duration + start time
-                times = [self._build_time_instance(t) for t in ci_data.get("times", [])]
+        Only the schedule currently being decoded is buffered, so memory use
+        does not grow with the size of the file.
 
-                course_str = ci_data.get("course_str")
-                print("building dummy course instances")
-                dummy_course = self._build_dummy_course(
-                    course_str, faculty=ci_data.get("faculty")
-                )
-                print("building instances done")
-                # need to make course instances for EVERY time in times[]
-
-                ci = CourseInstance(
-                    course=dummy_course,
-                    time=TimeSlot(times=times, lab_index=ci_data.get("lab_index")),
-                    faculty=ci_data.get("faculty"),
-                    room=ci_data.get("room"),
-                    lab=ci_data.get("lab"),
-                )
-                schedule.append(ci)
+        Parameters:
+            stream (TextIO): Text stream positioned at the start of the array
+            chunk_size (int): Number of characters read per refill
 
-            schedules.append(schedule)
-        print("returning schedules as list[list[CourseInstance]]")
-        return schedules
+        Returns:
+            Iterator[list[CourseInstance]]: Parsed schedules
+
+        Raises:
+            json.JSONDecodeError: If the stream is not a JSON array
+        """
 
-    def export_to_json(self, schedules: list[list]):
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+        expecting = "["
+
+        while True:
+            # Skip whitespace, refilling the buffer as needed
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                buffer, pos = stream.read(chunk_size), 0
+                eof = not buffer
+
+            if pos >= len(buffer):
+                raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+
+            char = buffer[pos]
+            if expecting == "[":
+                if char != "[":
+                    raise json.JSONDecodeError("Expected '['", buffer, pos)
+                pos += 1
+                expecting = "first"
+                continue
+            if char == "]" and expecting in ("first", ","):
+                return
+            if expecting == ",":
+                if char != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+                pos += 1
+                expecting = "value"
+                continue
+
+            # Decode one element, reading more data until it is complete
+            while True:
+                try:
+                    data, end = decoder.raw_decode(buffer, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more = stream.read(chunk_size)
+                    eof = not more
+                    buffer = buffer[pos:] + more
+                    pos = 0
+
+            yield self._build_json_schedule(data)
+            buffer, pos = buffer[end:], 0
+            expecting = ","
+
+    def import_from_ndjson(self, file_bytes: bytes):
+        """
+        Import newline-delimited JSON (one schedule per line).
+        Returns list[list[CourseInstance]].
+        """
+
+        text = file_bytes.decode("utf-8")
+        return list(self.iter_ndjson(io.StringIO(text)))
+
+    def iter_ndjson(self, lines):
+        """
+        Parse newline-delimited JSON incrementally, one schedule per line.
+
+        Parameters:
+            lines (Iterable[str]): Text lines, e.g. an open text file
+
+        Returns:
+            Iterator[list[CourseInstance]]: Parsed schedules
+        """
+
+        for line in lines:
+            if line.strip():
+                yield self._build_json_schedule(json.loads(line))
+
+    def _build_json_schedule(self, schedule_data: list[dict]) -> list:
+        """
+        Convert one decoded JSON schedule into CourseInstance objects.
+        """
+
+        schedule = []
+
+        for ci_data in schedule_data:
+            # times is the days + duration + start time
+            times = [self._build_time_instance(t) for t in ci_data.get("times", [])]
+
+            course_str = ci_data.get("course_str")
+            dummy_course = self._build_dummy_course(
+                course_str, faculty=ci_data.get("faculty")
+            )
+
+            ci = CourseInstance(
+                course=dummy_course,
+                time=TimeSlot(times=times, lab_index=ci_data.get("lab_index")),
+                faculty=ci_data.get("faculty"),
+                room=ci_data.get("room"),
+                lab=ci_data.get("lab"),
+            )
+            schedule.append(ci)
+
+        return schedule
+
+    def schedule_fingerprint(self, schedule: list) -> str:
+        """
+        Compute an order-independent fingerprint of a schedule.
+
+        Two schedules containing the same course instances (same course,
+        faculty, room, lab and times) share a fingerprint regardless of the
+        order they were written in, so duplicates across files can be found.
+
+        Parameters:
+            schedule (list): List of CourseInstance objects
+
+        Returns:
+            str: Hex digest identifying the schedule
+        """
+
+        lines = sorted(ci.as_csv() for ci in schedule)
+        return hashlib.blake2b(
+            "\n".join(lines).encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def _schedule_to_dicts(self, schedule: list) -> list[dict]:
+        """
+        Convert one schedule into a list of JSON-ready dictionaries.
+        """
+
+        json_schedule = []
+
+        for course in schedule:
+            # Prefer object serialization if available
+            if hasattr(course, "as_dict"):
+                json_data = course.as_dict()
+            else:
+                json_data = course.model_dump()
+
+            json_schedule.append(json_data)
+
+        return json_schedule
+
+    def export_to_json(self, schedules: list[list], indent: int | None = 2):
         """
         Export generated/imported schedules to JSON.
         Each schedule is a list of CourseInstance objects.
         Returns bytes for browser download.
+
+        Parameters:
+            schedules (list[list]): Schedules to export
+            indent (int | None): Indentation level, or None for compact output
+        """
+
+        return b"".join(self.stream_json(schedules, indent=indent))
+
+    def stream_json(self, schedules, indent: int | None = 2):
+        """
+        Stream schedules as a JSON array, serializing one schedule at a time.
+
+        The output is byte-for-byte identical to json.dumps() over the whole
+        list, but only a single schedule is held in memory at once.
+
+        Parameters:
+            schedules (Iterable[list]): Schedules to export (list or generator)
+            indent (int | None): Indentation level, or None for compact output
+
+        Returns:
+            Iterator[bytes]: Encoded JSON chunks
+        """
+
+        if indent is None:
+            separator, opening, closing = ",", "[", "]"
+        else:
+            separator, opening, closing = ",\n", "[\n", "\n]"
+        pad = " " * (indent or 0)
+
+        first = True
+        for schedule in schedules:
+            json_schedule = self._schedule_to_dicts(schedule)
+            if indent is None:
+                text = json.dumps(json_schedule, separators=(",", ":"))
+            else:
+                # Nest the schedule one level deeper inside the outer array.
+                # JSON strings never contain raw newlines, so this is safe.
+                text = json.dumps(json_schedule, indent=indent)
+                text = "\n".join(pad + line for line in text.split("\n"))
+
+            yield ((opening if first else separator) + text).encode("utf-8")
+            first = False
+
+        yield b"[]" if first else closing.encode("utf-8")
+
+    def export_to_ndjson(self, schedules: list[list]):
+        """
+        Export schedules as newline-delimited JSON (one schedule per line).
+        Returns bytes for browser download.
         """
 
-        schedule_list = []
+        return b"".join(self.stream_ndjson(schedules))
+
+    def stream_ndjson(self, schedules):
+        """
+        Stream schedules as newline-delimited JSON, one compact schedule per line.
+
+        Parameters:
+            schedules (Iterable[list]): Schedules to export (list or generator)
+
+        Returns:
+            Iterator[bytes]: Encoded NDJSON lines
+        """
 
         for schedule in schedules:
-            json_schedule = []
+            line = json.dumps(self._schedule_to_dicts(schedule), separators=(",", ":"))
+            yield (line + "\n").encode("utf-8")
+
+    def _build_archive_schedule(self, records: list[tuple]) -> list:
+        """
+        Build CourseInstance objects from decoded archive records.
+        """
+
+        schedule = []
+        for course_str, faculty, room, lab, lab_index, times in records:
+            time_instances = [
+                self._build_time_instance({"day": d, "start": s, "duration": dur})
+                for d, s, dur in times
+            ]
+            schedule.append(
+                CourseInstance(
+                    course=self._build_dummy_course(course_str, faculty=faculty),
+                    time=TimeSlot(times=time_instances, lab_index=lab_index),
+                    faculty=faculty,
+                    room=room,
+                    lab=lab,
+                )
+            )
+        return schedule
+
+    def open_archive(self, source) -> ScheduleArchive:
+        """
+        Open a binary schedule archive for random access.
+
+        Only the header and string tables are read up front; each schedule
+        is decoded into CourseInstance objects when it is indexed.
+
+        Parameters:
+            source (str | bytes): Archive file path (memory-mapped) or bytes
+
+        Returns:
+            ScheduleArchive: Sequence of schedules
+        """
+
+        return ScheduleArchive(source, build_schedule=self._build_archive_schedule)
+
+    def import_from_archive(self, file_bytes: bytes):
+        """
+        Import every schedule from a binary schedule archive.
+        Returns list[list[CourseInstance]].
+        """
+
+        archive = self.open_archive(file_bytes)
+        try:
+            return list(archive)
+        finally:
+            archive.close()
+
+    def open_lazy(
+        self,
+        file_bytes: bytes,
+        format_type: str,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        """
+        Index a schedule file without building its schedules.
+
+        Only the byte range of each schedule is found up front; a schedule
+        is parsed into CourseInstance objects the first time it is indexed
+        and kept in a small LRU cache.
+
+        Parameters:
+            file_bytes (bytes): File contents
+            format_type (str): 'csv', 'json', 'ndjson' or 'sarc'
+            cache_size (int): Maximum number of parsed schedules to keep
 
-            for course in schedule:
-                # Prefer object serialization if available
-                if hasattr(course, "as_dict"):
-                    json_data = course.as_dict()
-                else:
-                    json_data = course.model_dump()
+        Returns:
+            LazyScheduleList: Sequence of schedules
+
+        Raises:
+            ValueError: If the format is not supported or the file is malformed
+        """
 
-                json_schedule.append(json_data)
+        if format_type == "csv":
+            spans = index_csv_spans(file_bytes)
+
+            def parse(data: bytes) -> list:
+                return next(self.iter_csv(io.StringIO(data.decode("utf-8"))))
+
+        elif format_type in ("json", "ndjson"):
+            if format_type == "json":
+                spans = index_json_spans(file_bytes)
+            else:
+                spans = index_ndjson_spans(file_bytes)
 
-            schedule_list.append(json_schedule)
+            def parse(data: bytes) -> list:
+                return self._build_json_schedule(json.loads(data))
+
+        elif format_type == "sarc":
+            archive = self.open_archive(file_bytes)
+            return LazyScheduleList(len(archive), archive.__getitem__, cache_size)
+        else:
+            raise ValueError("Unsupported file type")
+
+        return LazyScheduleList.from_spans(file_bytes, spans, parse, cache_size)
+
+    def export_to_archive(self, schedules: list[list]):
+        """
+        Export schedules to the binary archive format.
+        Returns bytes for browser download.
+        """
+
+        return b"".join(self.stream_archive(schedules))
+
+    def stream_archive(self, schedules):
+        """
+        Stream schedules in the binary archive format.
+
+        Parameters:
+            schedules (Iterable[list]): Schedules to export (list or generator)
+
+        Returns:
+            Iterator[bytes]: Encoded archive chunks
+        """
 
-        return json.dumps(schedule_list, indent=2).encode("utf-8")
+        return stream_archive(schedules)
@@ -3,9 +3,210 @@
 
 import shutil
 import tempfile
+import threading
 import os
 import json
 
+from config_metadata import remember_metadata
+
+# Sections save_configuration() knows how to merge
+SECTIONS = ("rooms", "labs", "courses", "faculty", "time_slot_config")
+
+# Parsed baseline documents keyed by absolute path -> ((mtime_ns, size), data).
+# An entry is handed to the save that reads it and re-added once the merged
+# document is written, so a failed save never leaves a half-merged copy behind.
+_baseline_cache: dict[str, tuple[tuple[int, int], dict]] = {}
+
+
+def _file_stamp(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_baseline(path: str) -> dict:
+    """
+    Return the parsed JSON at path, reusing the cached copy if the file
+    has not changed on disk since it was last written or read.
+    """
+    key = os.path.abspath(path)
+    cached = _baseline_cache.pop(key, None)
+    if cached is not None and cached[0] == _file_stamp(path):
+        return cached[1]
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _remember_baseline(path: str, data: dict) -> None:
+    _baseline_cache[os.path.abspath(path)] = (_file_stamp(path), data)
+
+
+def _forget_baseline(path: str) -> None:
+    _baseline_cache.pop(os.path.abspath(path), None)
+
+
+class DirtyState:
+    """
+    Tracks which config sections and entities changed since the last save.
+
+    Each dirty section maps to a set of entity keys (course ids for
+    'courses', faculty names for 'faculty') or to None when the whole
+    section must be rewritten. Two views are kept: changes not yet written
+    to the '.temp' file and changes not yet committed to the main config,
+    because a temp save with no '.temp' file merges onto the main config.
+    Methods are thread-safe so saves can run on a background thread.
+
+    Attributes:
+        version (int): Incremented on every change
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._lock = threading.RLock()
+        self._uncommitted: dict[str, set | None] = {}
+        # The '.temp' file may hold anything until it is rewritten
+        self._pending: dict[str, set | None] = dict.fromkeys(SECTIONS)
+        self._course_dumps: dict[int, tuple[object, dict]] = {}
+        self._stale_courses: set | None = None
+
+    @staticmethod
+    def _add(changes: dict, section: str, key) -> None:
+        if section in changes and changes[section] is None:
+            return
+        if key is None:
+            changes[section] = None
+        else:
+            changes.setdefault(section, set()).add(key)
+
+    def mark(self, section: str, key=None, committed: bool = False) -> None:
+        """
+        Record a change to a section, or to one entity within it.
+
+        Parameters:
+            section (str): 'rooms', 'labs', 'courses', 'faculty' or 'time_slot_config'
+            key (str | None): Course id or faculty name; None marks the whole section
+            committed (bool): The change is already in the main config file
+                (an external edit), so only the '.temp' file has to follow it
+        """
+        with self._lock:
+            self.version += 1
+            if not committed:
+                self._add(self._uncommitted, section, key)
+            self._add(self._pending, section, key)
+            if section == "courses":
+                if key is None:
+                    self._stale_courses = None
+                    self._course_dumps.clear()
+                elif self._stale_courses is not None:
+                    self._stale_courses.add(key)
+
+    def temp_changes(self, temp_exists: bool, sections) -> dict[str, set | None]:
+        """
+        Remove and return the changes a temp save has to merge onto its baseline.
+
+        Parameters:
+            temp_exists (bool): Whether the '.temp' file exists (otherwise the
+                main config file is the baseline)
+            sections (Iterable[str]): Sections being saved
+        """
+        with self._lock:
+            if not temp_exists:
+                self._pending = {
+                    section: None if keys is None else set(keys)
+                    for section, keys in self._uncommitted.items()
+                }
+            return self.take(sections)
+
+    def take(self, sections) -> dict[str, set | None]:
+        """
+        Remove and return the unsaved changes for the given sections.
+        """
+        with self._lock:
+            return {s: self._pending.pop(s) for s in sections if s in self._pending}
+
+    def restore(self, changes: dict[str, set | None]) -> None:
+        """
+        Put back changes taken by a save that failed.
+        """
+        with self._lock:
+            for section, keys in changes.items():
+                for key in [None] if keys is None else keys:
+                    self._add(self._pending, section, key)
+
+    def synced(self) -> None:
+        """
+        Mark the temp store as matching memory, e.g. after a journal replay.
+        """
+        with self._lock:
+            self._pending = {}
+
+    def reset_pending(self) -> None:
+        """
+        Treat every uncommitted change as unsaved again, e.g. after the temp
+        store was discarded.
+        """
+        with self._lock:
+            self._pending = {
+                section: None if keys is None else set(keys)
+                for section, keys in self._uncommitted.items()
+            }
+
+    def uncommitted(self) -> dict[str, set | None]:
+        """
+        Return a copy of the changes not yet committed to the main config.
+        """
+        with self._lock:
+            return {
+                section: None if keys is None else set(keys)
+                for section, keys in self._uncommitted.items()
+            }
+
+    def committed(self) -> None:
+        """
+        Clear all changes after the main config file was rewritten.
+        """
+        with self._lock:
+            self._uncommitted = {}
+            self._pending = {}
+
+    def reset(self) -> None:
+        """
+        Forget all changes after the config was reloaded from disk.
+        """
+        with self._lock:
+            self.version += 1
+            self._uncommitted = {}
+            self._pending = dict.fromkeys(SECTIONS)
+            self._course_dumps.clear()
+            self._stale_courses = set()
+
+    def dump_courses(self, courses) -> list[dict]:
+        """
+        Serialize the course list, re-dumping only courses marked dirty.
+        """
+        with self._lock:
+            stale = self._stale_courses
+            self._stale_courses = set()
+            if stale is None:
+                self._course_dumps = {}
+            elif stale:
+                self._course_dumps = {
+                    k: v
+                    for k, v in self._course_dumps.items()
+                    if v[0].course_id not in stale
+                }
+            cache = self._course_dumps
+
+        dumps = {}
+        result = []
+        for course in courses:
+            cached = cache.get(id(course))
+            if cached is None or cached[0] is not course:
+                cached = (course, course.model_dump(mode="json", exclude_unset=True))
+            dumps[id(course)] = cached
+            result.append(cached[1])
+        self._course_dumps = dumps
+        return result
+
 
 def safe_save(config, config_path: str) -> bool:
     """
@@ -22,7 +223,11 @@ def safe_save(config, config_path: str) -> bool:
 
 
 def save_configuration(
-    config, config_path: str, save_type: str, feature: str = "all"
+    config,
+    config_path: str,
+    save_type: str,
+    feature: str = "all",
+    dirty: DirtyState | None = None,
 ) -> bool:
     """
     Saves configuration data safely, supporting progressive temporary saves.
@@ -32,16 +237,18 @@ def save_configuration(
         config_path: Path to the main configuration JSON file.
         save_type: 'temp' (saves to a .temp file) or 'config' (commits .temp to main config file).
         feature: The specific feature section to save (e.g., 'faculty', 'courses', 'rooms', 'labs', 'all').
+        dirty: Optional change tracking for temp saves. When given, only the
+            sections and faculty entries marked dirty are serialized and merged;
+            otherwise every requested section is rewritten from memory.
 
     Returns:
         bool: True if saved successfully, False otherwise.
     """
+    dirty_changes = None
     try:
         temp_path = config_path + ".temp"
         valid_courses = {c.course_id for c in config.config.courses}
-
-        # Build the updated data from Pydantic but only for sections we manage
-        updated = json.loads(config.model_dump_json(exclude_unset=True))
+        sections = SECTIONS if feature == "all" else (feature,)
 
         # Determine the target file to read as our baseline
         target_read_path = config_path
@@ -49,13 +256,45 @@ def save_configuration(
             target_read_path = temp_path
 
         # Load baseline data
-        if os.path.exists(target_read_path):
-            with open(target_read_path, "r") as f:
-                target_data = json.load(f)
+        baseline_exists = os.path.exists(target_read_path)
+        if baseline_exists:
+            target_data = _load_baseline(target_read_path)
         else:
             # If no file exists yet (imported config), use in-memory config
             target_data = json.loads(config.model_dump_json())
 
+        if dirty is not None and save_type == "temp" and baseline_exists:
+            dirty_changes = dirty.temp_changes(target_read_path == temp_path, sections)
+
+        if dirty_changes is None:
+            # Build the updated data from Pydantic but only for sections we manage
+            updated = json.loads(config.model_dump_json(exclude_unset=True))
+            changes = dict.fromkeys(sections)
+        else:
+            # Serialize only the sections that changed
+            changes = dict(dirty_changes)
+            # The time slot page edits its config in place, so always include it
+            if "time_slot_config" in sections:
+                changes["time_slot_config"] = None
+            updated = {"config": {}}
+            if "time_slot_config" in changes:
+                updated["time_slot_config"] = config.time_slot_config.model_dump(
+                    mode="json", exclude_unset=True
+                )
+            if "rooms" in changes:
+                updated["config"]["rooms"] = list(config.config.rooms)
+            if "labs" in changes:
+                updated["config"]["labs"] = list(config.config.labs)
+            if "courses" in changes:
+                updated["config"]["courses"] = dirty.dump_courses(config.config.courses)
+            if "faculty" in changes:
+                names = changes["faculty"]
+                updated["config"]["faculty"] = [
+                    fac.model_dump(mode="json", exclude_unset=True)
+                    for fac in config.config.faculty
+                    if names is None or fac.name in names
+                ]
+
         # Helper to apply a specific feature update to the dictionary
         def update_feature(feat_name):
             if feat_name == "time_slot_config":
@@ -67,6 +306,8 @@ def save_configuration(
                 existing_raw_by_name = {fac["name"]: fac for fac in existing_raw_list}
                 in_memory_faculty = updated["config"]["faculty"]
                 in_memory_by_name = {fac["name"]: fac for fac in in_memory_faculty}
+                # None means every faculty entry was serialized
+                changed_names = changes["faculty"]
 
                 result = []
 
@@ -76,6 +317,9 @@ def save_configuration(
                 # Faculty not in memory anymore were deleted -- they are skipped.
                 for raw_fac in existing_raw_list:
                     name = raw_fac["name"]
+                    if changed_names is not None and name not in changed_names:
+                        result.append(raw_fac)  # untouched
+                        continue
                     if name not in in_memory_by_name:
                         continue  # deleted
                     mem_fac = in_memory_by_name[name]
@@ -103,11 +347,8 @@ def save_configuration(
                 target_data["config"]["faculty"] = result
 
         # Apply updates based on feature argument
-        if feature == "all":
-            for feat in ["rooms", "labs", "courses", "faculty", "time_slot_config"]:
-                update_feature(feat)
-        else:
-            update_feature(feature)
+        for feat in changes:
+            update_feature(feat)
 
         dir_name = os.path.dirname(os.path.abspath(config_path))
 
@@ -116,12 +357,14 @@ def save_configuration(
             mode="w", dir=dir_name, delete=False, suffix=".tmp"
         ) as tmp:
             safe_tmp_path = tmp.name
-            json.dump(target_data, tmp, indent=2)
+            text = json.dumps(target_data, indent=2)
+            tmp.write(text)
 
         if save_type == "temp":
             # Move our safe tmp file to the .temp accumulator file
             shutil.copy(safe_tmp_path, temp_path)
             os.remove(safe_tmp_path)
+            _remember_baseline(temp_path, target_data)
             print(f"Temporary changes for '{feature}' saved successfully.")
 
         elif save_type == "config":
@@ -133,6 +376,11 @@ def save_configuration(
             # Clean up the .temp file since we've committed to main
             if os.path.exists(temp_path):
                 os.remove(temp_path)
+            _forget_baseline(temp_path)
+            _remember_baseline(config_path, target_data)
+            remember_metadata(config_path, target_data, text.encode())
+            if dirty is not None and feature == "all":
+                dirty.committed()
 
             print("Configuration committed successfully.")
 
@@ -140,6 +388,8 @@ def save_configuration(
 
     except Exception as e:
         print(f"Error during save: {e}")
+        if dirty_changes:
+            dirty.restore(dirty_changes)
         if "safe_tmp_path" in locals() and os.path.exists(safe_tmp_path):
             os.remove(safe_tmp_path)
         return False
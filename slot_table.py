@@ -0,0 +1,173 @@
+# Filename: slot_table.py
+# Description: Every concrete time slot of a time slot config, with overlap masks
+
+from scheduler.time_slot_generator import TimeSlotGenerator
+
+
+def meetings(slot) -> list[tuple[int, int, int]]:
+    """
+    Return the meetings of a time slot as (day, start, stop) timepoints.
+    """
+    return [
+        (
+            time.day.value,
+            time.start.timepoint,
+            time.start.timepoint + time.duration.duration,
+        )
+        for time in slot.times
+    ]
+
+
+def bits(mask: int) -> list[int]:
+    """
+    Return the positions of the set bits of a mask, lowest first.
+
+    Parameters:
+        mask (int): Bitmask
+
+    Returns:
+        list[int]: Bit positions
+    """
+    found = []
+    while mask:
+        low = mask & -mask
+        found.append(low.bit_length() - 1)
+        mask ^= low
+    return found
+
+
+def _gap(a: tuple[int, int, int], b: tuple[int, int, int]) -> int:
+    """
+    Minutes between two meetings, as TimeSlot._diff_between_slots measures it.
+    """
+    if a[0] == b[0]:
+        return min(abs(a[1] - b[2]), abs(b[1] - a[2]))
+    return min(abs(a[1] - b[1]), abs(a[2] - b[2]))
+
+
+class SlotTable:
+    """
+    The concrete time slots a TimeSlotConfig allows, numbered once.
+
+    Slots are generated per credit level exactly as the solver does
+    (TimeSlotGenerator, which applies min_time_overlap), and numbered in
+    credit order, so a set of slots is an int bitmask. For each slot the
+    table also holds the mask of slots it overlaps (TimeSlot.overlaps) and
+    of slots next to it within max_time_gap (TimeSlot.lecture_next_to).
+    Both are built from the few distinct meetings the slots share rather
+    than by comparing every pair of slots.
+
+    The table does not follow later edits of the config; ConfigModel keeps
+    one per version of the time slot config (see ConfigModel.time_slots()).
+
+    Attributes:
+        config (TimeSlotConfig): Config the table was built from
+        slots (list[TimeSlot]): Materialized slots, in bit order
+        credit_masks (dict[int, int]): Credits -> mask of that level's slots
+        all_slots (int): Mask of every slot
+        by_meeting (dict[tuple[int, int, int], int]): (day, start, stop) ->
+            mask of the slots that include that meeting
+        overlaps (list[int]): Slot -> mask of the slots it overlaps (itself
+            included)
+        next_to (list[int]): Slot -> mask of the slots within max_time_gap
+            of one of its meetings
+    """
+
+    def __init__(self, time_slot_config):
+        """
+        Parameters:
+            time_slot_config (TimeSlotConfig): Available times and class patterns
+        """
+        self.config = time_slot_config
+        generator = TimeSlotGenerator(time_slot_config)
+        self.slots: list = []
+        self.credit_masks: dict[int, int] = {}
+        for value in sorted(
+            {p.credits for p in time_slot_config.classes if not p.disabled}
+        ):
+            start = len(self.slots)
+            self.slots.extend(generator.time_slots(value))
+            self.credit_masks[value] = (1 << len(self.slots)) - (1 << start)
+        self.all_slots = (1 << len(self.slots)) - 1
+        self.by_meeting: dict[tuple[int, int, int], int] = {}
+        for bit, slot in enumerate(self.slots):
+            for meeting in meetings(slot):
+                self.by_meeting[meeting] = self.by_meeting.get(meeting, 0) | (1 << bit)
+
+        gap = time_slot_config.max_time_gap
+        overlap_by_meeting: dict[tuple[int, int, int], int] = {}
+        near_by_meeting: dict[tuple[int, int, int], int] = {}
+        for meeting in self.by_meeting:
+            overlap = near = 0
+            for other, mask in self.by_meeting.items():
+                day, start, stop = other
+                if day == meeting[0] and start < meeting[2] and meeting[1] < stop:
+                    overlap |= mask
+                if _gap(meeting, other) <= gap:
+                    near |= mask
+            overlap_by_meeting[meeting] = overlap
+            near_by_meeting[meeting] = near
+
+        self.overlaps: list[int] = []
+        self.next_to: list[int] = []
+        for slot in self.slots:
+            overlap = near = 0
+            for meeting in meetings(slot):
+                overlap |= overlap_by_meeting[meeting]
+                near |= near_by_meeting[meeting]
+            self.overlaps.append(overlap)
+            self.next_to.append(near)
+        self._pattern_counts: dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def count(self, credits: int | None = None) -> int:
+        """
+        Return the number of slots, or of the slots of one credit level.
+        """
+        if credits is None:
+            return len(self.slots)
+        return self.credit_masks.get(credits, 0).bit_count()
+
+    def slots_of(self, mask: int) -> list:
+        """
+        Return the slots of a mask, in slot order.
+
+        Parameters:
+            mask (int): Mask of slot numbers
+
+        Returns:
+            list[TimeSlot]: Slots
+        """
+        return [self.slots[bit] for bit in bits(mask)]
+
+    def disjoint(self, a: int, b: int) -> bool:
+        """
+        Return True if slots a and b can be used by conflicting sections.
+        """
+        return not self.overlaps[a] >> b & 1
+
+    def pattern_count(self, index: int) -> int:
+        """
+        Return the number of slots one class pattern generates on its own.
+
+        Patterns of the same credit level can produce the same slot, so the
+        counts of a level may add up to more than count(credits).
+
+        Parameters:
+            index (int): Position of the pattern in config.classes
+
+        Returns:
+            int: Candidate slots (0 for a disabled pattern)
+        """
+        if index not in self._pattern_counts:
+            pattern = self.config.classes[index]
+            if pattern.disabled:
+                self._pattern_counts[index] = 0
+            else:
+                alone = self.config.model_copy(update={"classes": [pattern]})
+                self._pattern_counts[index] = len(
+                    TimeSlotGenerator(alone).time_slots(pattern.credits)
+                )
+        return self._pattern_counts[index]
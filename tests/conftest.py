@@ -24,6 +24,20 @@ load_dotenv()
 # CONFIGURATION FIXTURES
 # ================================================================
 
+
+@pytest.fixture(autouse=True, scope="session")
+def snapshot_dir(tmp_path_factory):
+    """
+    Keep validated config snapshots out of the user's cache directory.
+    """
+    from config_snapshot import SNAPSHOT_DIR_ENV
+
+    mp = pytest.MonkeyPatch()
+    mp.setenv(SNAPSHOT_DIR_ENV, str(tmp_path_factory.mktemp("snapshots")))
+    yield
+    mp.undo()
+
+
 # Test configuration files
 TESTING_CONFIG = "example.json"
 TEST_COPY_CONFIG = "test_copy.json"
@@ -0,0 +1,59 @@
+import shutil
+
+import pytest
+from scheduler.scheduler import get_faculty_availability
+
+from availability_index import AvailabilityIndex
+from models.config_model import ConfigModel
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+@pytest.fixture
+def index(config_model):
+    return AvailabilityIndex(config_model.time_slots(), config_model.get_all_faculty())
+
+
+def test_masks_match_solver_fit(config_model, index):
+    slots = index.table.slots
+    for member in config_model.config.config.faculty:
+        times = get_faculty_availability(member)
+        expected = [s.in_time_ranges(times) for s in slots]
+        assert [index.can_teach(member.name, i) for i in range(len(slots))] == (
+            expected
+        )
+
+
+def test_free_at_and_slots_for(config_model, index):
+    faculty = config_model.config.config.faculty
+    for slot in range(0, len(index.table), 7):
+        assert index.free_at(slot) == [
+            f.name for f in faculty if index.can_teach(f.name, slot)
+        ]
+
+    name = faculty[0].name
+    four = index.slots_for(name, credits=4)
+    assert four == [
+        s
+        for i, s in enumerate(index.table.slots)
+        if index.can_teach(name, i) and index.table.credit_masks[4] >> i & 1
+    ]
+    fit, total = index.fit_counts(name)[4]
+    assert fit == len(four) and total == index.table.count(4)
+    assert index.available("Nobody") == 0 and index.slots_for("Nobody") == []
+
+
+def test_update_and_remove(config_model, index):
+    member = config_model.config.config.faculty[0]
+    member.times = {day: [] for day in member.times}
+
+    index.update(member)
+    assert index.available(member.name) == 0
+
+    index.remove(member.name)
+    assert member.name not in index.free_at(0)
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+from scheduler import CombinedConfig
+
+from config_diff import changed_keys, diff_configs, summarize_diff
+
+
+@pytest.fixture
+def raw():
+    with open("example.json") as f:
+        return json.load(f)
+
+
+def _config(data):
+    return CombinedConfig(**data)
+
+
+def test_identical_configs_have_no_diff(raw):
+    assert diff_configs(_config(raw), _config(raw)) == {}
+
+
+def test_rooms_and_labs(raw):
+    old = _config(raw)
+    raw["config"]["rooms"].append("Annex 1")
+    raw["config"]["labs"].reverse()
+    diff = diff_configs(old, _config(raw))
+
+    assert diff["rooms"] == {"added": ["Annex 1"]}
+    assert diff["labs"] == {"reordered": True}
+
+
+def test_course_fields_and_sections(raw):
+    old = _config(raw)
+    courses = raw["config"]["courses"]
+    single = next(
+        c["course_id"]
+        for c in courses
+        if sum(x["course_id"] == c["course_id"] for x in courses) == 1
+    )
+    multi = next(
+        c["course_id"]
+        for c in courses
+        if sum(x["course_id"] == c["course_id"] for x in courses) > 1
+    )
+    course = next(c for c in courses if c["course_id"] == single)
+    credits = course["credits"]
+    course["credits"] = credits + 1
+    courses.remove(next(c for c in courses if c["course_id"] == multi))
+    diff = diff_configs(old, _config(raw))
+
+    assert diff["courses"]["modified"][single] == {"credits": (credits, credits + 1)}
+    assert "sections" in diff["courses"]["modified"][multi]
+    assert changed_keys(diff) == {"courses": {single, multi}}
+
+
+def test_faculty_added_and_removed(raw):
+    old = _config(raw)
+    faculty = raw["config"]["faculty"]
+    removed = faculty.pop()["name"]
+    for course in raw["config"]["courses"]:
+        if removed in course["faculty"]:
+            course["faculty"].remove(removed)
+    added = dict(faculty[0], name="New Person")
+    faculty.append(added)
+    diff = diff_configs(old, _config(raw))
+
+    assert diff["faculty"]["added"] == ["New Person"]
+    assert diff["faculty"]["removed"] == [removed]
+    assert "Added faculty New Person" in summarize_diff(diff)
+
+
+def test_time_blocks_and_limit(raw):
+    old = _config(raw)
+    raw["time_slot_config"]["times"]["MON"].append(
+        {"start": "19:00", "spacing": 60, "end": "21:00"}
+    )
+    raw["limit"] = 5
+    diff = diff_configs(old, _config(raw))
+
+    assert diff["time_slot_config"]["times"]["MON"]["added"][0]["start"] == "19:00"
+    assert diff["limit"] == (old.limit, 5)
+    assert "Changed time blocks on MON" in summarize_diff(diff)
@@ -0,0 +1,133 @@
+import shutil
+
+import pytest
+
+from config_history import ConfigHistory
+from models.config_model import ConfigModel
+from models.course_model import CourseModel
+from models.room_model import RoomModel
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+def _dump(config_model):
+    # Compare models rather than JSON dumps: set fields dump in hash order
+    return config_model.config.model_copy(deep=True)
+
+
+def _edit_course(config_model, credits):
+    course = config_model.config.config.courses[0]
+    CourseModel(config_model).modify_course(course.course_id, credits=credits)
+    config_model.save_feature("temp", "courses")
+
+
+def test_undo_and_redo_single_edit(config_model):
+    before = _dump(config_model)
+    courses = config_model.config.config.courses
+    untouched = courses[-1]
+    _edit_course(config_model, 1)
+    after = _dump(config_model)
+
+    assert config_model.undo()
+    assert _dump(config_model) == before
+    assert courses[-1] is untouched
+    assert config_model.redo()
+    assert _dump(config_model) == after
+    assert not config_model.redo()
+
+
+def test_cascading_edit_is_one_step(config_model):
+    before = _dump(config_model)
+    room = config_model.config.config.rooms[0]
+    RoomModel(config_model).modify_room(room, "Renamed Room")
+    config_model.save_feature("temp", "all")
+
+    assert config_model.undo()
+    assert _dump(config_model) == before
+    assert not config_model.undo()
+
+
+def test_jump_back_many_steps(config_model):
+    states = [_dump(config_model)]
+    for credits in range(1, 30):
+        _edit_course(config_model, credits % 5 + 1)
+        states.append(_dump(config_model))
+
+    assert config_model.undo(25)
+    assert _dump(config_model) == states[-26]
+    assert config_model.redo(10)
+    assert _dump(config_model) == states[-16]
+
+
+def test_unsaved_edit_can_be_undone_and_redone(config_model):
+    before = _dump(config_model)
+    config_model.config.config.rooms.append("Annex 1")
+    config_model.mark_dirty("rooms")
+
+    assert config_model.undo()
+    assert _dump(config_model) == before
+    assert config_model.redo()
+    assert "Annex 1" in config_model.config.config.rooms
+
+
+def test_new_edit_discards_redo(config_model):
+    _edit_course(config_model, 1)
+    config_model.undo()
+    _edit_course(config_model, 2)
+
+    assert not config_model.redo()
+    assert config_model.history.redo_steps() == 0
+
+
+def test_unchanged_entities_are_shared(config_model):
+    history = config_model.history
+    baseline = history.memory_usage()
+    _edit_course(config_model, 1)
+
+    assert 0 < history.memory_usage() - baseline < baseline / 4
+
+
+def test_oldest_eviction_keeps_history_in_budget(config_model):
+    config_model.history = ConfigHistory(budget=0, eviction="oldest")
+    config_model.history.reset(config_model.config)
+    for credits in range(1, 6):
+        _edit_course(config_model, credits)
+
+    assert config_model.history.undo_steps() == 0
+    assert not config_model.undo()
+
+
+def test_thin_eviction_keeps_old_states_reachable(config_model):
+    history = ConfigHistory(eviction="thin")
+    config_model.history = history
+    history.reset(config_model.config)
+    first = _dump(config_model)
+    for credits in range(1, 11):
+        _edit_course(config_model, credits % 5 + 1)
+    history.budget = history.memory_usage() - 1
+    history._evict()
+
+    assert 0 < history.undo_steps() < 10
+    assert config_model.undo(history.undo_steps())
+    assert _dump(config_model) == first
+
+
+def test_undo_is_temp_saved(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path))
+    before = _dump(config_model)
+    _edit_course(config_model, 1)
+    config_model.undo()
+
+    assert _dump(ConfigModel(str(path))) == before
+
+
+def test_unknown_eviction_policy():
+    with pytest.raises(ValueError):
+        ConfigHistory(eviction="newest")
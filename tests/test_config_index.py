@@ -0,0 +1,323 @@
+import shutil
+
+import pytest
+
+from config_index import ConfigIndex
+from models.config_model import ConfigModel
+from models.course_model import CourseModel
+from models.faculty_model import FacultyModel
+from models.lab_model import LabModel
+from models.room_model import RoomModel
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+@pytest.fixture
+def builds(config_model, monkeypatch):
+    """Count how often each section is (re)indexed from scratch."""
+    counts = {}
+    original = ConfigIndex._build
+
+    def counting_build(self, section, values):
+        counts[section] = counts.get(section, 0) + 1
+        original(self, section, values)
+
+    monkeypatch.setattr(ConfigIndex, "_build", counting_build)
+    return counts
+
+
+def test_lookups_match_config(config_model):
+    config = config_model.config.config
+    index = config_model.index
+
+    assert all(index.has_room(room) for room in config.rooms)
+    assert all(index.has_lab(lab) for lab in config.labs)
+    assert not index.has_room("Nowhere 1")
+    for position, course in enumerate(config.courses):
+        assert position in index.course_positions(course.course_id)
+    for faculty in config.faculty:
+        assert index.faculty_by_name(faculty.name.upper()) is faculty
+    assert index.course_positions("NOPE 100") == []
+    assert index.faculty_by_name("Nobody") is None
+
+
+def test_model_mutations_update_index_in_place(config_model, builds):
+    rooms = RoomModel(config_model)
+    labs = LabModel(config_model)
+    faculty = FacultyModel(config_model)
+    courses = CourseModel(config_model)
+    old_room = config_model.config.config.rooms[0]
+    old_lab = config_model.config.config.labs[0]
+    member = config_model.config.config.faculty[0]
+    for section in ("rooms", "labs", "faculty", "courses"):
+        config_model.index.invalidate(section)
+    rooms.room_exists(old_room)
+    labs.lab_exists(old_lab)
+    faculty.faculty_exists(member.name)
+    courses.course_exists("CMSC 140")
+    built = dict(builds)
+
+    assert rooms.add_room("Annex 1") and rooms.room_exists("Annex 1")
+    assert rooms.modify_room(old_room, "Annex 2")
+    assert not rooms.room_exists(old_room) and rooms.room_exists("Annex 2")
+    assert rooms.delete_room("Annex 1") and not rooms.room_exists("Annex 1")
+    assert labs.add_lab("Quantum") and labs.lab_exists("Quantum")
+    assert labs.modify_lab(old_lab, "Optics")
+    assert labs.lab_exists("Optics") and not labs.lab_exists(old_lab)
+    old_name = member.name
+    assert faculty.modify_faculty(old_name, "name", "Renamed")
+    assert faculty.get_faculty_by_name("renamed") is member
+    assert not faculty.faculty_exists(old_name)
+    new_course = courses.build_course_config(
+        {
+            "course_id": "CMSC 999",
+            "credits": 3,
+            "room": [],
+            "lab": [],
+            "faculty": [],
+            "conflicts": [],
+        }
+    )
+    assert courses.add_course(new_course)
+    assert courses.get_course_by_id("CMSC 999") is new_course
+
+    assert builds == built
+
+
+def test_delete_faculty_updates_index(config_model, builds):
+    faculty = FacultyModel(config_model)
+    name = config_model.config.config.faculty[-1].name
+    assert faculty.faculty_exists(name)
+    built = builds.get("faculty", 0)
+
+    assert faculty.delete_faculty(name.lower())
+
+    assert not faculty.faculty_exists(name)
+    assert all(f.name != name for f in config_model.config.config.faculty)
+    assert builds.get("faculty", 0) == built
+
+
+def test_delete_course_reindexes_positions(config_model):
+    courses = CourseModel(config_model)
+    first = config_model.config.config.courses[0].course_id
+    last = config_model.config.config.courses[-1]
+
+    assert courses.delete_course(first)
+
+    positions = config_model.index.course_positions(last.course_id)
+    assert config_model.config.config.courses[positions[-1]] is last
+    assert not courses.course_exists(first)
+
+
+def test_unreported_changes_are_detected(config_model):
+    index = config_model.index
+    assert not index.has_room("Direct 1")
+
+    config_model.config.config.rooms.append("Direct 1")
+    course = config_model.config.config.courses[0]
+    config_model.config.config.courses.append(course.model_copy(deep=True))
+    # Renamed behind the index's back: the stale hit is rejected
+    member = config_model.config.config.faculty[0]
+    old_name = member.name
+    index.faculty_by_name(old_name)
+    member.name = "Someone Else"
+
+    assert index.has_room("Direct 1")
+    assert len(index.course_positions(course.course_id)) == len(
+        [
+            c
+            for c in config_model.config.config.courses
+            if c.course_id == course.course_id
+        ]
+    )
+    assert index.faculty_by_name(old_name) is None
+    assert index.faculty_by_name("someone else") is member
+
+
+def test_undo_invalidates_index(config_model):
+    rooms = RoomModel(config_model)
+    old_room = config_model.config.config.rooms[0]
+    assert rooms.modify_room(old_room, "Annex 9")
+    config_model.save_feature("temp", "rooms")
+
+    assert config_model.undo()
+
+    assert rooms.room_exists(old_room)
+    assert not rooms.room_exists("Annex 9")
+
+
+# ================================================================
+# Stable section ids
+# ================================================================
+
+
+def test_section_ids_survive_deletes(config_model, builds):
+    index = config_model.index
+    courses = config_model.config.config.courses
+    ids = index.section_ids()
+    last = courses[-1]
+
+    assert len(set(ids)) == len(ids)
+    assert [index.section_position(s) for s in ids] == list(range(len(ids)))
+
+    CourseModel(config_model).delete_course(courses[0].course_id)
+    removed = len(ids) - len(courses)
+
+    assert index.section_position(ids[-1]) == len(courses) - 1
+    assert courses[index.section_position(ids[-1])] is last
+    assert index.section_position(ids[0]) is None
+    assert index.section_ids() == ids[removed:]
+
+
+def test_added_section_gets_new_id_without_rebuild(config_model, builds):
+    index = config_model.index
+    ids = index.section_ids()
+    before = builds.get("courses", 0)
+    course = config_model.config.config.courses[0].model_copy()
+    CourseModel(config_model).add_course(course)
+
+    new_id = index.section_id(len(ids))
+
+    assert new_id not in ids
+    assert index.section_position(new_id) == len(ids)
+    assert builds.get("courses", 0) == before
+
+
+def test_replaced_section_gets_new_id(config_model):
+    index = config_model.index
+    courses = config_model.config.config.courses
+    old_id = index.section_id(0)
+
+    courses[0] = courses[0].model_copy()
+
+    assert index.section_position(old_id) is None
+    assert index.section_id(0) != old_id
+
+
+# ================================================================
+# Reverse references
+# ================================================================
+
+
+def _scan(config_model, kind, name):
+    fields = {"room": ("room", "room_preferences"), "lab": ("lab", "lab_preferences")}
+    fields["course"] = ("conflicts", "course_preferences")
+    fields["faculty"] = ("faculty", None)
+    course_field, faculty_field = fields[kind]
+    config = config_model.config.config
+    courses = [c for c in config.courses if name in getattr(c, course_field)]
+    faculty = (
+        [f for f in config.faculty if name in getattr(f, faculty_field)]
+        if faculty_field
+        else []
+    )
+    return courses, faculty
+
+
+def _referencing(config_model, kind, name):
+    index = config_model.index
+    courses = index.courses_referencing(kind, name)
+    faculty = index.faculty_referencing(kind, name) if kind != "faculty" else []
+    return courses, faculty
+
+
+def _same(found, expected):
+    return sorted(map(id, found[0])) == sorted(map(id, expected[0])) and sorted(
+        map(id, found[1])
+    ) == sorted(map(id, expected[1]))
+
+
+def _all_names(config_model):
+    config = config_model.config.config
+    names = [("room", r) for r in config.rooms] + [("lab", lab) for lab in config.labs]
+    names += [("course", c.course_id) for c in config.courses]
+    names += [("faculty", f.name) for f in config.faculty]
+    return names
+
+
+@pytest.fixture
+def reverse_builds(monkeypatch):
+    """Count full rebuilds of the reverse references."""
+    from config_index import _ReverseIndex
+
+    counts = {"builds": 0}
+    original = _ReverseIndex.build
+
+    def counting_build(self, entities):
+        counts["builds"] += 1
+        original(self, entities)
+
+    monkeypatch.setattr(_ReverseIndex, "build", counting_build)
+    return counts
+
+
+def test_references_match_scan(config_model):
+    for kind, name in _all_names(config_model):
+        assert _same(
+            _referencing(config_model, kind, name), _scan(config_model, kind, name)
+        )
+
+
+def test_references_follow_mutations_without_rebuild(config_model, reverse_builds):
+    from models.conflict_model import ConflictModel
+
+    config = config_model.config.config
+    room = config.rooms[0]
+    lab = config.labs[0]
+    member = config.faculty[0]
+    course = config.courses[0]
+    # Build both reverse indexes
+    _referencing(config_model, "room", room)
+    built = reverse_builds["builds"]
+
+    CourseModel(config_model).modify_course(course.course_id, room=[room], lab=[lab])
+    FacultyModel(config_model).modify_faculty(
+        member.name, "room_preferences", {room: 3}
+    )
+    assert ConflictModel(config_model).add_conflict(course.course_id, "CMSC 453")
+    RoomModel(config_model).modify_room(room, "Annex 5")
+    LabModel(config_model).delete_lab(lab)
+    FacultyModel(config_model).delete_faculty(config.faculty[-1].name)
+
+    assert reverse_builds["builds"] == built
+    for kind, name in _all_names(config_model) + [("room", room), ("lab", lab)]:
+        assert _same(
+            _referencing(config_model, kind, name), _scan(config_model, kind, name)
+        )
+    assert course in config_model.index.courses_referencing("room", "Annex 5")
+    assert member in config_model.index.faculty_referencing("room", "Annex 5")
+
+
+def test_delete_course_cascades_through_references(config_model):
+    courses = CourseModel(config_model)
+    target = "CMSC 161"
+    referencing = config_model.index.courses_referencing("course", target)
+    assert referencing
+
+    assert courses.delete_course(target)
+
+    assert config_model.index.courses_referencing("course", target) == []
+    assert config_model.index.faculty_referencing("course", target) == []
+    assert all(target not in c.conflicts for c in config_model.config.config.courses)
+    assert all(
+        target not in f.course_preferences for f in config_model.config.config.faculty
+    )
+
+
+def test_undo_rebuilds_references(config_model):
+    rooms = RoomModel(config_model)
+    room = config_model.config.config.rooms[0]
+    before = _scan(config_model, "room", room)
+    assert rooms.delete_room(room)
+    config_model.save_feature("temp", "all")
+
+    assert config_model.undo()
+
+    found = _referencing(config_model, "room", room)
+    assert _same(found, _scan(config_model, "room", room))
+    assert len(found[0]) == len(before[0])
@@ -0,0 +1,161 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from config_journal import SEQ_KEY
+from models import config_model as config_model_module
+from models.config_model import ConfigModel
+from models.course_model import CourseModel
+from models.faculty_model import FacultyModel
+from models.lab_model import LabModel
+from models.room_model import RoomModel
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return str(path)
+
+
+def _edit(config_model):
+    RoomModel(config_model).modify_room("Roddy 136", "Roddy 999")
+    config_model.save_feature("temp", "all")
+    LabModel(config_model).add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    CourseModel(config_model).delete_course("CMSC 362")
+    config_model.save_feature("temp", "all")
+    FacultyModel(config_model).modify_faculty("Zoppetti", "maximum_credits", 14)
+    config_model.save_feature("temp", "faculty")
+
+
+def _dump(config_model):
+    # Compare models rather than JSON dumps: set fields dump in hash order
+    return config_model.config.model_copy(deep=True)
+
+
+def test_temp_saves_append_to_journal(config_path):
+    config_model = ConfigModel(config_path)
+    _edit(config_model)
+
+    assert not os.path.exists(config_path + ".temp")
+    with open(config_path + ".journal") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["seq"] for r in records] == [1, 2, 3, 4]
+    assert records[1]["changes"] == [
+        {"op": "set", "section": "labs", "value": config_model.get_all_labs()}
+    ]
+
+
+def test_journal_is_replayed_on_load(config_path):
+    config_model = ConfigModel(config_path)
+    _edit(config_model)
+
+    restored = ConfigModel(config_path)
+    assert _dump(restored) == _dump(config_model)
+    assert "Roddy 999" in restored.get_all_rooms()
+
+
+def test_torn_last_record_is_ignored(config_path):
+    config_model = ConfigModel(config_path)
+    LabModel(config_model).add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    expected = _dump(config_model)
+    with open(config_path + ".journal", "a") as f:
+        f.write('{"seq": 2, "chan')
+
+    assert _dump(ConfigModel(config_path)) == expected
+
+
+def test_journal_that_fails_validation_is_moved_aside(config_path, capsys):
+    config_model = ConfigModel(config_path)
+    LabModel(config_model).add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    with open(config_path + ".journal", "a") as f:
+        record = {"seq": 2, "changes": [{"op": "set", "section": "rooms", "value": 7}]}
+        f.write(json.dumps(record) + "\n")
+    with open(config_path + ".journal") as f:
+        journal = f.read()
+
+    restored = ConfigModel(config_path)
+
+    assert "Windows" not in restored.get_all_labs()
+    assert restored.get_all_rooms() == ConfigModel(config_path).get_all_rooms()
+    assert "could not be replayed" in capsys.readouterr().out
+    with open(config_path + ".journal.failed") as f:
+        assert f.read() == journal
+    # The fresh journal keeps recording edits
+    LabModel(restored).add_lab("Linux")
+    restored.save_feature("temp", "labs")
+    assert "Linux" in ConfigModel(config_path).get_all_labs()
+
+
+def test_failed_append_keeps_changes_unsaved(config_path, caplog):
+    config_model = ConfigModel(config_path)
+    os.mkdir(config_path + ".journal")
+    LabModel(config_model).add_lab("Windows")
+
+    assert not config_model.save_feature("temp", "labs")
+    assert "Journal append" in caplog.text
+    assert "labs" in config_model.dirty.take(["labs"])
+
+
+def test_compaction_folds_journal_into_temp(config_path):
+    config_model = ConfigModel(config_path)
+    _edit(config_model)
+    config_model.journal.compact()
+
+    assert os.path.getsize(config_path + ".journal") == 0
+    with open(config_path + ".temp") as f:
+        assert json.load(f)[SEQ_KEY] == 4
+
+    LabModel(config_model).add_lab("Linux 2")
+    config_model.save_feature("temp", "labs")
+    assert _dump(ConfigModel(config_path)) == _dump(config_model)
+
+
+def test_background_compaction_after_threshold(config_path):
+    config_model = ConfigModel(config_path)
+    config_model.journal.compact_threshold = 3
+    lab_model = LabModel(config_model)
+    for i in range(5):
+        lab_model.add_lab(f"Lab {i}")
+        config_model.save_feature("temp", "labs")
+    config_model.journal.wait()
+
+    assert os.path.exists(config_path + ".temp")
+    assert _dump(ConfigModel(config_path)) == _dump(config_model)
+
+
+def test_commit_removes_journal(config_path):
+    config_model = ConfigModel(config_path)
+    _edit(config_model)
+    assert config_model.save_feature("config", "all")
+
+    assert not os.path.exists(config_path + ".journal")
+    assert not os.path.exists(config_path + ".temp")
+    with open(config_path) as f:
+        assert "Windows" in json.load(f)["config"]["labs"]
+
+
+def test_failed_commit_keeps_journal(config_path, monkeypatch):
+    config_model = ConfigModel(config_path)
+    _edit(config_model)
+    monkeypatch.setattr(config_model_module, "safe_save", lambda config, path: False)
+
+    assert not config_model.safe_save()
+    assert os.path.exists(config_path + ".journal")
+    assert "Windows" in ConfigModel(config_path).get_all_labs()
+
+
+def test_journal_older_than_config_is_discarded(config_path):
+    config_model = ConfigModel(config_path)
+    LabModel(config_model).add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    journal_time = os.path.getmtime(config_path + ".journal")
+    os.utime(config_path, (journal_time + 10, journal_time + 10))
+
+    assert "Windows" not in ConfigModel(config_path).get_all_labs()
+    assert not os.path.exists(config_path + ".journal")
@@ -0,0 +1,82 @@
+import json
+import shutil
+
+import pytest
+
+import config_metadata
+from config_metadata import forget_metadata, get_metadata
+from models.config_model import ConfigModel
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    forget_metadata()
+    return str(path)
+
+
+@pytest.fixture
+def count_reads(monkeypatch):
+    reads = []
+
+    def counting_open(path, *args, **kwargs):
+        reads.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(config_metadata, "open", counting_open, raising=False)
+    return reads
+
+
+def _rewrite(path, **changes):
+    with open(path) as f:
+        data = json.load(f)
+    data.update(changes)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def test_metadata_matches_file(config_path):
+    with open(config_path) as f:
+        data = json.load(f)
+    metadata = get_metadata(config_path)
+
+    assert metadata["limit"] == data["limit"]
+    assert metadata["optimizer_flags"] == data["optimizer_flags"]
+    assert metadata["counts"]["courses"] == len(data["config"]["courses"])
+    assert metadata["counts"]["rooms"] == len(data["config"]["rooms"])
+    assert len(metadata["hash"]) == 32
+
+
+def test_unchanged_file_is_parsed_once(config_path, count_reads, monkeypatch):
+    monkeypatch.setattr(config_metadata, "STAT_INTERVAL", 0)
+    first = get_metadata(config_path)
+    for _ in range(5):
+        assert get_metadata(config_path) is first
+    assert len(count_reads) == 1
+
+
+def test_external_change_is_detected(config_path, monkeypatch):
+    monkeypatch.setattr(config_metadata, "STAT_INTERVAL", 0)
+    before = get_metadata(config_path)
+    _rewrite(config_path, limit=7, optimizer_flags=[])
+
+    after = get_metadata(config_path)
+    assert after["limit"] == 7
+    assert after["optimizer_flags"] == []
+    assert after["hash"] != before["hash"]
+
+
+def test_app_save_updates_cache_without_reading(config_path, count_reads):
+    config_model = ConfigModel(config_path)
+    get_metadata(config_path)
+    config_model.config.config.rooms.append("New Room")
+    config_model.mark_dirty("rooms")
+    assert config_model.save_feature("config", "all")
+
+    metadata = config_model.get_metadata()
+    assert len(count_reads) == 1
+    assert metadata["counts"]["rooms"] == len(config_model.config.config.rooms)
+    with open(config_path, "rb") as f:
+        raw = f.read()
+    assert metadata == config_metadata.summarize(json.loads(raw), raw)
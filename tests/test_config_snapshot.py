@@ -0,0 +1,177 @@
+import json
+import os
+import pickle
+import shutil
+
+import pytest
+from scheduler import CombinedConfig, load_config_from_file
+
+import config_snapshot
+from config_snapshot import clear_memory_snapshots, load_config, snapshot_key
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_cache():
+    clear_memory_snapshots()
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return str(path)
+
+
+def _no_validation(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("config should come from a snapshot")
+
+    monkeypatch.setattr(config_snapshot, "CombinedConfig", fail)
+
+
+def test_matches_validated_load(config_path, tmp_path):
+    config = load_config(config_path, str(tmp_path / "snapshots"))
+    expected = load_config_from_file(CombinedConfig, config_path)
+    assert config.model_dump() == expected.model_dump()
+
+
+def test_second_load_skips_validation(config_path, tmp_path, monkeypatch):
+    snapshots = str(tmp_path / "snapshots")
+    first = load_config(config_path, snapshots)
+    _no_validation(monkeypatch)
+
+    second = load_config(config_path, snapshots)
+    assert second is not first
+    assert second.model_dump() == first.model_dump()
+    second.config.rooms.append("New Room")
+    assert "New Room" not in first.config.rooms
+
+
+def test_disk_snapshot_survives_memory_clear(config_path, tmp_path, monkeypatch):
+    snapshots = tmp_path / "snapshots"
+    load_config(config_path, str(snapshots))
+    with open(config_path, "rb") as f:
+        assert (snapshots / (snapshot_key(f.read()) + ".pickle")).exists()
+
+    clear_memory_snapshots()
+    _no_validation(monkeypatch)
+    assert load_config(config_path, str(snapshots)).config.rooms
+
+
+def test_changed_file_is_validated_again(config_path, tmp_path):
+    snapshots = str(tmp_path / "snapshots")
+    load_config(config_path, snapshots)
+    with open(config_path) as f:
+        data = json.load(f)
+    data["config"]["rooms"].append("Added Room")
+    with open(config_path, "w") as f:
+        json.dump(data, f)
+
+    assert "Added Room" in load_config(config_path, snapshots).config.rooms
+
+
+def test_corrupt_snapshot_falls_back_to_validation(config_path, tmp_path):
+    snapshots = tmp_path / "snapshots"
+    load_config(config_path, str(snapshots))
+    for name in os.listdir(snapshots):
+        (snapshots / name).write_bytes(b"not a pickle")
+    clear_memory_snapshots()
+
+    assert load_config(config_path, str(snapshots)).config.rooms
+
+
+def test_invalid_config_raises(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('{"config": {"rooms": "oops"}}')
+    with pytest.raises(ValueError):
+        load_config(str(path), str(tmp_path / "snapshots"))
+
+
+class _Planted:
+    ran = False
+
+    def __reduce__(self):
+        return (_mark_planted_ran, ())
+
+
+def _mark_planted_ran():
+    _Planted.ran = True
+    return "planted"
+
+
+def test_unsigned_snapshot_is_never_unpickled(config_path, tmp_path):
+    snapshots = tmp_path / "snapshots"
+    load_config(config_path, str(snapshots))
+    with open(config_path, "rb") as f:
+        planted = snapshots / (snapshot_key(f.read()) + ".pickle")
+    planted.write_bytes(bytes(32) + pickle.dumps(_Planted()))
+    clear_memory_snapshots()
+
+    assert load_config(config_path, str(snapshots)).config.rooms
+    assert not _Planted.ran
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs POSIX permissions")
+def test_shared_directory_is_not_used(config_path, tmp_path, capsys):
+    snapshots = tmp_path / "snapshots"
+    snapshots.mkdir(mode=0o777)
+    snapshots.chmod(0o777)
+
+    load_config(config_path, str(snapshots))
+    assert os.listdir(snapshots) == []
+    assert "WARNING: not caching config snapshots" in capsys.readouterr().out
+
+    snapshots.chmod(0o700)
+    clear_memory_snapshots()
+    load_config(config_path, str(snapshots))
+    assert config_snapshot.SECRET_FILE in os.listdir(snapshots)
+    assert len(os.listdir(snapshots)) == 2
+
+
+@pytest.mark.slow
+def test_benchmark_startup_with_1000_courses(tmp_path, monkeypatch):
+    """
+    Benchmark opening a configuration with 1,000 courses: validating the
+    JSON, loading the signed disk snapshot, and the in-memory snapshot.
+    """
+    import time
+
+    from models.config_model import ConfigModel
+
+    with open("example.json") as f:
+        data = json.load(f)
+    data["config"]["courses"] = [
+        {
+            "course_id": f"BENCH {n:04d}",
+            "credits": 3 + n % 2,
+            "room": data["config"]["rooms"][:2],
+            "lab": [],
+            "faculty": [],
+            "conflicts": [f"BENCH {(n + 1) % 1000:04d}"],
+        }
+        for n in range(1000)
+    ]
+    for faculty in data["config"]["faculty"]:
+        faculty["course_preferences"] = {}
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(data))
+    monkeypatch.setenv(config_snapshot.SNAPSHOT_DIR_ENV, str(tmp_path / "snapshots"))
+
+    def startup() -> tuple[float, ConfigModel]:
+        start = time.perf_counter()
+        model = ConfigModel(str(path), use_journal=False)
+        return time.perf_counter() - start, model
+
+    cold, first = startup()
+    clear_memory_snapshots()
+    disk, second = startup()
+    memory, third = startup()
+
+    print(
+        f"\n1000 courses: startup with validation {cold * 1000:.1f} ms, "
+        f"from disk snapshot {disk * 1000:.1f} ms, "
+        f"from memory snapshot {memory * 1000:.1f} ms"
+    )
+    assert len(first.get_all_courses()) == 1000
+    assert second.config.model_dump() == first.config.model_dump()
+    assert third.config.model_dump() == first.config.model_dump()
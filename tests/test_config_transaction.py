@@ -0,0 +1,163 @@
+import os
+import shutil
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from controllers.conflict_controller import ConflictController
+from controllers.course_controller import CourseController
+from models.config_model import ConfigModel
+from models.conflict_model import ConflictModel
+from models.course_model import CourseModel
+from models.room_model import RoomModel
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+def _dump(config_model):
+    return config_model.config.model_copy(deep=True)
+
+
+def _multi_step_edit(config_model):
+    """Add a course, give it a faculty member and conflicts, saving each step."""
+    courses = CourseController(CourseModel(config_model), config_model)
+    conflicts = ConflictController(ConflictModel(config_model), None)
+    assert courses.add_course(
+        {
+            "course_id": "CMSC 499",
+            "credits": 3,
+            "room": ["Roddy 136"],
+            "lab": [],
+            "conflicts": [],
+            "faculty": ["Hardy"],
+        }
+    )[0]
+    assert conflicts.add_conflict("CMSC 499", "CMSC 140")[0]
+    assert conflicts.add_conflict("CMSC 499", "CMSC 161")[0]
+
+
+def test_saves_are_deferred_to_commit(config_model):
+    temp_path = config_model.config_path + ".temp"
+    with (
+        patch.object(
+            config_model, "_write_temp", wraps=config_model._write_temp
+        ) as write,
+        config_model.transaction() as transaction,
+    ):
+        _multi_step_edit(config_model)
+        assert not os.path.exists(temp_path)
+        assert write.call_count == 0
+
+    assert write.call_count == 1
+    assert transaction.saved
+    assert os.path.exists(temp_path)
+    assert CourseModel(config_model).course_exists("CMSC 499")
+
+
+def test_exception_rolls_back_every_edit(config_model):
+    before = _dump(config_model)
+    courses = config_model.config.config.courses
+    untouched = courses[-1]
+
+    with pytest.raises(RuntimeError), config_model.transaction():
+        _multi_step_edit(config_model)
+        RoomModel(config_model).modify_room("Roddy 140", "Roddy 240")
+        CourseModel(config_model).delete_course("CMSC 362")
+        raise RuntimeError("step failed")
+
+    assert _dump(config_model) == before
+    assert courses[-1] is untouched
+    assert not os.path.exists(config_model.config_path + ".temp")
+    # The index follows the restored config
+    assert not CourseModel(config_model).course_exists("CMSC 499")
+    assert CourseModel(config_model).course_exists("CMSC 362")
+    assert RoomModel(config_model).room_exists("Roddy 140")
+
+
+def test_invalid_references_fail_validation_at_commit(config_model):
+    before = _dump(config_model)
+
+    with (
+        pytest.raises(ValueError, match="invalid rooms"),
+        config_model.transaction(),
+    ):
+        course = config_model.config.config.courses[0]
+        # List mutation bypasses assignment validation
+        course.room.append("Nowhere 1")
+        config_model.mark_dirty("courses", course.course_id)
+        config_model.save_feature("temp", "courses")
+
+    assert _dump(config_model) == before
+
+
+def test_transaction_is_one_undo_step(config_model):
+    before = _dump(config_model)
+    with config_model.transaction():
+        _multi_step_edit(config_model)
+
+    assert config_model.undo()
+    assert _dump(config_model) == before
+    assert not config_model.undo()
+
+
+def test_rolled_back_edits_cannot_be_redone(config_model):
+    with pytest.raises(RuntimeError), config_model.transaction():
+        _multi_step_edit(config_model)
+        raise RuntimeError
+
+    assert not config_model.redo()
+
+
+def test_nested_transactions_join_the_outer_one(config_model):
+    before = _dump(config_model)
+
+    with pytest.raises(RuntimeError), config_model.transaction():
+        with config_model.transaction():
+            _multi_step_edit(config_model)
+        assert config_model.active_transaction.active
+        raise RuntimeError
+
+    assert _dump(config_model) == before
+    assert not config_model.active_transaction.active
+
+
+def test_other_threads_wait_instead_of_joining(config_model):
+    temp_path = config_model.config_path + ".temp"
+    opened = threading.Event()
+    finish = threading.Event()
+
+    def failing_edit():
+        with pytest.raises(RuntimeError), config_model.transaction():
+            RoomModel(config_model).add_room("Tool Room")
+            opened.set()
+            finish.wait(5)
+            raise RuntimeError
+
+    worker = threading.Thread(target=failing_edit)
+    worker.start()
+    assert opened.wait(5)
+    assert not config_model.active_transaction.active
+
+    gui = threading.Thread(
+        target=lambda: (
+            RoomModel(config_model).add_room("GUI Room"),
+            config_model.save_feature("temp", "rooms"),
+        )
+    )
+    gui.start()
+    gui.join(0.2)
+    assert gui.is_alive()  # Waits for the transaction instead of joining it
+    finish.set()
+    worker.join()
+    gui.join()
+
+    rooms = config_model.get_all_rooms()
+    assert "GUI Room" in rooms and "Tool Room" not in rooms
+    with open(temp_path) as f:
+        assert "GUI Room" in f.read()
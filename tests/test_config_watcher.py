@@ -0,0 +1,140 @@
+import json
+import shutil
+import threading
+import time
+
+import pytest
+
+from config_watcher import ConfigWatcher
+from models.config_model import ConfigModel
+from models.course_model import CourseModel
+from models.lab_model import LabModel
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return str(path)
+
+
+def _edit_file(path, edit):
+    with open(path) as f:
+        data = json.load(f)
+    edit(data)
+    # Make sure the modification time moves even on coarse clocks
+    time.sleep(0.01)
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+def test_unchanged_file_does_nothing(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    assert ConfigWatcher(config_model).check() is None
+
+
+def test_external_entity_edit_is_applied_in_place(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    courses = config_model.config.config.courses
+    target = courses[0].course_id
+    untouched = next(c for c in courses if c.course_id != target)
+    watcher = ConfigWatcher(config_model)
+
+    def edit(data):
+        data["config"]["courses"][0]["credits"] = 1
+        data["config"]["rooms"].append("Annex 1")
+
+    _edit_file(config_path, edit)
+    applied, conflicts = watcher.check()
+
+    assert applied == {"courses": {target}, "rooms": None}
+    assert conflicts == {}
+    assert config_model.config.config.courses is courses
+    assert courses[0].credits == 1
+    assert any(c is untouched for c in courses)
+    assert "Annex 1" in config_model.config.config.rooms
+
+
+def test_external_deletion_is_applied(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    removed = config_model.config.config.faculty[-1].name
+    watcher = ConfigWatcher(config_model)
+
+    _edit_file(config_path, lambda data: data["config"]["faculty"].pop())
+    applied, _ = watcher.check()
+
+    assert applied == {"faculty": {removed}}
+    assert removed not in [f.name for f in config_model.config.config.faculty]
+
+
+def test_unsaved_local_edits_win(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    LabModel(config_model).add_lab("Local Lab")
+    watcher = ConfigWatcher(config_model)
+
+    def edit(data):
+        data["config"]["labs"].append("Disk Lab")
+        data["limit"] = 5
+
+    _edit_file(config_path, edit)
+    applied, conflicts = watcher.check()
+
+    assert conflicts == {"labs": None}
+    assert applied == {"limit": None}
+    assert "Local Lab" in config_model.config.config.labs
+    assert "Disk Lab" not in config_model.config.config.labs
+    assert config_model.config.limit == 5
+
+
+def test_own_commit_is_not_reapplied(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    watcher = ConfigWatcher(config_model)
+    course = config_model.config.config.courses[0]
+    CourseModel(config_model).modify_course(course.course_id, credits=1)
+    assert config_model.save_feature("config", "all")
+
+    assert watcher.check() == ({}, {})
+
+
+def test_invalid_external_edit_is_ignored(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    watcher = ConfigWatcher(config_model)
+    rooms = list(config_model.config.config.rooms)
+
+    _edit_file(config_path, lambda data: data["config"].update(rooms="oops"))
+
+    assert watcher.check() is None
+    assert config_model.config.config.rooms == rooms
+
+
+def test_external_edit_waits_for_edit_in_progress(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    watcher = ConfigWatcher(config_model)
+    _edit_file(config_path, lambda data: data["config"]["rooms"].append("Annex 1"))
+
+    with config_model.lock:
+        polling = threading.Thread(target=watcher.check)
+        polling.start()
+        polling.join(0.2)
+        assert polling.is_alive()
+        assert "Annex 1" not in config_model.config.config.rooms
+    polling.join()
+    assert "Annex 1" in config_model.config.config.rooms
+
+
+def test_applied_external_edits_are_not_local_edits(config_path):
+    config_model = ConfigModel(config_path, use_journal=False)
+    watcher = ConfigWatcher(config_model)
+    target = config_model.config.config.courses[0].course_id
+
+    for credits in (1, 2):
+
+        def edit(data, credits=credits):
+            data["config"]["courses"][0]["credits"] = credits
+
+        _edit_file(config_path, edit)
+        assert watcher.check() == ({"courses": {target}}, {})
+
+    assert config_model.config.config.courses[0].credits == 2
+    assert config_model.dirty.uncommitted() == {}
+    assert config_model.pending_changes() == {}
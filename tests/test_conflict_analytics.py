@@ -0,0 +1,147 @@
+import shutil
+
+import pytest
+from scheduler.time_slot_generator import TimeSlotGenerator
+
+from conflict_analytics import (
+    analyze_conflicts,
+    connected_components,
+    greedy_clique,
+    greedy_coloring,
+    slot_capacity,
+)
+from models.config_model import ConfigModel
+from models.conflict_model import ConflictModel
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+def _graph(edges, vertices=()):
+    graph = {v: set() for v in vertices}
+    for a, b in edges:
+        graph.setdefault(a, set()).add(b)
+        graph.setdefault(b, set()).add(a)
+    return graph
+
+
+def _is_clique(graph, vertices):
+    return all(b in graph[a] for a in vertices for b in vertices if a != b)
+
+
+def test_components_largest_first():
+    graph = _graph([(1, 2), (3, 4), (4, 5)], vertices=[0, 1, 2, 3, 4, 5])
+
+    assert connected_components(graph) == [[3, 4, 5], [1, 2], [0]]
+
+
+def test_clique_and_coloring_bounds():
+    # A 4-clique plus a 5-cycle needing three colors
+    edges = [(a, b) for a in "abcd" for b in "abcd" if a < b]
+    edges += [(1, 2), (2, 3), (3, 4), (4, 5), (5, 1), ("d", 1)]
+    graph = _graph(edges)
+
+    clique = greedy_clique(graph)
+    colors = greedy_coloring(graph)
+
+    assert _is_clique(graph, clique) and len(clique) == 4
+    assert all(colors[a] != colors[b] for a in graph for b in graph[a])
+    assert len(clique) <= len(set(colors.values())) <= 4
+
+
+def test_slot_capacity_brackets_disjoint_slots(config_model):
+    slots = TimeSlotGenerator(config_model.config.time_slot_config).time_slots(4)
+
+    lower, upper = slot_capacity(slots)
+
+    assert 0 < lower <= upper <= len(slots)
+    assert slot_capacity([]) == (0, 0)
+    assert slot_capacity(slots[:1]) == (1, 1)
+
+
+def test_example_config_is_not_provably_infeasible(config_model):
+    graph = ConflictModel(config_model).get_section_conflict_graph()
+    courses = config_model.config.config.courses
+
+    analysis = analyze_conflicts(graph, courses, config_model.config.time_slot_config)
+
+    assert analysis["infeasible"] is False and analysis["reasons"] == []
+    assert analysis["sections"] == len(courses)
+    for cluster in analysis["clusters"]:
+        assert _is_clique(graph, cluster["clique"])
+        assert len(cluster["clique"]) <= cluster["colors"]
+
+
+def test_large_clique_proves_infeasibility(config_model):
+    courses = config_model.config.config.courses
+    credits = courses[0].credits
+    same = [i for i, c in enumerate(courses) if c.credits == credits]
+    slots = TimeSlotGenerator(config_model.config.time_slot_config).time_slots(credits)
+    _, upper = slot_capacity(slots)
+    # Every section of this credit level, repeated until the clique outgrows
+    # the disjoint slots available
+    vertices = (same * (upper // len(same) + 2))[: upper + 1]
+    fake_courses = [courses[i] for i in vertices]
+    graph = _graph(
+        [(a, b) for a in range(len(vertices)) for b in range(a + 1, len(vertices))]
+    )
+
+    analysis = analyze_conflicts(
+        graph, fake_courses, config_model.config.time_slot_config
+    )
+
+    assert analysis["infeasible"] is True
+    assert analysis["clusters"][0]["status"] == "infeasible"
+    assert analysis["clique"] == upper + 1
+
+
+def test_missing_credit_pattern_is_reported(config_model):
+    course = config_model.config.config.courses[0].model_copy(update={"credits": 9})
+
+    analysis = analyze_conflicts(
+        {0: set()}, [course], config_model.config.time_slot_config
+    )
+
+    assert analysis["infeasible"] is True
+    assert "9-credit" in analysis["reasons"][0]
+
+
+def test_course_no_faculty_can_fit_is_unteachable(config_model):
+    config = config_model.config.config
+    courses = config.courses
+    zoppetti = next(f for f in config.faculty if f.name == "Zoppetti")
+    zoppetti.times = {day: [] for day in zoppetti.times}
+    graph = ConflictModel(config_model).get_section_conflict_graph()
+
+    analysis = analyze_conflicts(
+        graph, courses, config_model.config.time_slot_config, faculty=config.faculty
+    )
+
+    # Sections pinned to Zoppetti, or that only Zoppetti prefers, lose every
+    # candidate
+    def only_zoppetti(course):
+        if course.faculty:
+            return course.faculty == ["Zoppetti"]
+        return [
+            f.name for f in config.faculty if course.course_id in f.course_preferences
+        ] == ["Zoppetti"]
+
+    expected = [i for i, c in enumerate(courses) if only_zoppetti(c)]
+    assert 3 in expected
+    assert analysis["unteachable"] == expected
+    assert analysis["infeasible"] is True
+    assert any("CMSC 161" in reason for reason in analysis["reasons"])
+
+
+def test_unteachable_needs_faculty(config_model):
+    graph = ConflictModel(config_model).get_section_conflict_graph()
+
+    analysis = analyze_conflicts(
+        graph, config_model.config.config.courses, config_model.config.time_slot_config
+    )
+
+    assert analysis["unteachable"] == []
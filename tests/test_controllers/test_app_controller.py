@@ -3,6 +3,8 @@
 Tests for SchedulerController (app_controller.py).
 """
 
+import asyncio
+import json
 import pytest
 import shutil
 from pathlib import Path
@@ -99,6 +101,153 @@ def test_save_configuration_returns_false_when_no_config():
 # ================================================================
 
 
+@pytest.fixture
+def other_config(tmp_path):
+    path = tmp_path / "other.json"
+    shutil.copy(TESTING_CONFIG, path)
+    return str(path)
+
+
+def test_load_config_publishes_new_models(controller, other_config):
+    """load_config() should point the controller and the views at new models."""
+    from views.faculty_gui_view import FacultyGUIView
+    from views.lab_gui_view import LabGUIView
+
+    old_model = controller.config_model
+
+    success, error = controller.load_config(other_config)
+
+    assert success is True and error == ""
+    assert controller.config_model is not old_model
+    assert controller.config_path == other_config
+    assert controller.faculty_model.config_model is controller.config_model
+    assert FacultyGUIView.faculty_controller is controller.faculty_controller
+    assert LabGUIView._lab_controller is controller.lab_controller
+    # The previous config stays resident
+    assert controller.get_resident_configs() == [TEST_COPY_CONFIG, other_config]
+    assert old_model.saver is not None
+
+
+def test_switch_config_republishes_resident_models(controller, other_config):
+    """switch_config() should publish the resident graph without reloading."""
+    from views.faculty_gui_view import FacultyGUIView
+
+    first_model = controller.config_model
+    controller.load_config(other_config)
+
+    success, error = controller.switch_config(TEST_COPY_CONFIG)
+
+    assert success is True and error == ""
+    assert controller.config_model is first_model
+    assert controller.config_path == TEST_COPY_CONFIG
+    assert FacultyGUIView.faculty_model.config_model is first_model
+    assert controller.get_resident_configs()[-1] == TEST_COPY_CONFIG
+
+
+def test_switch_config_unknown_path_fails(controller, tmp_path):
+    """switch_config() should refuse files that are not loaded."""
+    old_model = controller.config_model
+
+    success, error = controller.switch_config(str(tmp_path / "other.json"))
+
+    assert success is False and error
+    assert controller.config_model is old_model
+
+
+def test_shutdown_closes_all_resident_configs(controller, other_config):
+    """shutdown() should flush and close every resident config."""
+    first_model = controller.config_model
+    controller.load_config(other_config)
+
+    controller.shutdown()
+
+    assert first_model.saver is None
+    assert controller.config_model.saver is None
+
+
+def test_load_config_failure_keeps_current_models(controller, tmp_path):
+    """A file that fails to load should leave the current config in place."""
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    old_model = controller.config_model
+
+    success, error = controller.load_config(str(bad))
+
+    assert success is False and error
+    assert controller.config_model is old_model
+    assert controller.config_path == TEST_COPY_CONFIG
+
+
+def test_load_config_async_publishes_new_models(controller, other_config):
+    """load_config_async() should build off the event loop and publish."""
+    from views.course_gui_view import CourseGUIView
+
+    success, error = asyncio.run(controller.load_config_async(other_config))
+
+    assert success is True and error == ""
+    assert controller.config_path == other_config
+    assert CourseGUIView.course_controller is controller.course_controller
+
+
+def test_load_config_async_failure_keeps_current_models(controller, tmp_path):
+    """load_config_async() should report errors without swapping anything."""
+    old_model = controller.config_model
+
+    success, error = asyncio.run(
+        controller.load_config_async(str(tmp_path / "missing.json"))
+    )
+
+    assert success is False and error
+    assert controller.config_model is old_model
+
+
+def test_load_config_same_file_keeps_unsaved_edits(controller):
+    """Reloading the same file should restore queued temp saves from the journal."""
+    controller.config_model.config.config.rooms.append("Test 101")
+    controller.config_model.mark_dirty("rooms")
+    controller.temp_save("all")
+
+    success, _ = controller.load_config(TEST_COPY_CONFIG)
+
+    assert success is True
+    assert "Test 101" in controller.config_model.config.config.rooms
+
+
+def test_failed_reload_of_same_file_keeps_model_open(tmp_path):
+    """A reload that fails must leave the current model saving normally."""
+    path = tmp_path / "config.json"
+    shutil.copy(TESTING_CONFIG, path)
+    with patch("controllers.app_controller.GUIView"):
+        from controllers.app_controller import SchedulerController
+
+        controller = SchedulerController(str(path))
+    model = controller.config_model
+    model.config.config.rooms.append("Test 101")
+    model.mark_dirty("rooms")
+    controller.temp_save("rooms")
+    # The journal of the unreadable file is moved aside next to it
+    path.write_text("{not json")
+
+    success, _ = controller.load_config(str(path))
+
+    assert success is False
+    assert controller.config_model is model
+    assert model.saver is not None
+    assert controller.temp_save("rooms")
+
+
+def test_reload_of_same_file_closes_replaced_model(controller):
+    """The replaced model is closed once the new one is published."""
+    model = controller.config_model
+
+    success, _ = asyncio.run(controller.load_config_async(TEST_COPY_CONFIG))
+
+    assert success is True
+    assert controller.config_model is not model
+    assert model.saver is None
+    assert controller.config_model.saver is not None
+
+
 # ================================================================
 # TESTS: temp_save and save_to_config
 # ================================================================
@@ -178,3 +327,16 @@ def test_get_schedule_limit_returns_100_when_no_config():
 
         ctrl = SchedulerController(None)
     assert ctrl.get_schedule_limit() == 100
+
+
+def test_get_schedule_limit_without_limit_in_file(tmp_path):
+    """A file with no limit reports the loaded config's default."""
+    path = tmp_path / "config.json"
+    data = json.loads(Path(TESTING_CONFIG).read_text())
+    del data["limit"]
+    path.write_text(json.dumps(data))
+    with patch("controllers.app_controller.GUIView"):
+        from controllers.app_controller import SchedulerController
+
+        ctrl = SchedulerController(str(path))
+    assert ctrl.get_schedule_limit() == ctrl.config_model.config.limit
@@ -8,11 +8,22 @@ Tests cover:
 - _parse_times() static method
 - All tool methods with mocked models
 - save_config() success and failure
+- Editing tools applied as one transaction each
 """
 
+import asyncio
+import shutil
+import threading
+
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 from controllers.chatbot_controller import ChatbotController
+from models.config_model import ConfigModel
+from models.conflict_model import ConflictModel
+from models.course_model import CourseModel
+from models.faculty_model import FacultyModel
+from models.lab_model import LabModel
+from models.room_model import RoomModel
 
 
 # ================================================================
@@ -24,7 +35,8 @@ from controllers.chatbot_controller import ChatbotController
 def mock_models():
     """Create mock models for testing."""
     return {
-        "lab_model": Mock(),
+        # Editing tools open a transaction through lab_model.config_model
+        "lab_model": MagicMock(),
         "room_model": Mock(),
         "course_model": Mock(),
         "faculty_model": Mock(),
@@ -234,6 +246,15 @@ def test_rename_room_failure(controller, mock_models):
     assert "Failed" in result
 
 
+def test_rename_rooms_parses_pairs(controller, mock_models):
+    mock_models["room_model"].rename_rooms.return_value = True
+    result = controller._rename_rooms("Roddy 136:Roddy 236, Roddy 140:Roddy 240")
+    assert "2 room(s)" in result
+    mock_models["room_model"].rename_rooms.assert_called_once_with(
+        {"Roddy 136": "Roddy 236", "Roddy 140": "Roddy 240"}
+    )
+
+
 def test_get_rooms_with_rooms(controller, mock_models):
     mock_models["room_model"].get_all_rooms.return_value = ["Roddy 140", "Roddy 136"]
     result = controller._get_rooms()
@@ -301,6 +322,23 @@ def test_get_course_details_not_found(controller, mock_models):
     assert "not found" in result
 
 
+def test_delete_courses_success(controller, mock_models):
+    mock_models["course_model"].course_exists.return_value = True
+    mock_models["course_model"].delete_courses.return_value = True
+    result = controller._delete_courses("CMSC 140, CMSC 152")
+    assert "Deleted 2 course(s)" in result
+    mock_models["course_model"].delete_courses.assert_called_once_with(
+        ["CMSC 140", "CMSC 152"]
+    )
+
+
+def test_delete_courses_reports_missing(controller, mock_models):
+    mock_models["course_model"].course_exists.side_effect = lambda c: c != "NOPE"
+    result = controller._delete_courses("CMSC 140,NOPE")
+    assert "NOPE" in result
+    mock_models["course_model"].delete_courses.assert_not_called()
+
+
 # ================================================================
 # TESTS: Faculty tool methods
 # ================================================================
@@ -439,6 +477,20 @@ def test_get_faculty_details_not_found(controller, mock_models):
 # ================================================================
 
 
+def test_add_conflicts_parses_pairs(controller, mock_models):
+    mock_models["conflict_model"].add_conflicts.return_value = True
+    result = controller._add_conflicts("CMSC 140:CMSC 161,CMSC 152:CMSC 161")
+    assert "2 conflict(s)" in result
+    mock_models["conflict_model"].add_conflicts.assert_called_once_with(
+        [("CMSC 140", "CMSC 161"), ("CMSC 152", "CMSC 161")]
+    )
+
+
+def test_add_conflicts_failure(controller, mock_models):
+    mock_models["conflict_model"].add_conflicts.return_value = False
+    assert "Failed" in controller._add_conflicts("CMSC 140:NOPE")
+
+
 def test_add_conflict_success(controller, mock_models):
     mock_models["conflict_model"].add_conflict.return_value = True
     result = controller._add_conflict("CMSC 340", "CMSC 341")
@@ -503,3 +555,63 @@ def test_save_config_no_config(no_config_controller):
     """save_config() should return False gracefully when no config is loaded."""
     result = no_config_controller.save_config()
     assert result is False
+
+
+# ================================================================
+# TESTS: chat() transactions
+# ================================================================
+
+
+@pytest.fixture
+def real_controller(tmp_path):
+    """Create a ChatbotController over a real copy of example.json."""
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path), use_journal=False)
+    return ChatbotController(
+        LabModel(config_model),
+        RoomModel(config_model),
+        CourseModel(config_model),
+        FacultyModel(config_model),
+        ConflictModel(config_model),
+    )
+
+
+def test_gui_edit_during_failed_turn_is_kept(real_controller, tmp_path):
+    config_model = real_controller.course_model.config_model
+    tool_done = threading.Event()
+    gui_done = threading.Event()
+
+    def invoke(_):
+        real_controller._delete_course("CMSC 362")
+        tool_done.set()
+        gui_done.wait(5)
+        raise RuntimeError("model unavailable")
+
+    real_controller._agent = Mock(invoke=Mock(side_effect=invoke))
+
+    async def turn_with_gui_edit():
+        turn = asyncio.create_task(real_controller.chat("Delete CMSC 362"))
+        await asyncio.to_thread(tool_done.wait, 5)
+        # The GUI edits on the event loop while the agent is still working
+        assert real_controller.room_model.add_room("Annex 1")
+        assert config_model.save_feature("temp", "rooms")
+        gui_done.set()
+        with pytest.raises(RuntimeError):
+            await turn
+
+    asyncio.run(turn_with_gui_edit())
+
+    assert not config_model.active_transaction.active
+    assert real_controller.room_model.room_exists("Annex 1")
+    assert "Annex 1" in (tmp_path / "config.json.temp").read_text()
+    # The tool call finished before the turn failed, so its edit stays
+    assert not real_controller.course_model.course_exists("CMSC 362")
+
+
+def test_invalid_tool_edit_is_reported_and_rolled_back(real_controller):
+    response = real_controller._modify_course("CMSC 362", "room", "Nowhere 1")
+
+    assert "rolled back" in response
+    course = real_controller.course_model.get_course_by_id("CMSC 362")
+    assert "Nowhere 1" not in course.room
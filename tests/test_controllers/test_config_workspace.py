@@ -0,0 +1,108 @@
+# tests/test_controllers/test_config_workspace.py
+"""
+Tests for ConfigWorkspace (config_workspace.py).
+"""
+
+import shutil
+
+import pytest
+
+from controllers.config_workspace import ConfigWorkspace, intern_config
+from models.config_model import ConfigModel
+
+TESTING_CONFIG = "example.json"
+
+
+class _Graph:
+    """Stand-in for ConfigGraph: the workspace only needs the path and model."""
+
+    def __init__(self, config_path):
+        self.config_path = config_path
+        self.config_model = ConfigModel(config_path)
+        intern_config(self.config_model.config)
+
+
+@pytest.fixture
+def config_paths(tmp_path):
+    paths = []
+    for name in ("fall.json", "spring.json", "summer.json"):
+        path = tmp_path / name
+        shutil.copy(TESTING_CONFIG, path)
+        paths.append(str(path))
+    return paths
+
+
+def test_intern_config_shares_names_between_configs(config_paths):
+    """Equal names in separately loaded configs should be the same object."""
+    first = ConfigModel(config_paths[0]).config
+    second = ConfigModel(config_paths[1]).config
+
+    intern_config(first)
+    intern_config(second)
+
+    assert first.config.rooms[0] is second.config.rooms[0]
+    assert first.config.courses[0].course_id is second.config.courses[0].course_id
+    assert first.config.faculty[0].name is second.config.faculty[0].name
+    first_key = next(iter(first.config.faculty[0].room_preferences))
+    second_key = next(iter(second.config.faculty[0].room_preferences))
+    assert first_key is second_key
+
+
+def test_intern_config_keeps_config_equal(config_paths):
+    """Interning must not change any value."""
+    model = ConfigModel(config_paths[0])
+    before = model.config.model_copy(deep=True)
+
+    intern_config(model.config)
+
+    assert model.config == before
+
+
+def test_add_activates_and_orders_by_use(config_paths):
+    workspace = ConfigWorkspace(max_resident=3)
+    graphs = [_Graph(path) for path in config_paths]
+    for graph in graphs:
+        workspace.add(graph)
+
+    assert workspace.activate(config_paths[0]) is graphs[0]
+
+    assert workspace.active == workspace.key(config_paths[0])
+    assert workspace.paths() == [config_paths[1], config_paths[2], config_paths[0]]
+    workspace.close()
+
+
+def test_add_evicts_least_recently_used(config_paths):
+    workspace = ConfigWorkspace(max_resident=2)
+    graphs = [_Graph(path) for path in config_paths]
+
+    assert workspace.add(graphs[0]) == []
+    assert workspace.add(graphs[1]) == []
+    evicted = workspace.add(graphs[2])
+
+    assert evicted == [graphs[0]]
+    assert workspace.get(config_paths[0]) is None
+    assert workspace.paths() == config_paths[1:]
+    workspace.close()
+
+
+def test_max_resident_from_environment(monkeypatch):
+    monkeypatch.setenv("SCHEDULER_MAX_RESIDENT_CONFIGS", "2")
+
+    assert ConfigWorkspace().max_resident == 2
+
+
+def test_memory_report_counts_shared_names_once(config_paths):
+    workspace = ConfigWorkspace()
+    workspace.add(_Graph(config_paths[0]))
+    alone = workspace.memory_report()[0]
+    workspace.add(_Graph(config_paths[1]))
+
+    report = workspace.memory_report()
+
+    assert [entry["active"] for entry in report] == [False, True]
+    assert all(entry["bytes"] > 0 for entry in report)
+    assert all(entry["history_bytes"] > 0 for entry in report)
+    # Interned names are now shared with the second config
+    assert report[0]["shared_bytes"] > alone["shared_bytes"]
+    assert report[0]["bytes"] < alone["bytes"]
+    workspace.close()
@@ -476,3 +476,86 @@ def test_conflict_controller_add_conflict_returns_tuple(conflict_controller):
         )
         assert isinstance(success, bool)
         assert isinstance(message, str)
+
+
+def test_conflict_controller_get_conflict_analysis(conflict_controller):
+    analysis = conflict_controller.get_conflict_analysis()
+    labels = {label for label, _, _ in conflict_controller.get_courses_with_sections()}
+    assert analysis["infeasible"] is False
+    assert analysis["clique"] <= analysis["colors"]
+    for cluster in analysis["clusters"]:
+        assert set(cluster["clique"]) <= set(cluster["sections"]) <= labels
+    assert analysis["unteachable"] == []
+
+
+def test_faculty_controller_get_slot_fit(faculty_controller):
+    name = faculty_controller.get_existing_faculty_names()[0]
+    fit = faculty_controller.get_slot_fit(name)
+    assert set(fit) == {4}
+    assert 0 < fit[4][0] <= fit[4][1]
+    assert faculty_controller.get_slot_fit("Nobody") == {}
+
+
+# ================================================================
+# TESTS: Bulk mutations save once
+# ================================================================
+
+
+def test_course_controller_delete_courses_saves_once(course_controller, config_model):
+    config_model.save_feature = Mock()
+    success, message = course_controller.delete_courses(["CMSC 140", "CMSC 161"])
+    assert success is True
+    config_model.save_feature.assert_called_once_with("temp", "all")
+
+    success, message = course_controller.delete_courses(["CMSC 152", "NOPE 1"])
+    assert success is False
+    assert "NOPE 1" in message
+    assert config_model.save_feature.call_count == 1
+
+
+def test_faculty_controller_add_faculty_many_saves_once(
+    faculty_controller, config_model
+):
+    config_model.save_feature = Mock()
+    data = [
+        {"name": name, "is_full_time": False, "times": {}, "course_preferences": {}}
+        for name in ("Bulk One", "Bulk Two")
+    ]
+    success, _ = faculty_controller.add_faculty_many(data)
+    assert success is True
+    config_model.save_feature.assert_called_once_with("temp", "faculty")
+
+
+def test_room_controller_rename_rooms_saves_once(room_controller, config_model):
+    config_model.save_feature = Mock()
+    success, _ = room_controller.rename_rooms(
+        {"Roddy 136": "Roddy 236", "Roddy 140": "Roddy 240"}
+    )
+    assert success is True
+    assert room_controller.get_all_rooms()[:2] == ["Roddy 236", "Roddy 240"]
+    config_model.save_feature.assert_called_once_with("temp", "all")
+
+
+def test_conflict_controller_add_conflicts_saves_once(
+    conflict_controller, config_model
+):
+    config_model.save_feature = Mock()
+    success, _ = conflict_controller.add_conflicts(
+        [("CMSC 140", "CMSC 420"), ("CMSC 152", "CMSC 420")]
+    )
+    assert success is True
+    assert config_model.save_feature.call_count == 1
+
+
+def test_course_controller_delete_course_by_stale_section_id(course_controller):
+    _, section_id, course = course_controller.get_sections()[0]
+    success, _ = course_controller.delete_course(
+        course.course_id, section_id=section_id
+    )
+    assert success is True
+
+    success, message = course_controller.delete_course(
+        course.course_id, section_id=section_id
+    )
+    assert success is False
+    assert "no longer exists" in message
@@ -0,0 +1,174 @@
+import gzip
+import lzma
+from unittest.mock import Mock
+
+import pytest
+
+from controllers.schedule_controller import (
+    ScheduleController,
+    is_archive,
+    split_compression,
+)
+from models.scheduler_model import SchedulerModel
+
+CSV_BYTES = (
+    b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+    b"\n"
+    b"CS102.1,Dr. Jones,Room B,L1,TUE 10:00-11:00,WED 10:00-11:00^\n"
+)
+
+
+@pytest.fixture
+def schedule_controller():
+    return ScheduleController(SchedulerModel(None), Mock())
+
+
+@pytest.fixture
+def schedules(schedule_controller):
+    return schedule_controller.import_schedule_file("s.csv", CSV_BYTES)
+
+
+def test_split_compression():
+    assert split_compression("week1.csv.gz") == ("week1.csv", ".gz")
+    assert split_compression("week1.ndjson.xz") == ("week1.ndjson", ".xz")
+    assert split_compression("week1.json") == ("week1.json", None)
+
+
+def test_is_archive():
+    assert is_archive("week1.sarc") and is_archive("week1.sarc.gz")
+    assert not is_archive("week1.csv") and not is_archive("sarc.json.xz")
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "ndjson", "sarc"])
+@pytest.mark.parametrize("compression", [".gz", ".xz", ".bz2"])
+def test_compressed_round_trip(schedule_controller, schedules, fmt, compression):
+    data = schedule_controller.export_schedules(fmt, schedules, compression=compression)
+    restored = schedule_controller.import_schedule_file(f"out.{fmt}{compression}", data)
+    assert schedule_controller.export_schedules(
+        "csv", restored
+    ) == schedule_controller.export_schedules("csv", schedules)
+
+
+def test_gzip_export_is_standard_gzip(schedule_controller, schedules):
+    data = schedule_controller.export_schedules("csv", schedules, compression=".gz")
+    assert gzip.decompress(data) == schedule_controller.export_schedules(
+        "csv", schedules
+    )
+
+
+def test_import_xz_ndjson_written_by_stdlib(schedule_controller, schedules):
+    ndjson = schedule_controller.export_schedules("ndjson", schedules)
+    restored = schedule_controller.import_schedule_file(
+        "batch.ndjson.xz", lzma.compress(ndjson)
+    )
+    assert len(restored) == 2
+
+
+def test_unsupported_compression_raises(schedule_controller, schedules):
+    with pytest.raises(ValueError):
+        schedule_controller.export_schedules("csv", schedules, compression=".zip")
+
+
+def test_unsupported_import_type_raises(schedule_controller):
+    with pytest.raises(ValueError):
+        schedule_controller.import_schedule_file("schedules.txt.gz", gzip.compress(b""))
+
+
+def test_import_schedule_files_deduplicates(schedule_controller, schedules):
+    json_bytes = schedule_controller.export_schedules("json", schedules[:1])
+    extra = b"CS103.1,Dr. Lee,Room C,None,FRI 13:00-13:50\n"
+    progress = []
+    new, report = schedule_controller.import_schedule_files(
+        [("a.json", json_bytes), ("b.csv", CSV_BYTES + b"\n" + extra)],
+        existing=schedules[1:],
+        progress_callback=lambda *args: progress.append(args),
+        max_workers=2,
+    )
+    assert len(new) == 2
+    assert new[1][0].faculty == "Dr. Lee"
+    assert report[0] == {
+        "file": "a.json",
+        "imported": 1,
+        "duplicates": 0,
+        "error": None,
+    }
+    assert report[1]["duplicates"] == 2
+    assert sorted(p[0] for p in progress) == ["a.json", "b.csv"]
+    assert {p[2] for p in progress} == {2}
+
+
+def test_dedup_snapshot_does_not_parse_lazy_schedules(schedule_controller, schedules):
+    csv_bytes = schedule_controller.export_schedules("csv", schedules)
+    lazy = schedule_controller.import_schedule_file("a.csv", csv_bytes, lazy=True)
+    viewed = lazy[0]
+    loaded = schedule_controller.merge_schedules(lazy, [schedules[1]])
+
+    snapshot = schedule_controller.dedup_snapshot(loaded)
+
+    assert lazy.materialized_count() == 1
+    assert snapshot == (schedules[1], viewed)
+    _, report = schedule_controller.import_schedule_files(
+        [("b.csv", csv_bytes)], existing=snapshot
+    )
+    assert report[0]["duplicates"] == 2
+    assert lazy.materialized_count() == 1
+
+
+def test_import_schedule_files_reports_errors(schedule_controller):
+    new, report = schedule_controller.import_schedule_files([("bad.json", b"not json")])
+    assert new == []
+    assert report[0]["error"]
+
+
+def test_schedule_fingerprint_ignores_order(schedule_controller):
+    model = schedule_controller.model
+    a = model.import_from_csv(
+        b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+        b"CS102.1,Dr. Jones,Room B,None,TUE 10:00-11:00\n"
+    )[0]
+    assert model.schedule_fingerprint(a) == model.schedule_fingerprint(a[::-1])
+    assert model.schedule_fingerprint(a) != model.schedule_fingerprint(a[:1])
+
+
+def test_import_schedule_directory(schedule_controller, schedules, tmp_path):
+    (tmp_path / "one.csv.gz").write_bytes(gzip.compress(CSV_BYTES))
+    (tmp_path / "two.ndjson").write_bytes(
+        schedule_controller.export_schedules("ndjson", schedules)
+    )
+    (tmp_path / "notes.txt").write_text("ignored")
+    new, report = schedule_controller.import_schedule_directory(
+        str(tmp_path), max_workers=2
+    )
+    assert [r["file"] for r in report] == ["one.csv.gz", "two.ndjson"]
+    assert len(new) == 2
+    assert report[1]["duplicates"] == 2
+
+
+@pytest.mark.parametrize("name", ["s.csv", "s.json", "s.ndjson.gz"])
+def test_lazy_import_matches_eager(schedule_controller, schedules, name):
+    fmt = name.split(".")[1]
+    data = schedule_controller.export_schedules(
+        fmt, schedules, compression=".gz" if name.endswith(".gz") else None
+    )
+    lazy = schedule_controller.import_schedule_file(name, data, lazy=True)
+    assert schedule_controller.export_schedules(
+        "csv", lazy
+    ) == schedule_controller.export_schedules("csv", schedules)
+
+
+def test_merge_schedules_keeps_lazy(schedule_controller, schedules):
+    lazy = schedule_controller.import_schedule_file("s.csv", CSV_BYTES, lazy=True)
+    merged = schedule_controller.merge_schedules(list(schedules), lazy)
+    assert len(merged) == 2 * len(schedules)
+    assert merged.materialized_count() == 0
+    merged = schedule_controller.merge_schedules(merged, schedules)
+    assert len(merged) == 3 * len(schedules)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_import_keeps_config_path(lazy):
+    config_model = Mock(config_path="/configs/config.json")
+    controller = ScheduleController(SchedulerModel(config_model), Mock())
+
+    assert controller.import_schedule_file("s.csv", CSV_BYTES, lazy=lazy)
+    assert config_model.config_path == "/configs/config.json"
@@ -1,6 +1,6 @@
 import os
 import pytest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 from controllers.chatbot_controller import ChatbotController
 
 
@@ -12,7 +12,8 @@ def test_chatbot_what_can_you_do():
     Integration test to see if the chatbot works by prompting it 'What can you do?'.
     Requires OPENAI_API_KEY to be set in the environment.
     """
-    mock_lab_model = Mock()
+    # MagicMock so config_model.transaction() works as a context manager
+    mock_lab_model = MagicMock()
     mock_lab_model.get_all_labs.return_value = []
     mock_room_model = Mock()
     mock_room_model.get_all_rooms.return_value = []
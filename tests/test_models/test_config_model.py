@@ -13,6 +13,7 @@ import pytest
 import shutil
 from pathlib import Path
 
+from models import config_model as config_model_module
 from models.config_model import ConfigModel
 
 # Test configuration
@@ -195,3 +196,37 @@ def test_config_model_nonexistent_file():
     """
     with pytest.raises(FileNotFoundError):
         ConfigModel("nonexistent_file.json")
+
+
+def test_pending_changes_reflect_uncommitted_edits(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path), use_journal=False)
+    assert config_model.pending_changes() == {}
+
+    config_model.config.config.rooms.append("Annex 1")
+    assert config_model.pending_changes() == {"rooms": {"added": ["Annex 1"]}}
+    assert config_model.safe_save()
+    assert config_model.pending_changes() == {}
+
+
+def test_pending_changes_reuse_the_parsed_file(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path), use_journal=False)
+    loads = []
+    load = config_model_module.load_config
+    monkeypatch.setattr(
+        config_model_module,
+        "load_config",
+        lambda config_path: loads.append(config_path) or load(config_path),
+    )
+
+    config_model.pending_changes()
+    config_model.config.config.rooms.append("Annex 1")
+    assert config_model.pending_changes() == {"rooms": {"added": ["Annex 1"]}}
+    assert len(loads) == 1
+
+    assert config_model.safe_save()
+    assert config_model.pending_changes() == {}
+    assert len(loads) == 2
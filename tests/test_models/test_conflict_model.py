@@ -168,6 +168,42 @@ def test_add_conflict_mutual(conflict_model, course_model):
     assert "MUTUAL A" in course_b_updated.conflicts
 
 
+def test_add_conflicts_bulk(conflict_model, course_model):
+    """
+    Test adding several mutual conflicts in one call.
+
+    Parameters:
+        conflict_model (ConflictModel): Conflict model fixture
+        course_model (CourseModel): Course model fixture
+    """
+    for course_id in ("BULK A", "BULK B", "BULK C"):
+        course_model.add_course(build_test_course(course_id))
+
+    assert conflict_model.add_conflicts([("BULK A", "BULK B"), ("BULK A", "BULK C")])
+
+    assert conflict_model.get_conflicting_courses("BULK A") == {"BULK B", "BULK C"}
+    assert conflict_model.conflict_exists("BULK C", "BULK A")
+    assert not conflict_model.conflict_exists("BULK B", "BULK C")
+
+
+def test_add_conflicts_all_or_nothing(conflict_model, course_model):
+    """
+    Test that no conflict is added when one pair is invalid.
+
+    Parameters:
+        conflict_model (ConflictModel): Conflict model fixture
+        course_model (CourseModel): Course model fixture
+    """
+    course_model.add_course(build_test_course("BULK D"))
+    course_model.add_course(build_test_course("BULK E"))
+
+    assert not conflict_model.add_conflicts(
+        [("BULK D", "BULK E"), ("BULK D", "MISSING 1")]
+    )
+    assert not conflict_model.add_conflicts([("BULK D", "BULK D")])
+    assert not conflict_model.conflict_exists("BULK D", "BULK E")
+
+
 def test_add_conflict_with_sections_success(conflict_model, course_model):
     courses = conflict_model.config_model.config.config.courses
     idx_a = len(courses)
@@ -186,6 +222,24 @@ def test_add_conflict_with_sections_success(conflict_model, course_model):
     assert "SEC A" in c2.conflicts
 
 
+def test_conflict_by_section_ids_after_delete(conflict_model, course_model):
+    course_model.add_course(build_test_course("SEC C"))
+    course_model.add_course(build_test_course("SEC D"))
+    ids = {c.course_id: s for _, s, c in course_model.get_sections()}
+    course_model.delete_course("CMSC 140")
+
+    assert conflict_model.add_conflict(
+        "SEC C", "SEC D", section_id_1=ids["SEC C"], section_id_2=ids["SEC D"]
+    )
+    assert conflict_model.conflict_exists("SEC C", "SEC D")
+    assert conflict_model.delete_conflict(
+        "SEC C", "SEC D", section_id_1=ids["SEC C"], section_id_2=ids["SEC D"]
+    )
+    assert not conflict_model.add_conflict(
+        "SEC C", "CMSC 152", section_id_1=ids["SEC C"], section_id_2=ids["CMSC 140"]
+    )
+
+
 def test_add_conflict_with_sections_out_of_bounds(conflict_model, course_model):
     courses = conflict_model.config_model.config.config.courses
     len(courses)
@@ -678,3 +732,128 @@ def test_conflict_exists_false(conflict_model, course_model):
 
     # Test
     assert not conflict_model.conflict_exists("NOEXIST A", "NOEXIST B")
+
+
+# ================================================================
+# TESTS: Conflict Adjacency
+# ================================================================
+
+
+def scan_all_conflicts(courses):
+    """
+    Reference implementation: the original scan over every pair of sections.
+    """
+    conflicts = []
+    seen = set()
+    for i, course in enumerate(courses):
+        for conflict_id in course.conflicts:
+            for j, other in enumerate(courses):
+                if other.course_id == conflict_id:
+                    key = (min(i, j), max(i, j))
+                    if key not in seen:
+                        seen.add(key)
+                        conflicts.append((course.course_id, conflict_id, i, j))
+    return conflicts
+
+
+def test_get_all_conflicts_matches_scan_after_edits(conflict_model, course_model):
+    """
+    Test that the indexed enumeration matches a full scan as conflicts change.
+
+    Parameters:
+        conflict_model (ConflictModel): Conflict model fixture
+        course_model (CourseModel): Course model fixture
+    """
+    courses = conflict_model.config_model.config.config.courses
+    assert conflict_model.get_all_conflicts() == scan_all_conflicts(courses)
+
+    course_model.add_course(build_test_course("ADJ A"))
+    conflict_model.add_conflict("ADJ A", "CMSC 140")
+    conflict_model.delete_conflict("CMSC 161", "CMSC 140")
+    course_model.delete_course("CMSC 162")
+
+    assert conflict_model.get_all_conflicts() == scan_all_conflicts(courses)
+    assert conflict_model.conflict_exists("CMSC 140", "ADJ A")
+    assert not conflict_model.conflict_exists("CMSC 140", "CMSC 161")
+
+
+def test_conflict_graph_is_symmetric(conflict_model):
+    """
+    Test that the course-level adjacency matches the section-level pairs.
+
+    Parameters:
+        conflict_model (ConflictModel): Conflict model fixture
+    """
+    graph = conflict_model.get_conflict_graph()
+
+    expected = {course_id: set() for course_id in graph}
+    for c1, c2, _, _ in conflict_model.get_all_conflicts():
+        if c1 != c2:
+            expected[c1].add(c2)
+            expected[c2].add(c1)
+    assert graph == expected
+    for course_id, neighbours in graph.items():
+        assert conflict_model.get_conflicting_courses(course_id) == neighbours
+
+
+@pytest.mark.slow
+def test_benchmark_conflicts_at_2000_sections(tmp_path):
+    """
+    Benchmark conflict enumeration and lookup against the original scan on
+    a configuration with 2,000 sections.
+    """
+    import json
+    import random
+    import time
+
+    with open(TESTING_CONFIG) as f:
+        data = json.load(f)
+    rng = random.Random(420)
+    course_ids = [f"BENCH {n:03d}" for n in range(700)]
+    conflicts = {
+        course_id: rng.sample([c for c in course_ids if c != course_id], 3)
+        for course_id in course_ids
+    }
+    data["config"]["courses"] = [
+        {
+            "course_id": course_ids[n % len(course_ids)],
+            "credits": 3,
+            "room": [],
+            "lab": [],
+            "faculty": [],
+            "conflicts": conflicts[course_ids[n % len(course_ids)]],
+        }
+        for n in range(2000)
+    ]
+    for faculty in data["config"]["faculty"]:
+        faculty["course_preferences"] = {}
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps(data))
+    model = ConflictModel(ConfigModel(str(path), use_journal=False))
+    courses = model.config_model.config.config.courses
+
+    start = time.perf_counter()
+    expected = scan_all_conflicts(courses)
+    scan_time = time.perf_counter() - start
+    start = time.perf_counter()
+    found = model.get_all_conflicts()
+    build_time = time.perf_counter() - start
+    # The index is built on first use and then maintained under mutation
+    start = time.perf_counter()
+    model.get_all_conflicts()
+    index_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(1000):
+        model.conflict_exists(course_ids[0], course_ids[1])
+    exists_time = (time.perf_counter() - start) / 1000
+
+    print(
+        f"\n2000 sections: scan {scan_time * 1000:.1f} ms, "
+        f"indexed {index_time * 1000:.1f} ms "
+        f"(first call with index build {build_time * 1000:.1f} ms), "
+        f"conflict_exists {exists_time * 1e6:.1f} us "
+        f"(was one full scan per call)"
+    )
+    # Timings are reported, not asserted: they vary with machine load and
+    # coverage tracing
+    assert found == expected
@@ -405,3 +405,80 @@ def test_delete_course_by_section_index(course_model):
     assert result
     # At least one section should still exist
     assert course_model.course_exists("DELSECT 101")
+
+
+def test_section_ids_address_sections_after_deletes(course_model):
+    """
+    Test that a section id taken before a delete still names the same section.
+
+    Parameters:
+        course_model (CourseModel): Course model fixture
+    """
+    course_model.add_course(build_test_course(course_id="STABLE 101", credits=3))
+    course_model.add_course(build_test_course(course_id="STABLE 101", credits=3))
+    sections = course_model.get_sections()
+    first_id, second_id = [s for _, s, c in sections if c.course_id == "STABLE 101"]
+    second = course_model.get_all_courses()[course_model.section_position(second_id)]
+
+    assert course_model.delete_course("STABLE 101", section_id=first_id)
+    assert not course_model.delete_course("STABLE 101", section_id=first_id)
+    assert course_model.modify_course("STABLE 101", section_id=second_id, credits=4)
+
+    assert second.credits == 4
+    assert course_model.get_courses_with_sections()[-1][2] is second
+
+
+def test_section_id_must_match_course(course_model):
+    """
+    Test that a section id of a different course is rejected.
+
+    Parameters:
+        course_model (CourseModel): Course model fixture
+    """
+    _, section_id, course = course_model.get_sections()[0]
+    other = next(
+        c.course_id
+        for c in course_model.get_all_courses()
+        if c.course_id != course.course_id
+    )
+
+    assert not course_model.delete_course(other, section_id=section_id)
+    assert not course_model.modify_course(other, section_id=section_id, credits=1)
+    assert course_model.section_position(section_id) == 0
+
+
+def test_delete_courses_matches_sequential_deletes(course_model, test_config):
+    """
+    Test that a bulk delete leaves the same config as deleting one by one.
+
+    Parameters:
+        course_model (CourseModel): Course model fixture
+        test_config (str): Path to test config
+    """
+    targets = ["CMSC 140", "CMSC 161", "CMSC 362"]
+    sequential = CourseModel(ConfigModel(test_config))
+    for course_id in targets:
+        sequential.delete_course(course_id)
+
+    assert course_model.delete_courses(targets)
+
+    bulk = course_model.config_model.config.config
+    expected = sequential.config_model.config.config
+    assert bulk.courses == expected.courses
+    assert bulk.faculty == expected.faculty
+    assert not any(course_model.course_exists(c) for c in targets)
+
+
+def test_delete_courses_all_or_nothing(course_model):
+    """
+    Test that nothing is deleted when one course ID is unknown.
+
+    Parameters:
+        course_model (CourseModel): Course model fixture
+    """
+    before = len(course_model.get_all_courses())
+
+    assert not course_model.delete_courses(["CMSC 140", "NOPE 999"])
+    assert not course_model.delete_courses([])
+    assert len(course_model.get_all_courses()) == before
+    assert course_model.course_exists("CMSC 140")
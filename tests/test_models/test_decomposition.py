@@ -0,0 +1,175 @@
+# tests/test_models/test_decomposition.py
+"""
+Tests for splitting a config into independent components and combining
+their schedules.
+"""
+
+import itertools
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.config_model import ConfigModel
+from models.decomposition import (
+    component_configs,
+    interaction_components,
+    stream_product,
+)
+from models.scheduler_model import SchedulerModel
+
+TESTING_CONFIG = "example.json"
+
+
+def _department(config: dict, prefix: str, course_count: int) -> dict:
+    """
+    Copy the first courses of a config, renaming everything they reference.
+    """
+    courses = config["courses"][:course_count]
+    ids = {c["course_id"] for c in courses}
+    rename = f"{prefix} {{}}".format
+    department = {
+        "rooms": [rename(r) for r in config["rooms"]],
+        "labs": [rename(lab) for lab in config["labs"]],
+        "courses": [],
+        "faculty": [],
+    }
+    for course in courses:
+        department["courses"].append(
+            {
+                **course,
+                "course_id": rename(course["course_id"]),
+                "room": [rename(r) for r in course["room"]],
+                "lab": [rename(lab) for lab in course["lab"]],
+                "conflicts": [rename(c) for c in course["conflicts"] if c in ids],
+                "faculty": [rename(f) for f in course["faculty"]],
+            }
+        )
+    for member in config["faculty"]:
+        if not ids & set(member["course_preferences"]):
+            continue
+        department["faculty"].append(
+            {
+                **member,
+                "name": rename(member["name"]),
+                "minimum_credits": 0,
+                "course_preferences": {
+                    rename(k): v
+                    for k, v in member["course_preferences"].items()
+                    if k in ids
+                },
+                "room_preferences": {
+                    rename(k): v for k, v in member["room_preferences"].items()
+                },
+                "lab_preferences": {
+                    rename(k): v for k, v in member["lab_preferences"].items()
+                },
+            }
+        )
+    return department
+
+
+@pytest.fixture
+def departments_model(tmp_path):
+    """
+    A config made of two departments that share nothing.
+    """
+    with open(TESTING_CONFIG) as f:
+        data = json.load(f)
+    first = _department(data["config"], "A", 3)
+    second = _department(data["config"], "B", 2)
+    data["config"] = {key: first[key] + second[key] for key in first}
+    data["optimizer_flags"] = []
+    path = tmp_path / "departments.json"
+    path.write_text(json.dumps(data))
+    model = ConfigModel(str(path), use_journal=False)
+    yield model
+    model.close()
+
+
+def test_example_config_is_one_component():
+    model = ConfigModel(TESTING_CONFIG, use_journal=False)
+    try:
+        components = interaction_components(model.config.config)
+    finally:
+        model.close()
+
+    assert components == [list(range(len(model.config.config.courses)))]
+
+
+def test_departments_are_separate_components(departments_model):
+    config = departments_model.config
+
+    components = interaction_components(config.config)
+
+    assert components == [[0, 1, 2], [3, 4]]
+    subs = component_configs(config, components)
+    assert [c.course_id for c in subs[1].config.courses] == [
+        c.course_id for c in config.config.courses[3:]
+    ]
+    assert all(f.name.startswith("B ") for f in subs[1].config.faculty)
+    assert subs[1].config.rooms == config.config.rooms
+    assert subs[1].limit == config.limit
+
+
+def test_unassignable_faculty_join_first_component(departments_model):
+    config = departments_model.config
+    idle = config.config.faculty[-1].model_copy(
+        update={"name": "Idle", "course_preferences": {}}
+    )
+    config.config.faculty.append(idle)
+
+    subs = component_configs(config, interaction_components(config.config))
+
+    assert idle in subs[0].config.faculty
+    assert idle not in subs[1].config.faculty
+
+
+def test_stream_product_matches_cartesian_product():
+    sizes = [2, 3, 4]
+    expected = set(itertools.product(*(range(s) for s in sizes)))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        found = list(
+            stream_product(
+                [iter(range(s)) for s in sizes], limit=100, executor=executor
+            )
+        )
+
+    assert len(found) == len(expected) and set(found) == expected
+    assert found[0] == (0, 0, 0)
+
+
+def test_stream_product_pulls_only_what_it_needs():
+    counters = [itertools.count(), itertools.count()]
+
+    found = list(stream_product(counters, limit=9))
+
+    assert set(found) == set(itertools.product(range(3), range(3)))
+    assert next(counters[0]) == 3 and next(counters[1]) == 3
+
+
+def test_stream_product_empty_component_yields_nothing():
+    assert list(stream_product([iter([1, 2]), iter([])], limit=5)) == []
+
+
+def test_generate_schedules_combines_components(departments_model):
+    courses = departments_model.config.config.courses
+
+    def fake_scheduler(sub_config):
+        scheduler = MagicMock()
+        scheduler.get_models.return_value = iter(
+            [[(c.course_id, k) for c in sub_config.config.courses] for k in range(2)]
+        )
+        return scheduler
+
+    with patch("models.scheduler_model.Scheduler", side_effect=fake_scheduler) as mock:
+        schedules = list(SchedulerModel(departments_model).generate_schedules(limit=3))
+
+    assert mock.call_count == 2
+    assert len(schedules) == 3 and len(set(map(tuple, schedules))) == 3
+    for schedule in schedules:
+        assert [course_id for course_id, _ in schedule] == [
+            c.course_id for c in courses
+        ]
@@ -443,3 +443,45 @@ def test_validate_faculty_references_all_valid(faculty_model):
 
     assert removed_count == 0
     assert "Valid Only" in test_course.faculty
+
+
+def test_add_faculty_many_success(faculty_model):
+    """
+    Test adding several faculty members in one call.
+
+    Parameters:
+        faculty_model (FacultyModel): Faculty model fixture
+    """
+    batch = [
+        build_faculty_config("Batch One", "y", ["M", "W"], {}),
+        build_faculty_config("Batch Two", "n", ["T"], {}),
+    ]
+
+    assert faculty_model.add_faculty_many(batch)
+    assert faculty_model.faculty_exists("Batch One")
+    assert faculty_model.faculty_exists("Batch Two")
+
+
+def test_add_faculty_many_rejects_duplicates(faculty_model):
+    """
+    Test that nothing is added when a name repeats or already exists.
+
+    Parameters:
+        faculty_model (FacultyModel): Faculty model fixture
+    """
+    before = len(faculty_model.config_model.config.config.faculty)
+
+    assert not faculty_model.add_faculty_many(
+        [
+            build_faculty_config("Batch One", "y", ["M"], {}),
+            build_faculty_config("batch one", "y", ["M"], {}),
+        ]
+    )
+    assert not faculty_model.add_faculty_many(
+        [
+            build_faculty_config("Batch Three", "y", ["M"], {}),
+            build_faculty_config("Hardy", "y", ["M"], {}),
+        ]
+    )
+    assert len(faculty_model.config_model.config.config.faculty) == before
+    assert not faculty_model.faculty_exists("Batch Three")
@@ -0,0 +1,131 @@
+# tests/test_models/test_lazy_schedules.py
+"""
+Unit tests for lazy schedule import.
+
+Tests cover:
+- Boundary indexing for CSV, JSON and NDJSON
+- Schedules parsed only when indexed, with a bounded LRU
+- Appending built and lazy schedules without materializing
+"""
+
+import pytest
+
+from models.lazy_schedules import (
+    LazyScheduleList,
+    index_csv_spans,
+    index_json_spans,
+    index_ndjson_spans,
+)
+from models.scheduler_model import SchedulerModel
+
+CSV_BYTES = (
+    b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+    b"\n"
+    b"CS102.1,Dr. Jones,Room B,L1,TUE 10:00-11:00,WED 10:00-11:00^\n"
+    b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+    b",,,,\n"
+    b"CS103.1,Dr. Lee,Room C,None,FRI 13:00-13:50\n"
+)
+
+
+@pytest.fixture
+def scheduler_model():
+    return SchedulerModel(None)
+
+
+@pytest.fixture
+def schedules(scheduler_model):
+    return scheduler_model.import_from_csv(CSV_BYTES)
+
+
+def _as_csv(scheduler_model, schedules):
+    return scheduler_model.export_to_csv(list(schedules))
+
+
+def test_index_csv_spans():
+    spans = index_csv_spans(CSV_BYTES)
+    assert len(spans) == 3
+    assert CSV_BYTES[slice(*spans[0])].startswith(b"CS101.1")
+    assert CSV_BYTES[slice(*spans[2])].startswith(b"CS103.1")
+
+
+def test_index_json_spans_ignores_brackets_in_strings():
+    data = b'[[{"room": "A [1]", "times": []}], [], [{"room": "\\"]"}]]'
+    spans = index_json_spans(data)
+    assert [data[a:b] for a, b in spans] == [
+        b'[{"room": "A [1]", "times": []}]',
+        b"[]",
+        b'[{"room": "\\"]"}]',
+    ]
+
+
+def test_index_json_spans_rejects_unbalanced():
+    with pytest.raises(ValueError):
+        index_json_spans(b"[[{}]")
+
+
+def test_index_ndjson_spans_skips_blank_lines():
+    assert len(index_ndjson_spans(b"[]\n\n[]\n")) == 2
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "ndjson", "sarc"])
+def test_open_lazy_matches_eager_import(scheduler_model, schedules, fmt):
+    exporters = {
+        "csv": scheduler_model.export_to_csv,
+        "json": scheduler_model.export_to_json,
+        "ndjson": scheduler_model.export_to_ndjson,
+        "sarc": scheduler_model.export_to_archive,
+    }
+    lazy = scheduler_model.open_lazy(exporters[fmt](schedules), fmt)
+    assert len(lazy) == len(schedules)
+    assert _as_csv(scheduler_model, lazy) == _as_csv(scheduler_model, schedules)
+
+
+def test_open_lazy_rejects_unknown_format(scheduler_model):
+    with pytest.raises(ValueError):
+        scheduler_model.open_lazy(b"", "xml")
+
+
+def test_schedules_parsed_on_access_only():
+    calls = []
+
+    def loader(i):
+        calls.append(i)
+        return [i]
+
+    lazy = LazyScheduleList(100, loader, cache_size=2)
+    assert calls == []
+    assert lazy[5] == [5]
+    assert lazy[5] == [5]
+    assert calls == [5]
+    assert lazy[-1] == [99]
+    lazy[0]
+    assert lazy.materialized_count() == 2
+    lazy[5]
+    assert calls == [5, 99, 0, 5]
+
+
+def test_index_out_of_range():
+    lazy = LazyScheduleList(2, lambda i: [i])
+    with pytest.raises(IndexError):
+        lazy[2]
+    assert lazy[0:2] == [[0], [1]]
+
+
+def test_append_and_extend_keep_lazy_segments_unparsed():
+    calls = []
+
+    def loader(i):
+        calls.append(i)
+        return ["lazy", i]
+
+    combined = LazyScheduleList()
+    combined.extend([["built", 0]])
+    combined += LazyScheduleList(3, loader)
+    combined.append(["built", 1])
+    assert len(combined) == 5
+    assert calls == []
+    assert combined[0] == ["built", 0]
+    assert combined[2] == ["lazy", 1]
+    assert combined[4] == ["built", 1]
+    assert calls == [1]
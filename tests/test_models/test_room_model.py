@@ -504,3 +504,61 @@ def test_get_affected_faculty(room_model):
 
     assert len(affected) == 1
     assert affected[0].name == "Faculty A"
+
+
+def test_rename_rooms_updates_references(room_model):
+    """
+    Test that a bulk rename can swap names and updates every reference.
+
+    Parameters:
+        room_model (RoomModel): Room model fixture
+    """
+    config = room_model.config_model.config.config
+    before = [list(c.room) for c in config.courses]
+    swap = {"Roddy 136": "Roddy 140", "Roddy 140": "Roddy 136"}
+
+    assert room_model.rename_rooms({**swap, "Roddy 147": "Roddy 247"})
+
+    assert config.rooms == ["Roddy 140", "Roddy 136", "Roddy 247"]
+    rename = {**swap, "Roddy 147": "Roddy 247"}
+    for course, rooms in zip(config.courses, before):
+        assert course.room == [rename.get(r, r) for r in rooms]
+    assert all("Roddy 147" not in f.room_preferences for f in config.faculty)
+    assert room_model.room_exists("Roddy 247")
+    assert not room_model.room_exists("Roddy 147")
+
+
+def test_rename_rooms_all_or_nothing(room_model):
+    """
+    Test that nothing is renamed when one rename is invalid.
+
+    Parameters:
+        room_model (RoomModel): Room model fixture
+    """
+    rooms = list(room_model.get_all_rooms())
+
+    assert not room_model.rename_rooms({"Roddy 136": "New", "Missing": "Other"})
+    assert not room_model.rename_rooms({"Roddy 136": "Roddy 140"})
+    assert not room_model.rename_rooms({"Roddy 136": " "})
+    assert room_model.get_all_rooms() == rooms
+
+
+def test_rename_rooms_only_touches_referencing_entities(room_model):
+    """
+    Test that a bulk rename marks only the referencing entities dirty and
+    leaves the reverse index pointing at the new names.
+
+    Parameters:
+        room_model (RoomModel): Room model fixture
+    """
+    config_model = room_model.config_model
+    referencing = {c.course_id for c in room_model.get_affected_courses("Roddy 147")}
+    config_model.dirty.synced()
+
+    assert room_model.rename_rooms({"Roddy 147": "Roddy 247"})
+
+    assert config_model.dirty.take(["courses"])["courses"] == referencing
+    assert room_model.get_affected_courses("Roddy 147") == []
+    assert {
+        c.course_id for c in room_model.get_affected_courses("Roddy 247")
+    } == referencing
@@ -0,0 +1,82 @@
+# tests/test_models/test_schedule_archive.py
+"""
+Unit tests for the binary schedule archive format.
+
+Tests cover:
+- Round trip through SchedulerModel export/import
+- Random access to single schedules
+- Memory-mapped access from a file on disk
+- Rejection of non-archive data
+"""
+
+import pytest
+
+from models.schedule_archive import ScheduleArchive
+from models.scheduler_model import SchedulerModel
+
+CSV_BYTES = (
+    b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+    b"\n"
+    b"CS102.1,Dr. Jones,Room B,L1,TUE 10:00-11:00,WED 10:00-11:00^\n"
+    b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n"
+)
+
+
+@pytest.fixture
+def scheduler_model():
+    """
+    SchedulerModel without a config; archives do not need one.
+    """
+    return SchedulerModel(None)
+
+
+@pytest.fixture
+def schedules(scheduler_model):
+    return scheduler_model.import_from_csv(CSV_BYTES)
+
+
+def test_archive_round_trip(scheduler_model, schedules):
+    data = scheduler_model.export_to_archive(schedules)
+    restored = scheduler_model.import_from_archive(data)
+    assert scheduler_model.export_to_csv(restored) == scheduler_model.export_to_csv(
+        schedules
+    )
+    assert restored[1][0].time.lab_index == 1
+    assert restored[0][0].lab is None
+
+
+def test_archive_random_access(scheduler_model, schedules):
+    archive = scheduler_model.open_archive(scheduler_model.export_to_archive(schedules))
+    assert len(archive) == 2
+    assert archive[-1][0].course.course_id == "CS102"
+    assert archive.read_records(0) == [
+        ("CS101.01", "Dr. Smith", "Room A", None, None, [(1, 540, 50)])
+    ]
+    with pytest.raises(IndexError):
+        archive[2]
+    archive.close()
+
+
+def test_archive_deduplicates_strings(scheduler_model, schedules):
+    archive = ScheduleArchive(scheduler_model.export_to_archive(schedules))
+    assert sorted(archive._strings).count("Dr. Smith") == 1
+    assert len(archive._slots) == 2
+    archive.close()
+
+
+def test_archive_memory_mapped_file(scheduler_model, schedules, tmp_path):
+    path = tmp_path / "schedules.sarc"
+    path.write_bytes(scheduler_model.export_to_archive(schedules))
+    with scheduler_model.open_archive(str(path)) as archive:
+        assert archive[1][1].faculty == "Dr. Smith"
+
+
+def test_archive_empty(scheduler_model):
+    assert (
+        scheduler_model.import_from_archive(scheduler_model.export_to_archive([])) == []
+    )
+
+
+def test_archive_rejects_other_data(scheduler_model):
+    with pytest.raises(ValueError):
+        scheduler_model.import_from_archive(b"[]")
@@ -469,3 +469,90 @@ def test_import_from_json_valid(scheduler_model):
     assert schedules[0][0].course.course_id == "CS101"
     assert schedules[0][0].room == "Room A"
     assert schedules[0][0].faculty == "Dr. Smith"
+
+
+# ================================================================
+# TESTS: streaming JSON / NDJSON / CSV export
+# ================================================================
+
+
+def _sample_schedules(scheduler_model):
+    csv_bytes = b"CS101.1,Dr. Smith,Room A,None,MON 09:00-09:50\n\nCS102.1,Dr. Jones,Room B,L1,TUE 10:00-11:00,WED 10:00-11:00^\n"
+    return scheduler_model.import_from_csv(csv_bytes)
+
+
+def test_stream_json_matches_full_dump(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    expected = json.dumps(
+        [[ci.model_dump() for ci in s] for s in schedules], indent=2
+    ).encode("utf-8")
+    assert b"".join(scheduler_model.stream_json(schedules)) == expected
+
+
+def test_stream_json_yields_one_chunk_per_schedule(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    chunks = list(scheduler_model.stream_json(iter(schedules)))
+    # one chunk per schedule plus the closing bracket
+    assert len(chunks) == len(schedules) + 1
+
+
+def test_stream_json_empty(scheduler_model):
+    assert scheduler_model.export_to_json([]) == b"[]"
+    assert scheduler_model.export_to_json([], indent=None) == b"[]"
+
+
+def test_export_json_compact_round_trips(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    compact = scheduler_model.export_to_json(schedules, indent=None)
+    assert b"\n" not in compact
+    assert json.loads(compact) == json.loads(scheduler_model.export_to_json(schedules))
+
+
+def test_export_ndjson_one_schedule_per_line(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    lines = scheduler_model.export_to_ndjson(schedules).decode("utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1])[0]["course_str"] == "CS102.01"
+
+
+def test_stream_csv_matches_export(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    streamed = b"".join(scheduler_model.stream_csv(iter(schedules)))
+    assert streamed == scheduler_model.export_to_csv(schedules)
+    assert streamed.count(b"\n\n") == 1
+
+
+# ================================================================
+# TESTS: incremental JSON / NDJSON import
+# ================================================================
+
+
+def test_iter_json_matches_import_from_json(scheduler_model):
+    import io
+
+    schedules = _sample_schedules(scheduler_model)
+    text = scheduler_model.export_to_json(schedules).decode("utf-8")
+    # a tiny chunk size forces schedules to straddle buffer refills
+    streamed = list(scheduler_model.iter_json(io.StringIO(text), chunk_size=7))
+    assert scheduler_model.export_to_csv(streamed) == scheduler_model.export_to_csv(
+        schedules
+    )
+
+
+def test_iter_json_empty_and_invalid(scheduler_model):
+    import io
+
+    assert list(scheduler_model.iter_json(io.StringIO(" [ ] "))) == []
+    with pytest.raises(json.JSONDecodeError):
+        list(scheduler_model.iter_json(io.StringIO("invalid json")))
+    with pytest.raises(json.JSONDecodeError):
+        list(scheduler_model.iter_json(io.StringIO("[[]")))
+
+
+def test_import_ndjson_round_trip(scheduler_model):
+    schedules = _sample_schedules(scheduler_model)
+    restored = scheduler_model.import_from_ndjson(
+        scheduler_model.export_to_ndjson(schedules)
+    )
+    assert len(restored) == 2
+    assert restored[1][0].lab == "L1"
@@ -1,5 +1,6 @@
-import os
 import json
+import os
+
 from safe_save import save_configuration
 
 
@@ -63,3 +64,99 @@ def test_safe_save_temp(tmp_path):
 
     # Check that temp file is deleted
     assert not os.path.exists(temp_file)
+
+
+def _dirty_config_model(tmp_path):
+    import shutil
+
+    from models.config_model import ConfigModel
+
+    config_file = tmp_path / "config.json"
+    shutil.copy("example.json", config_file)
+    return ConfigModel(str(config_file), use_journal=False)
+
+
+def test_dirty_temp_save_matches_full_save(tmp_path):
+    from models.course_model import CourseModel
+    from models.faculty_model import FacultyModel
+    from models.room_model import RoomModel
+
+    config_model = _dirty_config_model(tmp_path)
+    temp_file = config_model.config_path + ".temp"
+
+    RoomModel(config_model).modify_room("Roddy 136", "Roddy 999")
+    assert config_model.save_feature("temp", "all")
+    CourseModel(config_model).delete_course("CMSC 362")
+    FacultyModel(config_model).modify_faculty("Zoppetti", "maximum_credits", 14)
+    assert config_model.save_feature("temp", "all")
+    with open(temp_file) as f:
+        dirty_data = json.load(f)
+
+    os.remove(temp_file)
+    assert save_configuration(
+        config_model.config, config_model.config_path, "temp", "all"
+    )
+    with open(temp_file) as f:
+        full_data = json.load(f)
+
+    assert dirty_data == full_data
+    assert "Roddy 999" in dirty_data["config"]["rooms"]
+
+
+def test_dirty_save_keeps_untouched_faculty_raw(tmp_path):
+    from models.faculty_model import FacultyModel
+
+    config_model = _dirty_config_model(tmp_path)
+    with open(config_model.config_path) as f:
+        raw_faculty = json.load(f)["config"]["faculty"]
+
+    FacultyModel(config_model).modify_faculty("Zoppetti", "maximum_credits", 14)
+    assert config_model.save_feature("temp", "faculty")
+    with open(config_model.config_path + ".temp") as f:
+        saved_faculty = json.load(f)["config"]["faculty"]
+
+    assert saved_faculty[0]["maximum_credits"] == 14
+    assert saved_faculty[1:] == raw_faculty[1:]
+
+
+def test_temp_save_reuses_cached_baseline(tmp_path, monkeypatch):
+    import safe_save
+    from models.room_model import RoomModel
+
+    config_model = _dirty_config_model(tmp_path)
+    rooms = RoomModel(config_model)
+    rooms.add_room("Room A")
+    assert config_model.save_feature("temp", "rooms")
+
+    def fail_load(f):
+        raise AssertionError("baseline should come from the cache")
+
+    monkeypatch.setattr(safe_save.json, "load", fail_load)
+    rooms.add_room("Room B")
+    assert config_model.save_feature("temp", "rooms")
+    monkeypatch.undo()
+
+    with open(config_model.config_path + ".temp") as f:
+        assert json.load(f)["config"]["rooms"][-2:] == ["Room A", "Room B"]
+
+
+def test_external_edit_invalidates_cached_baseline(tmp_path):
+    from models.room_model import RoomModel
+
+    config_model = _dirty_config_model(tmp_path)
+    temp_file = config_model.config_path + ".temp"
+    RoomModel(config_model).add_room("Room A")
+    assert config_model.save_feature("temp", "rooms")
+
+    with open(temp_file) as f:
+        data = json.load(f)
+    data["limit"] = 7
+    with open(temp_file, "w") as f:
+        json.dump(data, f)
+
+    RoomModel(config_model).add_room("Room B")
+    assert config_model.save_feature("temp", "rooms")
+    with open(temp_file) as f:
+        data = json.load(f)
+    assert data["limit"] == 7
+    assert data["config"]["rooms"][-1] == "Room B"
@@ -0,0 +1,76 @@
+import shutil
+
+import pytest
+from scheduler.time_slot_generator import TimeSlotGenerator
+
+from models.config_model import ConfigModel
+from models.course_model import CourseModel
+from slot_table import SlotTable, bits
+
+
+@pytest.fixture
+def config_model(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    return ConfigModel(str(path), use_journal=False)
+
+
+@pytest.fixture
+def table(config_model):
+    return SlotTable(config_model.config.time_slot_config)
+
+
+def test_bits():
+    assert bits(0) == []
+    assert bits(0b101001) == [0, 3, 5]
+
+
+def test_slots_match_generator(config_model, table):
+    generator = TimeSlotGenerator(config_model.config.time_slot_config)
+
+    assert sorted(table.credit_masks) == [3, 4]
+    for credits in (3, 4):
+        assert table.slots_of(table.credit_masks[credits]) == generator.time_slots(
+            credits
+        )
+    assert table.count() == len(table) == table.count(3) + table.count(4)
+    assert table.count(9) == 0
+
+
+def test_masks_match_time_slot_relations(table):
+    for a in range(0, len(table), 5):
+        slot = table.slots[a]
+        assert bits(table.overlaps[a]) == [
+            b for b, other in enumerate(table.slots) if slot.overlaps(other)
+        ]
+        assert bits(table.next_to[a]) == [
+            b for b, other in enumerate(table.slots) if slot.lecture_next_to(other)
+        ]
+        assert not table.disjoint(a, a)
+
+
+def test_pattern_counts(config_model, table):
+    classes = config_model.config.time_slot_config.classes
+    counts = [table.pattern_count(i) for i in range(len(classes))]
+
+    assert all(count == 0 for count, p in zip(counts, classes) if p.disabled)
+    for credits in (3, 4):
+        level = [c for c, p in zip(counts, classes) if p.credits == credits]
+        assert max(level) <= table.count(credits) <= sum(level)
+
+
+def test_config_model_caches_table_per_version(config_model):
+    table = config_model.time_slots()
+    course = config_model.get_all_courses()[0]
+
+    assert CourseModel(config_model).modify_course(course.course_id, credits=3)
+    assert config_model.time_slots() is table
+
+    config_model.config.time_slot_config.classes[0].disabled = True
+    config_model.mark_dirty("time_slot_config")
+    rebuilt = config_model.time_slots()
+    assert rebuilt is not table
+    assert rebuilt.count(3) < table.count(3)
+
+    assert config_model.undo()
+    assert config_model.time_slots().count(3) == table.count(3)
@@ -0,0 +1,67 @@
+"""
+Test the streamed export queue helpers in views/schedule_gui_view.py
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from views import schedule_gui_view
+from views.schedule_gui_view import (
+    _content_disposition,
+    _pending_exports,
+    _queue_export,
+    _take_export,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_exports():
+    _pending_exports.clear()
+    yield
+    _pending_exports.clear()
+
+
+def _export(name="s.csv"):
+    return ("csv", [[]], name, False, None)
+
+
+def test_export_is_taken_once():
+    token = _queue_export(_export(), "a")
+
+    assert _take_export(token) == _export()
+    assert _take_export(token) is None
+
+
+def test_abandoned_exports_expire():
+    with patch.object(schedule_gui_view.time, "monotonic", return_value=0.0):
+        stale = _queue_export(_export(), "a")
+    later = schedule_gui_view.EXPORT_TTL + 1.0
+    with patch.object(schedule_gui_view.time, "monotonic", return_value=later):
+        fresh = _queue_export(_export(), "b")
+        assert stale not in _pending_exports
+        assert _take_export(fresh) == _export()
+
+
+def test_pending_exports_are_capped_per_client():
+    other = _queue_export(_export(), "b")
+    tokens = [
+        _queue_export(_export(), "a")
+        for _ in range(schedule_gui_view.MAX_PENDING_EXPORTS + 2)
+    ]
+
+    assert len(_pending_exports) == schedule_gui_view.MAX_PENDING_EXPORTS + 1
+    assert _take_export(tokens[0]) is None
+    assert _take_export(tokens[-1]) == _export()
+    assert _take_export(other) == _export()
+
+
+def test_content_disposition_escapes_file_name():
+    header = _content_disposition('fall "draft"\\\r\nX-Evil: 1 é.csv')
+
+    assert "\r" not in header and "\n" not in header
+    assert 'filename="fall _draft___' in header
+    assert (
+        "filename*=UTF-8''fall%20%22draft%22%5C%0D%0AX-Evil%3A%201%20%C3%A9.csv"
+        in header
+    )
@@ -0,0 +1,134 @@
+import json
+import shutil
+import threading
+import time
+
+from models.config_model import ConfigModel
+from models.lab_model import LabModel
+from write_behind import WriteBehindSaver
+
+
+class RecordingSave:
+    def __init__(self, results=None):
+        self.calls = []
+        self.results = list(results or [])
+        self.called = threading.Event()
+
+    def __call__(self, feature):
+        self.calls.append(feature)
+        self.called.set()
+        return self.results.pop(0) if self.results else True
+
+
+def test_requests_are_coalesced():
+    save = RecordingSave()
+    saver = WriteBehindSaver(save, interval=60)
+    for _ in range(10):
+        saver.request("faculty")
+    saver.request("rooms")
+    assert save.calls == []
+
+    assert saver.flush()
+    assert save.calls == ["faculty", "rooms"]
+    assert saver.metrics()["requests"] == 11
+    assert saver.metrics()["flushes"] == 1
+    saver.stop()
+
+
+def test_all_absorbs_other_features():
+    save = RecordingSave()
+    saver = WriteBehindSaver(save, interval=60)
+    saver.request("labs")
+    saver.request("all")
+    saver.request("courses")
+    saver.stop()
+    assert save.calls == ["all"]
+
+
+def test_flushes_in_background_after_interval():
+    save = RecordingSave()
+    saver = WriteBehindSaver(save, interval=0.01)
+    saver.request("labs")
+    assert save.called.wait(2)
+    assert save.calls == ["labs"]
+    assert not saver.has_pending()
+    saver.stop()
+
+
+def test_failed_flush_is_queued_again():
+    save = RecordingSave(results=[False])
+    saver = WriteBehindSaver(save, interval=60)
+    saver.request("rooms")
+    assert not saver.flush()
+    assert saver.has_pending()
+    assert saver.flush()
+    assert save.calls == ["rooms", "rooms"]
+    assert saver.metrics()["failures"] == 1
+    saver.stop()
+
+
+def test_metrics_report_latency():
+    def slow_save(feature):
+        time.sleep(0.01)
+        return True
+
+    saver = WriteBehindSaver(slow_save, interval=60)
+    assert saver.metrics()["last_flush_ms"] == 0.0
+    saver.request("rooms")
+    saver.flush()
+    metrics = saver.metrics()
+    assert metrics["last_flush_ms"] >= 10
+    assert metrics["max_delay_ms"] >= metrics["last_flush_ms"]
+    saver.stop()
+
+
+def test_config_model_write_behind(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path))
+    config_model.enable_write_behind(interval=60)
+
+    LabModel(config_model).add_lab("Windows")
+    assert config_model.save_feature("temp", "labs")
+    assert not (tmp_path / "config.json.journal").exists()
+
+    config_model.close()
+    with open(str(path) + ".journal") as f:
+        record = json.loads(f.readline())
+    assert "Windows" in record["changes"][0]["value"]
+
+
+def test_commit_flushes_pending_saves(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path))
+    config_model.enable_write_behind(interval=60)
+
+    LabModel(config_model).add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    assert config_model.save_feature("config", "all")
+    assert config_model.save_metrics()["flushes"] == 1
+    assert not (tmp_path / "config.json.journal").exists()
+    config_model.close()
+
+
+def test_background_save_waits_for_edit_in_progress(tmp_path):
+    path = tmp_path / "config.json"
+    shutil.copy("example.json", path)
+    config_model = ConfigModel(str(path))
+    config_model.enable_write_behind(interval=0.01)
+    labs = LabModel(config_model)
+    journal = tmp_path / "config.json.journal"
+
+    labs.add_lab("Windows")
+    config_model.save_feature("temp", "labs")
+    with config_model.lock:
+        # The saver wakes up mid-edit but must not serialize until it ends
+        time.sleep(0.2)
+        assert not journal.exists()
+        labs.add_lab("Doors")
+    config_model.close()
+
+    with open(journal) as f:
+        record = json.loads(f.readline())
+    assert {"Windows", "Doors"} <= set(record["changes"][0]["value"])
@@ -116,15 +116,13 @@ class ConflictGUIView:
                 )
                 return
 
-            # Build course_map as {label: (global_index, course)} so we can pass
-            # the exact section index to add_conflict, affecting only that section.
-            course_map = {}
-            course_counts = {}
-            for idx, c in enumerate(all_courses):
-                cid = c.course_id
-                course_counts[cid] = course_counts.get(cid, 0) + 1
-                label = f"{cid}.{course_counts[cid]:02d}"
-                course_map[label] = (idx, c)
+            # Build course_map as {label: (section_id, course)} so we can pass
+            # the exact section to add_conflict, affecting only that section.
+            # Stable ids still point at the same sections after other edits.
+            course_map = {
+                label: (section_id, c)
+                for label, section_id, c in controller.get_sections()
+            }
             labels = list(course_map.keys())
 
             course_a = (
@@ -177,8 +175,8 @@ class ConflictGUIView:
             def do_add():
                 label_a = course_a.value
                 label_b = course_b.value
-                idx_a, obj_a = course_map[label_a]
-                idx_b, obj_b = course_map[label_b]
+                section_a, obj_a = course_map[label_a]
+                section_b, obj_b = course_map[label_b]
                 course_id_a = obj_a.course_id
                 course_id_b = obj_b.course_id
                 if label_a == label_b or course_id_a == course_id_b:
@@ -191,7 +189,10 @@ class ConflictGUIView:
                     return
                 try:
                     success, message = controller.add_conflict(
-                        course_id_a, course_id_b, idx_a, idx_b
+                        course_id_a,
+                        course_id_b,
+                        section_id_a=section_a,
+                        section_id_b=section_b,
                     )
                     if success:
                         preview()
@@ -705,6 +706,9 @@ class ConflictGUIView:
                     groups[key] = {"labels": [], "conflicts": resolved_conflicts}
                 groups[key]["labels"].append(course_label_map[id(course)])
 
+            if groups:
+                ConflictGUIView._analysis_card(controller.get_conflict_analysis())
+
             if not groups:
                 ui.label("No conflicts defined.").classes("text-gray-600")
             else:
@@ -729,3 +733,39 @@ class ConflictGUIView:
             ).classes("w-80 h-16 text-xl mt-4 dark:!bg-white dark:!text-black").on(
                 "click", lambda: ui.navigate.to("/conflict")
             )
+
+    @staticmethod
+    def _analysis_card(analysis: dict):
+        """
+        Displays the conflict-graph bounds and the densest clusters.
+
+        Parameters:
+            analysis (dict): Output of ConflictController.get_conflict_analysis()
+        Returns:
+            None
+        """
+        status_colors = {
+            "infeasible": "text-red-600",
+            "fits": "text-green-700",
+            "unknown": "text-gray-500",
+        }
+        with ui.card().classes("w-full max-w-2xl px-5 py-4 !bg-white dark:!bg-white"):
+            ui.label("Conflict Analysis").classes("font-semibold text-base !text-black")
+            ui.label(
+                f"{analysis['components']} groups · at least {analysis['clique']} "
+                f"and at most {analysis['colors']} disjoint time slots needed"
+            ).classes("text-sm !text-black")
+            for reason in analysis["reasons"]:
+                ui.label(reason).classes("text-sm text-red-600")
+            for cluster in analysis["clusters"]:
+                lower, upper = cluster["capacity"]
+                with ui.column().classes("gap-0 ml-2 mt-2"):
+                    ui.label(
+                        f"{len(cluster['sections'])} sections · "
+                        f"{cluster['density']:.0%} dense · "
+                        f"{len(cluster['clique'])} mutually conflicting · "
+                        f"{lower}–{upper} disjoint slots available"
+                    ).classes(f"text-sm {status_colors[cluster['status']]}")
+                    ui.label(", ".join(cluster["clique"])).classes(
+                        "text-xs text-gray-500"
+                    )
@@ -260,7 +260,8 @@ class CourseGUIView:
             )
 
             # Data comes from the controller, not a stored model reference.
-            sections = controller.get_courses_with_sections()
+            # Stable section ids stay valid if other sections are deleted.
+            sections = controller.get_sections()
             if not sections:
                 ui.label("No courses on file.").classes("text-gray-600")
                 ui.button("Back").props(
@@ -270,7 +271,9 @@ class CourseGUIView:
                 )
                 return
 
-            section_map = {label: (idx, course) for label, idx, course in sections}
+            section_map = {
+                label: (section_id, course) for label, section_id, course in sections
+            }
             section_labels = [label for label, _, _ in sections]
             status = ui.label("").classes("text-sm !text-black dark:!text-white")
             save_label = ui.label("").classes("text-lg")
@@ -351,7 +354,7 @@ class CourseGUIView:
                     if not entry:
                         status.set_text("Section not found!")
                         return
-                    section_idx, course = entry
+                    section_id, course = entry
                     cid = course.course_id
                     updates = {}
 
@@ -378,13 +381,13 @@ class CourseGUIView:
                         return
 
                     # Controller handles the modify AND the temp-save.
-                    ok, message = controller.modify_course(cid, section_idx, updates)
+                    ok, message = controller.modify_course(
+                        cid, None, updates, section_id=section_id
+                    )
                     if ok:
+                        # The section is edited in place, so the map stays valid
                         status.set_text(f"'{selected_label.value}' updated.")
                         credits_input.set_value(None)
-                        new_sections = controller.get_courses_with_sections()
-                        section_map.clear()
-                        section_map.update({lbl: (i, c) for lbl, i, c in new_sections})
                         refresh_info()
                     else:
                         status.set_text(f"⚠ {message}")
@@ -427,7 +430,7 @@ class CourseGUIView:
         if GUIView.controller is None:
             return
         controller = GUIView.controller.course_controller
-        existing_courses = controller.get_courses_with_sections()
+        existing_courses = controller.get_sections()
 
         with ui.column().classes("w-full items-center pt-12 pb-12 font-sans gap-6"):
             with ui.row().classes("w-full max-w-2xl justify-start"):
@@ -459,8 +462,8 @@ class CourseGUIView:
             ui.label("").classes("text-lg !text-black dark:!text-white")
 
             section_options = {
-                label: (course.course_id, index)
-                for label, index, course in existing_courses
+                label: (course.course_id, section_id)
+                for label, section_id, course in existing_courses
             }
             selected: dict = {"value": None, "dirty": False}
 
@@ -487,7 +490,7 @@ class CourseGUIView:
                 val = selected["value"]
                 if not isinstance(val, tuple):
                     return
-                course_id, section_index = val
+                course_id, section_id = val
 
                 with ui.dialog() as dialog, ui.card():
                     ui.label(
@@ -505,11 +508,12 @@ class CourseGUIView:
                             """
                             dialog.close()
                             success, message = controller.delete_course(
-                                course_id, section_index
+                                course_id, section_id=section_id
                             )
                             status_label.set_text(message)
                             if success:
-                                updated = controller.get_courses_with_sections()
+                                # Later sections of the course are renumbered
+                                updated = controller.get_sections()
                                 new_options = {
                                     lbl: (c.course_id, i) for lbl, i, c in updated
                                 }
@@ -660,6 +660,12 @@ class FacultyGUIView:
                                 ui.label(f"  {day}: {times_str}").classes(
                                     "!text-black dark:!text-white text-sm"
                                 )
+                            for credits, (fit, total) in sorted(
+                                controller.get_slot_fit(f.name).items()
+                            ):
+                                ui.label(
+                                    f"Fits {fit} of {total} {credits}-credit time slots"
+                                ).classes("!text-black dark:!text-white text-sm")
 
                             ui.label("Add/Update a day:").classes(
                                 "!text-black dark:!text-white mt-2"
@@ -8,6 +8,7 @@ print config, run scheduler, and display schedules)
 """
 
 from typing import Any
+import os
 import re
 from nicegui import ui
 from views.gui_theme import GUITheme
@@ -86,7 +87,7 @@ class GUIView:
                                                 lambda r=route: ui.navigate.to(r),
                                             )
 
-                # Run — 2×3 with Print Config solo at bottom
+                # Run — 2×3 with Print Config solo, then Undo / Redo
                 with ui.column().classes("items-center gap-2"):
                     ui.label("Run").classes(header_classes)
                     with ui.element("table").classes(
@@ -113,7 +114,7 @@ class GUIView:
                                     ui.button("Load Configuration").props(
                                         "rounded no-caps"
                                     ).classes(btn_classes).on(
-                                        "click", lambda: load_dialog.open()
+                                        "click", lambda: open_load_dialog()
                                     )
                                 with ui.element("td"):
                                     ui.button("Export Configuration").props(
@@ -132,6 +133,19 @@ class GUIView:
                                     ).classes(btn_classes).on(
                                         "click", lambda: ui.navigate.to("/print_config")
                                     )
+                            with ui.element("tr"):
+                                with ui.element("td"):
+                                    ui.button("Undo", icon="undo").props(
+                                        "rounded no-caps"
+                                    ).classes(btn_classes).on(
+                                        "click", lambda: GUIView.undo_redo(undo=True)
+                                    )
+                                with ui.element("td"):
+                                    ui.button("Redo", icon="redo").props(
+                                        "rounded no-caps"
+                                    ).classes(btn_classes).on(
+                                        "click", lambda: GUIView.undo_redo(undo=False)
+                                    )
 
         with ui.dialog() as load_dialog:
             with (
@@ -150,110 +164,18 @@ class GUIView:
                          3. React to success or failure.
 
                     All model construction and sub-controller wiring happens
-                    inside Controller.load_config() — never here.
+                    inside Controller.load_config_async() — never here.
                     """
-                    from models.config_model import ConfigModel
-                    from models.faculty_model import FacultyModel
-                    from models.course_model import CourseModel
-                    from models.conflict_model import ConflictModel
-                    from models.lab_model import LabModel
-                    from models.room_model import RoomModel
-                    from models.scheduler_model import SchedulerModel
-                    from controllers.faculty_controller import FacultyController
-                    from controllers.course_controller import CourseController
-                    from controllers.conflict_controller import ConflictController
-                    from controllers.lab_controller import LabController
-                    from controllers.room_controller import RoomController
-                    from controllers.schedule_controller import ScheduleController
-                    from controllers.chatbot_controller import ChatbotController
-                    from views.chatbot_gui_view import ChatbotGUIView
-                    from views.course_gui_view import CourseGUIView
-                    from views.faculty_gui_view import FacultyGUIView
-                    from views.conflict_gui_view import ConflictGUIView
-                    from views.lab_gui_view import LabGUIView
-                    from views.room_gui_view import RoomGUIView
-                    from views.schedule_gui_view import ScheduleGUIView
-                    from views.schedule_gui_view import _state as _schedule_state
-
+                    file_path = e.file.name
                     try:
-                        real_name = e.file.name
-                        file_path = real_name
-
                         with open(file_path, "wb") as f:
                             f.write(await e.file.read())
 
-                        ctrl = GUIView.controller
-                        # Use the GUIView instance as view — works whether or not
-                        # a config was previously loaded
-                        view = ctrl.view if (ctrl and ctrl.view) else GUIView()
-
-                        new_config = ConfigModel(file_path)
-                        new_faculty_model = FacultyModel(new_config)
-                        new_course_model = CourseModel(new_config)
-                        new_conflict_model = ConflictModel(new_config)
-                        new_lab_model = LabModel(new_config)
-                        new_room_model = RoomModel(new_config)
-                        new_scheduler_model = SchedulerModel(new_config)
-
-                        new_faculty_ctrl = FacultyController(new_faculty_model, view)
-                        new_course_ctrl = CourseController(new_course_model, new_config)
-                        new_conflict_ctrl = ConflictController(new_conflict_model, view)
-                        new_lab_ctrl = LabController(new_lab_model, view)
-                        new_room_ctrl = RoomController(new_room_model, view)
-                        new_schedule_ctrl = ScheduleController(
-                            new_scheduler_model, view
-                        )
-                        new_chatbot_ctrl = ChatbotController(
-                            new_lab_model,
-                            new_room_model,
-                            new_course_model,
-                            new_faculty_model,
-                            new_conflict_model,
+                        success, error = await GUIView.controller.load_config_async(
+                            file_path
                         )
-
-                        ctrl.config_model = new_config
-                        ctrl.faculty_model = new_faculty_model
-                        ctrl.course_model = new_course_model
-                        ctrl.conflict_model = new_conflict_model
-                        ctrl.lab_model = new_lab_model
-                        ctrl.room_model = new_room_model
-                        ctrl.scheduler_model = new_scheduler_model
-                        ctrl.faculty_controller = new_faculty_ctrl
-                        ctrl.course_controller = new_course_ctrl
-                        ctrl.conflict_controller = new_conflict_ctrl
-                        ctrl.lab_controller = new_lab_ctrl
-                        ctrl.room_controller = new_room_ctrl
-                        ctrl.schedule_controller = new_schedule_ctrl
-                        ctrl.chatbot_controller = new_chatbot_ctrl
-                        ctrl.view = view
-                        ctrl.config_path = file_path
-
-                        FacultyGUIView.faculty_model = new_faculty_model
-                        FacultyGUIView.faculty_controller = new_faculty_ctrl
-
-                        CourseGUIView.course_model = new_course_model
-                        CourseGUIView.course_controller = new_course_ctrl
-
-                        ConflictGUIView.conflict_model = new_conflict_model
-                        ConflictGUIView.conflict_controller = new_conflict_ctrl
-
-                        LabGUIView.lab_model = new_lab_model
-                        LabGUIView.lab_controller = new_lab_ctrl
-                        LabGUIView._lab_controller = new_lab_ctrl
-
-                        RoomGUIView.room_model = new_room_model
-                        RoomGUIView.room_controller = new_room_ctrl
-
-                        _schedule_state._scheduler_model = new_scheduler_model
-                        ScheduleGUIView.schedule_controller = new_schedule_ctrl
-
-                        ChatbotGUIView._chatbot_controller = new_chatbot_ctrl
-
-                        GUIView.config_path = file_path
-                        GUIView.controller.config_path = file_path
-
-                        GUIView.config_path = file_path
-                        GUIView.controller.config_path = file_path
+                        if not success:
+                            raise ValueError(error)
 
                         status_label.style("color: green !important;")
                         status_label.set_text(f"✓ Loaded: {e.file.name}")
@@ -263,8 +185,6 @@ class GUIView:
                     except Exception as ex:
                         status_label.style("color: red !important;")
                         status_label.set_text(f"Error: {ex}")
-                        import os
-
                         try:
                             os.remove(file_path)
                         except Exception:
@@ -277,10 +197,73 @@ class GUIView:
                     on_upload=handle_upload,
                 ).classes("w-full").style("color: black !important;")
 
+                ui.label("Loaded configurations").style(
+                    "color: black !important; font-weight: 600;"
+                )
+                resident_select = (
+                    ui.select([], label="Switch to")
+                    .classes("w-full")
+                    .style("color: black !important;")
+                )
+                memory_label = ui.label("").style(
+                    "color: gray !important; font-size: 0.8rem;"
+                )
+
+                def switch_resident():
+                    ctrl = GUIView.controller
+                    if ctrl is None or not resident_select.value:
+                        return
+                    ok, message = ctrl.switch_config(resident_select.value)
+                    if ok:
+                        ui.notify("Configuration switched.", type="positive")
+                        load_dialog.close()
+                    else:
+                        ui.notify(message, type="warning")
+
+                ui.button("Switch").props("flat no-caps").style(
+                    "color: black !important;"
+                ).on("click", switch_resident)
+
                 ui.button("Cancel").props("flat no-caps").style(
                     "color: black !important;"
                 ).on("click", load_dialog.close)
 
+        def open_load_dialog():
+            """
+            Refreshes the list of resident configurations, then opens the dialog.
+            """
+            ctrl = GUIView.controller
+            report = ctrl.get_memory_report() if ctrl else []
+            resident_select.set_options(
+                {
+                    entry["path"]: os.path.basename(entry["path"])
+                    + (" (active)" if entry["active"] else "")
+                    for entry in report
+                }
+            )
+            resident_select.value = None
+            kib = sum(e["bytes"] + e["history_bytes"] for e in report) // 1024
+            shared_kib = max((e["shared_bytes"] for e in report), default=0) // 1024
+            memory_label.set_text(
+                f"{len(report)} in memory, about {kib} KiB "
+                f"(+{shared_kib} KiB shared names)"
+            )
+            load_dialog.open()
+
+    @staticmethod
+    def undo_redo(undo: bool):
+        """
+        Asks the Controller to undo or redo the last edit and reports the result.
+        """
+        if GUIView.controller is None:
+            ui.notify("No configuration loaded.", type="warning")
+            return
+        if undo:
+            ok, message = GUIView.controller.undo()
+        else:
+            ok, message = GUIView.controller.redo()
+        ui.notify(message, type="positive" if ok else "warning")
+
     @staticmethod
     def export_configuration():
         """
@@ -454,6 +437,18 @@ class GUIView:
                                     "!text-black dark:!text-white"
                                 )
 
+            ok, changes = ctrl.get_pending_changes()
+            with ui.expansion(
+                f"Unsaved Changes ({len(changes)})" if ok else "Unsaved Changes",
+                icon="pending_actions",
+            ).classes("w-3/4 !text-black dark:!text-white print-config-expansion"):
+                if ok and not changes:
+                    ui.label("Everything is saved.").classes(
+                        "italic !text-gray-500 dark:!text-gray-400"
+                    )
+                for line in changes:
+                    ui.label(line).classes("!text-black dark:!text-white")
+
             ui.button("Back").props(
                 "rounded color=black text-color=white no-caps"
             ).classes("w-80 h-16 text-xl dark:!bg-white dark:!text-black").on(
@@ -485,6 +480,10 @@ class GUIView:
         ui.label("Time Slot Config").classes(
             "text-4xl mb-6 !text-black dark:!text-white text-center w-full"
         )
+        slot_summary = ui.label("").classes(
+            "text-lg mb-4 !text-black dark:!text-white text-center w-full"
+        )
+        pattern_slot_labels = {}
         days_container = ui.column().classes("w-full gap-4")
         patterns_container = ui.column().classes("w-full gap-4")
 
@@ -560,6 +559,29 @@ class GUIView:
                 "!text-black dark:!text-white mb-2 outline-checkbox"
             )
 
+        # -----------------------------
+        # Candidate slot preview
+        # -----------------------------
+        def refresh_slot_counts():
+            table = cm.time_slots()
+            levels = ", ".join(
+                f"{credits}-credit: {table.count(credits)}"
+                for credits in table.credit_masks
+            )
+            slot_summary.set_text(
+                f"{len(table)} candidate slots ({levels})"
+                if levels
+                else "No candidate slots"
+            )
+            for idx, label in pattern_slot_labels.items():
+                if idx < len(time_config.get_classes()):
+                    label.set_text(f"{table.pattern_count(idx)} candidate slots")
+
+        def time_config_changed():
+            """Record an edit so the candidate slots are regenerated."""
+            cm.mark_dirty("time_slot_config")
+            refresh_slot_counts()
+
         # -----------------------------
         # Refresh functions
         # -----------------------------
@@ -658,6 +680,7 @@ class GUIView:
                         "click", add_class_pattern
                     )
 
+                    pattern_slot_labels.clear()
                     classes = time_config.get_classes()
                     if not classes:
                         ui.label("No class patterns available").classes(
@@ -672,6 +695,10 @@ class GUIView:
                             with ui.card().classes(
                                 "w-full p-4 bg-gray-100 dark:bg-gray-800"
                             ):
+                                pattern_slot_labels[idx - 1] = ui.label(
+                                    f"{cm.time_slots().pattern_count(idx - 1)} candidate slots"
+                                ).classes("text-sm !text-black dark:!text-white")
+
                                 # Editable pattern fields
                                 credits_input = number_input("Credits", cls.credits)
                                 disabled_input = checkbox("Disabled", cls.disabled)
@@ -860,6 +887,7 @@ class GUIView:
                 return
 
             dialog.close()
+            time_config_changed()
             refresh_patterns()
 
         # -----------------------------
@@ -959,6 +987,7 @@ class GUIView:
 
             # Only close dialog if everything is valid
             dialog.close()
+            time_config_changed()
             render_day_blocks(day_val)
 
         def save_time_block(day, idx, s_input, e_input, sp_input):
@@ -994,16 +1023,19 @@ class GUIView:
                 ui.notify(f"Error saving time block: {ex}", color="red")
                 return
 
+            time_config_changed()
             render_day_blocks(day)
 
         def delete_time_block(day, idx):
             time_config.remove_time_block(day, idx)
+            time_config_changed()
             render_day_blocks(day)
 
         def save_class_pattern(cls, cr_input, dis_input, st_input):
             cls.credits = cr_input.value
             cls.disabled = dis_input.value
             cls.start_time = st_input.value or None
+            time_config_changed()
             refresh_patterns()
 
         def add_meeting(cls):
@@ -1048,14 +1080,17 @@ class GUIView:
                 ),
             )
             dialog.close()
+            time_config_changed()
             refresh_patterns()
 
         def delete_class_pattern(idx):
             time_config.remove_class(idx)
+            time_config_changed()
             refresh_patterns()
 
         def delete_meeting(cls, idx):
             time_config.remove_meeting(cls, idx)
+            time_config_changed()
             refresh_patterns()
 
         def save_meeting(cls, idx, day_input, start_input, dur_input, lab_input):
@@ -1065,6 +1100,7 @@ class GUIView:
                 meeting.start_time = start_input.value
                 meeting.duration = dur_input.value
                 meeting.lab = lab_input.value
+                time_config_changed()
                 refresh_patterns()
             except Exception as ex:
                 ui.notify(f"Error saving meeting: {ex}", color="red")
@@ -1074,6 +1110,7 @@ class GUIView:
         # -----------------------------
         refresh_days()
         refresh_patterns()
+        refresh_slot_counts()
 
         ui.button("Back").props(
             "rounded color=backbtn text-color=white no-caps"
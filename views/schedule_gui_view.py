@@ -13,14 +13,20 @@ Sprint 3 additions:
 """
 
 import asyncio
+import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
+from urllib.parse import quote
 import threading as _threading
 
 
-from nicegui import ui
+from fastapi.responses import StreamingResponse
+from nicegui import app, ui
 from scheduler import OptimizerFlags
 
+from controllers.schedule_controller import PARSE_ERRORS, is_archive
 from scheduler_facade import SchedulerFacade
 from views.gui_theme import GUITheme
 from views.gui_utils import require_config
@@ -48,6 +54,109 @@ class _ScheduleState:
 
 _state = _ScheduleState()
 
+# Pending streamed downloads: token -> (queued at, client id, (format,
+# schedules, filename, compact, compression)). Downloads the browser never
+# starts are dropped after EXPORT_TTL seconds, and each client keeps at most
+# MAX_PENDING_EXPORTS.
+_pending_exports: dict[
+    str, tuple[float, str, tuple[str, list, str, bool, str | None]]
+] = {}
+EXPORT_TTL = 300
+MAX_PENDING_EXPORTS = 8
+
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+    "sarc": "application/octet-stream",
+}
+
+_COMPRESSION_MEDIA_TYPES = {
+    ".gz": "application/gzip",
+    ".xz": "application/x-xz",
+    ".bz2": "application/x-bzip2",
+}
+
+
+def _queue_export(
+    export: tuple[str, list, str, bool, str | None], client_id: str
+) -> str:
+    """
+    Queue an export for _stream_export() and return its download token.
+
+    Expired exports are dropped first, then the client's oldest ones beyond
+    MAX_PENDING_EXPORTS, so abandoned downloads do not keep their
+    schedules in memory and one session never evicts another's downloads.
+    """
+    now = time.monotonic()
+    for token, (queued, _, _) in list(_pending_exports.items()):
+        if now - queued > EXPORT_TTL:
+            del _pending_exports[token]
+    queued_by_client = [
+        token for token, (_, owner, _) in _pending_exports.items() if owner == client_id
+    ]
+    excess = len(queued_by_client) - MAX_PENDING_EXPORTS + 1
+    for token in queued_by_client[: max(excess, 0)]:
+        del _pending_exports[token]
+    token = uuid.uuid4().hex
+    _pending_exports[token] = (now, client_id, export)
+    return token
+
+
+def _take_export(token: str) -> tuple[str, list, str, bool, str | None] | None:
+    """
+    Remove and return a queued export, or None if it is unknown or expired.
+    """
+    pending = _pending_exports.pop(token, None)
+    if pending is None or time.monotonic() - pending[0] > EXPORT_TTL:
+        return None
+    return pending[2]
+
+
+def _content_disposition(filename: str) -> str:
+    """
+    Build an attachment header for a user-chosen file name.
+
+    The quoted name is an ASCII fallback without quotes or backslashes; the
+    exact name is sent percent-encoded as filename* (RFC 5987).
+    """
+    fallback = "".join(
+        c if c.isascii() and c.isprintable() and c not in '"\\' else "_"
+        for c in filename
+    )
+    return (
+        f'attachment; filename="{fallback}"; '
+        f"filename*=UTF-8''{quote(filename, safe='')}"
+    )
+
+
+@app.get("/schedule_export/{token}")
+def _stream_export(token: str):
+    """
+    Serve a queued schedule export as a chunked streaming response.
+
+    Each schedule is serialized only when the browser pulls the next chunk,
+    so exporting thousands of schedules never builds the whole file in memory.
+    """
+    from views.gui_view import GUIView
+
+    pending = _take_export(token)
+    if pending is None or GUIView.controller is None:
+        return StreamingResponse(iter([b""]), status_code=404)
+    format_type, schedules, filename, compact, compression = pending
+    chunks = GUIView.controller.schedule_controller.stream_schedules(
+        format_type, schedules, compact, compression
+    )
+    media_type = _COMPRESSION_MEDIA_TYPES.get(
+        compression, _EXPORT_MEDIA_TYPES.get(format_type, "application/octet-stream")
+    )
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": _content_disposition(filename)},
+    )
+
+
 # ---------------------------------------------------------------------------
 # Pure helper functions (no model/controller dependencies)
 # ---------------------------------------------------------------------------
@@ -749,30 +858,107 @@ class ScheduleGUIView:
             if controller is None:
                 ui.notify("Controller not initialized", type="negative")
                 return
-            try:
-                content = await e.file.read()
-                schedules = controller.import_schedule_file(e.file.name, content)
-                if schedules:
-                    _state.schedules += schedules
+            files = [(f.name, await f.read()) for f in e.files]
+            loop = asyncio.get_running_loop()
+
+            def on_progress(name, done, total, message):
+                loop.call_soon_threadsafe(
+                    upload_status.set_text, f"{done}/{total} — {name}: {message}"
+                )
+
+            async def index_lazily(lazy_files) -> bool:
+                """Index files so each schedule is parsed only when viewed."""
+                try:
+                    for name, data in lazy_files:
+                        schedules = await loop.run_in_executor(
+                            None,
+                            partial(
+                                controller.import_schedule_file, name, data, lazy=True
+                            ),
+                        )
+                        _state.schedules = controller.merge_schedules(
+                            _state.schedules, schedules
+                        )
+                except PARSE_ERRORS as ex:
+                    ui.notify(f"Import failed: {ex}", type="negative")
+                    return False
+                return True
+
+            if lazy_checkbox.value:
+                # Index boundaries only; schedules are parsed when viewed
+                if not await index_lazily(files):
+                    return
+                if _state.schedules:
                     _state.current_index = 0
-                    ui.notify(f"Imported {e.file.name}")
+                    ui.notify(f"Indexed {len(_state.schedules)} schedule(s)")
                     ui.navigate.to("/display_schedules")
                 else:
-                    ui.notify(f"No schedules found in {e.file.name}", type="warning")
-            except Exception as ex:
+                    ui.notify("No schedules found", type="warning")
+                return
+
+            # Archives are random access already: keep them open and decode
+            # each schedule when it is viewed instead of parsing them all
+            archives = [(name, data) for name, data in files if is_archive(name)]
+            files = [(name, data) for name, data in files if not is_archive(name)]
+            if archives:
+                before = len(_state.schedules)
+                if not await index_lazily(archives):
+                    return
+                ui.notify(
+                    f"Opened {len(_state.schedules) - before} schedule(s) "
+                    f"from {len(archives)} archive(s)"
+                )
+                if not files:
+                    if _state.schedules:
+                        _state.current_index = 0
+                        ui.navigate.to("/display_schedules")
+                    return
+
+            # The worker must not touch the live list or its parse cache
+            existing = controller.dedup_snapshot(_state.schedules)
+            try:
+                schedules, report = await loop.run_in_executor(
+                    None,
+                    lambda: controller.import_schedule_files(
+                        files, existing=existing, progress_callback=on_progress
+                    ),
+                )
+            except PARSE_ERRORS as ex:
                 ui.notify(f"Import failed: {ex}", type="negative")
+                return
+            for entry in report:
+                if entry["error"]:
+                    ui.notify(
+                        f"Import failed for {entry['file']}: {entry['error']}",
+                        type="negative",
+                    )
+            duplicates = sum(entry["duplicates"] for entry in report)
+            if schedules:
+                _state.schedules += schedules
+                _state.current_index = 0
+                ui.notify(
+                    f"Imported {len(schedules)} schedule(s) from {len(files)} file(s)"
+                    + (f", skipped {duplicates} duplicate(s)" if duplicates else "")
+                )
+                ui.navigate.to("/display_schedules")
+            elif not any(entry["error"] for entry in report):
+                ui.notify("No new schedules found", type="warning")
 
         with ui.dialog() as upload_dialog:
             with ui.card():
                 ui.label("Import Schedule")
                 ui.upload(
-                    label="Select schedule file",
+                    label="Select schedule files",
                     multiple=True,
                     auto_upload=True,
-                    on_upload=handle_upload,
+                    on_multi_upload=handle_upload,
                 ).classes("w-full text-black").style(
                     "color: black !important; background-color: white;"
                 )
+                lazy_checkbox = ui.checkbox(
+                    "Load lazily (large files, no duplicate check)", value=False
+                )
+                upload_status = ui.label("").classes("text-sm text-gray-600")
                 ui.button("Close", on_click=upload_dialog.close).style(
                     "color: black !important;"
                 )
@@ -804,8 +990,16 @@ class ScheduleGUIView:
                     label="File name", value=default_name
                 ).classes("w-full")
                 format_select = ui.select(
-                    options=["csv", "json"], value="csv", label="Export format"
+                    options=["csv", "json", "ndjson", "sarc"],
+                    value="csv",
+                    label="Export format",
                 ).classes("w-full")
+                compression_select = ui.select(
+                    options={"": "None", ".gz": "gzip", ".xz": "xz", ".bz2": "bzip2"},
+                    value="",
+                    label="Compression",
+                ).classes("w-full")
+                compact_checkbox = ui.checkbox("Compact JSON (no indentation)")
 
                 def do_export():
                     if not schedule_select.value:
@@ -819,10 +1013,19 @@ class ScheduleGUIView:
                     filename = filename_input.value.strip() or "schedules"
                     if GUIView.controller is None:
                         return
-                    data = GUIView.controller.schedule_controller.export_schedules(
-                        format_select.value, schedules_to_export
+                    compression = compression_select.value or None
+                    full_name = f"{filename}.{format_select.value}{compression or ''}"
+                    token = _queue_export(
+                        (
+                            format_select.value,
+                            schedules_to_export,
+                            full_name,
+                            bool(compact_checkbox.value),
+                            compression,
+                        ),
+                        ui.context.client.id,
                     )
-                    ui.download(data, filename=f"{filename}.{format_select.value}")
+                    ui.download(f"/schedule_export/{token}", filename=full_name)
                     export_dialog.close()
 
                 with ui.row().classes("w-full justify-end gap-3 pt-2"):
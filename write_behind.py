@@ -0,0 +1,180 @@
+# Filename: write_behind.py
+# Description: Debounced, coalescing background saver for GUI temp saves
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+
+# Seconds of quiet after the last request before pending saves are flushed
+DEFAULT_INTERVAL = 0.5
+
+# A burst of edits is flushed at most this many intervals after it started
+MAX_DELAY_INTERVALS = 4
+
+# Number of recent flushes kept for latency statistics
+METRICS_WINDOW = 256
+
+
+class WriteBehindSaver:
+    """
+    Collects temp-save requests and writes them on a background thread.
+
+    Requests for the same feature are coalesced, and a request for 'all'
+    absorbs every other pending feature. A flush happens once no request
+    has arrived for `interval` seconds, or `interval * MAX_DELAY_INTERVALS`
+    seconds after the first unflushed request, whichever comes first.
+    Failed flushes are queued again.
+
+    Attributes:
+        interval (float): Debounce interval in seconds
+    """
+
+    def __init__(
+        self, save_fn: Callable[[str], bool], interval: float = DEFAULT_INTERVAL
+    ):
+        """
+        Parameters:
+            save_fn (Callable[[str], bool]): Performs the save for one feature
+            interval (float): Debounce interval in seconds
+        """
+        self.interval = interval
+        self._save_fn = save_fn
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._first_request: float | None = None
+        self._last_request = 0.0
+        self._stopped = False
+
+        self._requests = 0
+        self._flushes = 0
+        self._failures = 0
+        self._latencies: deque[float] = deque(maxlen=METRICS_WINDOW)
+        self._delays: deque[float] = deque(maxlen=METRICS_WINDOW)
+
+        self._thread = threading.Thread(
+            target=self._run, name="write-behind-saver", daemon=True
+        )
+        self._thread.start()
+
+    def request(self, feature: str) -> None:
+        """
+        Queue a temp save for a feature without blocking.
+
+        Parameters:
+            feature (str): Feature section to save (e.g. 'faculty', 'all')
+        """
+        with self._cond:
+            now = time.monotonic()
+            self._requests += 1
+            self._pending.add(feature)
+            if self._first_request is None:
+                self._first_request = now
+            self._last_request = now
+            self._cond.notify()
+
+    def has_pending(self) -> bool:
+        """
+        Return True if saves are queued but not yet written.
+        """
+        with self._cond:
+            return bool(self._pending)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                while self._pending and not self._stopped:
+                    now = time.monotonic()
+                    quiet_at = self._last_request + self.interval
+                    deadline = self._first_request + self.interval * MAX_DELAY_INTERVALS
+                    wait = min(quiet_at, deadline) - now
+                    if wait <= 0:
+                        break
+                    self._cond.wait(wait)
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write all pending saves now, on the calling thread.
+
+        Returns:
+            bool: True if every pending save succeeded
+        """
+        with self._flush_lock:
+            with self._cond:
+                features = self._pending
+                first_request = self._first_request
+                self._pending = set()
+                self._first_request = None
+            if not features:
+                return True
+            if "all" in features:
+                features = {"all"}
+
+            start = time.monotonic()
+            failed = [f for f in sorted(features) if not self._save_fn(f)]
+            end = time.monotonic()
+
+            with self._cond:
+                self._flushes += 1
+                self._latencies.append(end - start)
+                self._delays.append(end - first_request)
+                if failed:
+                    self._failures += 1
+                    self._pending.update(failed)
+                    if self._first_request is None:
+                        self._first_request = end
+                    self._last_request = end
+                    self._cond.notify()
+            return not failed
+
+    def stop(self) -> bool:
+        """
+        Flush pending saves and stop the background thread.
+
+        Returns:
+            bool: True if the final flush succeeded
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self._thread.join()
+        return self.flush()
+
+    def metrics(self) -> dict:
+        """
+        Return save statistics.
+
+        Returns:
+            dict: 'requests', 'flushes' and 'failures' counts, 'pending'
+                features, and over recent flushes the flush latency
+                ('last_flush_ms', 'avg_flush_ms', 'max_flush_ms') plus the
+                time from the first queued request to the end of its flush
+                ('avg_delay_ms', 'max_delay_ms'), all in milliseconds
+        """
+        with self._cond:
+            latencies = list(self._latencies)
+            delays = list(self._delays)
+            metrics = {
+                "requests": self._requests,
+                "flushes": self._flushes,
+                "failures": self._failures,
+                "pending": sorted(self._pending),
+            }
+
+        def ms(value: float) -> float:
+            return round(value * 1000, 3)
+
+        metrics["last_flush_ms"] = ms(latencies[-1]) if latencies else 0.0
+        metrics["avg_flush_ms"] = (
+            ms(sum(latencies) / len(latencies)) if latencies else 0.0
+        )
+        metrics["max_flush_ms"] = ms(max(latencies)) if latencies else 0.0
+        metrics["avg_delay_ms"] = ms(sum(delays) / len(delays)) if delays else 0.0
+        metrics["max_delay_ms"] = ms(max(delays)) if delays else 0.0
+        return metrics